@@ -269,7 +269,7 @@ async def get_processing_info(
             region=processing_info.region,
             data_residency=processing_info.data_residency.value,
             is_gdpr_compliant=processing_info.is_gdpr_compliant,
-            legal_basis=processing_info.legal_basis,
+            legal_basis=processing_info.legal_basis.value,
             data_retention_days=processing_info.data_retention_days,
             processor_name=processing_info.processor_name,
             processor_location=processing_info.processor_location,
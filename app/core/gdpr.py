@@ -10,6 +10,7 @@ Version: 0.6.1 (GDPR-001)
 from enum import Enum
 from typing import Optional
 from dataclasses import dataclass
+from functools import cached_property
 import logging
 
 logger = logging.getLogger(__name__)
@@ -43,7 +44,7 @@ class LegalBasis(Enum):
     LEGITIMATE_INTERESTS = "legitimate_interests"  # Article 6(1)(f)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DataProcessingInfo:
     """
     Data Processing Information for GDPR transparency.
@@ -56,20 +57,33 @@ class DataProcessingInfo:
     region: str
     data_residency: DataResidency
     is_gdpr_compliant: bool
-    legal_basis: str
+    legal_basis: LegalBasis
     data_retention_days: int
     processor_name: str
     processor_location: str
-    sub_processors: list[str]
-    security_measures: list[str]
-    data_subject_rights: list[str]
+    sub_processors: tuple[str, ...]
+    security_measures: tuple[str, ...]
+    data_subject_rights: tuple[str, ...]
+
+    @cached_property
+    def security_text_lc(self) -> str:
+        """Security measures joined and lowercased, for keyword scans."""
+        return " ".join(self.security_measures).lower()
+
+    @cached_property
+    def rights_text_lc(self) -> str:
+        """Data subject rights joined and lowercased, for keyword scans."""
+        return " ".join(self.data_subject_rights).lower()
 
 
 class GDPRComplianceChecker:
     """Check and enforce GDPR compliance for AI requests."""
 
-    # EU-compliant providers (data processed in EU)
-    EU_COMPLIANT_PROVIDERS = ["vertex_claude", "vertex_gemini", "scaleway"]
+    # EU-compliant providers (data processed in EU), in preference order
+    EU_COMPLIANT_PROVIDERS = ("vertex_claude", "vertex_gemini", "scaleway")
+
+    # Hash-based lookup for compliance checks on the request path
+    _EU_COMPLIANT_SET = frozenset(EU_COMPLIANT_PROVIDERS)
 
     # Provider metadata for GDPR transparency
     PROVIDER_METADATA = {
@@ -77,102 +91,108 @@ class GDPRComplianceChecker:
             "region": "us-east-1",
             "data_residency": DataResidency.US,
             "is_gdpr_compliant": False,
-            "legal_basis": LegalBasis.CONTRACT.value,
+            "legal_basis": LegalBasis.CONTRACT,
             "data_retention_days": 30,
             "processor_name": "Anthropic PBC",
             "processor_location": "United States",
-            "sub_processors": ["Amazon Web Services (AWS US)"],
-            "security_measures": [
+            "sub_processors": ("Amazon Web Services (AWS US)",),
+            "security_measures": (
                 "TLS 1.3 encryption in transit",
                 "AES-256 encryption at rest",
                 "SOC 2 Type II certified",
                 "Data deletion after 30 days",
-            ],
-            "data_subject_rights": [
+            ),
+            "data_subject_rights": (
                 "Right to access",
                 "Right to deletion",
                 "Right to rectification",
-            ],
+            ),
         },
         "scaleway": {
             "region": GDPRRegion.FR_PAR.value,
             "data_residency": DataResidency.EU,
             "is_gdpr_compliant": True,
-            "legal_basis": LegalBasis.CONTRACT.value,
+            "legal_basis": LegalBasis.CONTRACT,
             "data_retention_days": 0,
             "processor_name": "Scaleway SAS",
             "processor_location": "France (Paris)",
-            "sub_processors": ["Scaleway Cloud Infrastructure (FR-PAR)"],
-            "security_measures": [
+            "sub_processors": ("Scaleway Cloud Infrastructure (FR-PAR)",),
+            "security_measures": (
                 "TLS 1.3 encryption in transit",
                 "AES-256 encryption at rest",
                 "ISO 27001 certified",
                 "Data stored in France",
                 "No data retention policy",
-            ],
-            "data_subject_rights": [
+            ),
+            "data_subject_rights": (
                 "Right to access",
                 "Right to deletion",
                 "Right to rectification",
                 "Right to data portability",
                 "Right to object",
-            ],
+            ),
         },
         "vertex_claude": {
             "region": GDPRRegion.EUROPE_WEST3.value,
             "data_residency": DataResidency.EU,
             "is_gdpr_compliant": True,
-            "legal_basis": LegalBasis.CONTRACT.value,
+            "legal_basis": LegalBasis.CONTRACT,
             "data_retention_days": 0,
             "processor_name": "Google Cloud Platform",
             "processor_location": "Germany (Frankfurt)",
-            "sub_processors": [
+            "sub_processors": (
                 "Google Cloud Platform (europe-west3)",
                 "Anthropic PBC (model inference only)",
-            ],
-            "security_measures": [
+            ),
+            "security_measures": (
                 "TLS 1.3 encryption in transit",
                 "AES-256 encryption at rest",
                 "ISO 27001, ISO 27017, ISO 27018 certified",
                 "Data stored in Germany (Frankfurt)",
                 "No data retention by Google or Anthropic",
-            ],
-            "data_subject_rights": [
+            ),
+            "data_subject_rights": (
                 "Right to access",
                 "Right to deletion",
                 "Right to rectification",
                 "Right to data portability",
                 "Right to object",
                 "Right to restrict processing",
-            ],
+            ),
         },
         "vertex_gemini": {
             "region": GDPRRegion.EUROPE_WEST3.value,
             "data_residency": DataResidency.EU,
             "is_gdpr_compliant": True,
-            "legal_basis": LegalBasis.CONTRACT.value,
+            "legal_basis": LegalBasis.CONTRACT,
             "data_retention_days": 0,
             "processor_name": "Google Cloud Platform",
             "processor_location": "Germany (Frankfurt)",
-            "sub_processors": ["Google Cloud Platform (europe-west3)"],
-            "security_measures": [
+            "sub_processors": ("Google Cloud Platform (europe-west3)",),
+            "security_measures": (
                 "TLS 1.3 encryption in transit",
                 "AES-256 encryption at rest",
                 "ISO 27001, ISO 27017, ISO 27018 certified",
                 "Data stored in Germany (Frankfurt)",
                 "No data retention by Google",
-            ],
-            "data_subject_rights": [
+            ),
+            "data_subject_rights": (
                 "Right to access",
                 "Right to deletion",
                 "Right to rectification",
                 "Right to data portability",
                 "Right to object",
                 "Right to restrict processing",
-            ],
+            ),
         },
     }
 
+    # Shared immutable DataProcessingInfo per provider, built once at import
+    _INFO_REGISTRY = {
+        provider: DataProcessingInfo(provider=provider, **metadata)
+        for provider, metadata in PROVIDER_METADATA.items()
+    }
+
     @classmethod
     def is_provider_gdpr_compliant(cls, provider: str) -> bool:
         """
@@ -184,17 +204,17 @@ class GDPRComplianceChecker:
         Returns:
             True if provider processes data in EU, False otherwise
         """
-        return provider in cls.EU_COMPLIANT_PROVIDERS
+        return provider in cls._EU_COMPLIANT_SET
 
     @classmethod
-    def get_compliant_providers(cls) -> list[str]:
+    def get_compliant_providers(cls) -> tuple[str, ...]:
         """
-        Get list of GDPR-compliant providers.
+        Get GDPR-compliant providers.
 
         Returns:
-            List of EU-compliant provider names
+            Immutable tuple of EU-compliant provider names, in preference order
         """
-        return cls.EU_COMPLIANT_PROVIDERS.copy()
+        return cls.EU_COMPLIANT_PROVIDERS
 
     @classmethod
     def validate_request(
@@ -212,7 +232,7 @@ class GDPRComplianceChecker:
             - (True, "OK") if valid
             - (False, error_message) if invalid
         """
-        if eu_only and provider not in cls.EU_COMPLIANT_PROVIDERS:
+        if eu_only and provider not in cls._EU_COMPLIANT_SET:
             return (
                 False,
                 f"Provider '{provider}' is not EU-compliant. "
@@ -232,32 +252,18 @@ class GDPRComplianceChecker:
             provider: Provider name
 
         Returns:
-            DataProcessingInfo object with complete processing details
+            Shared, immutable DataProcessingInfo with complete processing details
 
         Raises:
             ValueError: If provider is not recognized
         """
-        if provider not in cls.PROVIDER_METADATA:
+        try:
+            return cls._INFO_REGISTRY[provider]
+        except KeyError:
             raise ValueError(
                 f"Unknown provider '{provider}'. "
                 f"Available: {list(cls.PROVIDER_METADATA.keys())}"
-            )
-
-        metadata = cls.PROVIDER_METADATA[provider]
-
-        return DataProcessingInfo(
-            provider=provider,
-            region=metadata["region"],
-            data_residency=metadata["data_residency"],
-            is_gdpr_compliant=metadata["is_gdpr_compliant"],
-            legal_basis=metadata["legal_basis"],
-            data_retention_days=metadata["data_retention_days"],
-            processor_name=metadata["processor_name"],
-            processor_location=metadata["processor_location"],
-            sub_processors=metadata["sub_processors"],
-            security_measures=metadata["security_measures"],
-            data_subject_rights=metadata["data_subject_rights"],
-        )
+            ) from None
 
     @classmethod
     def get_fallback_provider(
@@ -276,7 +282,7 @@ class GDPRComplianceChecker:
         if not eu_only:
             return None
 
-        if requested_provider in cls.EU_COMPLIANT_PROVIDERS:
+        if requested_provider in cls._EU_COMPLIANT_SET:
             return None
 
         # Fallback order: Vertex Claude > Scaleway > Vertex Gemini
@@ -352,7 +358,7 @@ class GDPRComplianceChecker:
         fallback_applied = False
 
         # Check if requested provider is GDPR compliant
-        if eu_only and requested_provider not in cls.EU_COMPLIANT_PROVIDERS:
+        if eu_only and requested_provider not in cls._EU_COMPLIANT_SET:
             # Apply fallback to EU-compliant provider
             fallback_provider = cls.get_fallback_provider(requested_provider, eu_only)
 
@@ -15,7 +15,9 @@ import logging
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache, lru_cache
 from pathlib import Path
+from string import Formatter
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -41,6 +43,23 @@ class Language(Enum):
 # Default language
 DEFAULT_LANGUAGE = Language.EN
 
+# Supported base language codes, e.g. "de" -> Language.DE
+_LANGUAGE_BY_CODE = {lang.value: lang for lang in Language}
+
+# One comma-separated Accept-Language entry (matched with fullmatch):
+# base code, optional subtags, then any ";param" segments
+_ACCEPT_LANGUAGE_ENTRY_RE = re.compile(
+    r"([A-Za-z]+)(?:-[A-Za-z0-9]+)*\s*((?:;[^;]*)*)"
+)
+# Quality value inside an entry's parameters, e.g. "; q=0.8"
+_ACCEPT_LANGUAGE_Q_RE = re.compile(r";\s*q\s*=\s*([^;\s]*)")
+
+
+@lru_cache(maxsize=32)
+def _as_language(value: str) -> Language:
+    """Cached Language.from_string for string language arguments."""
+    return Language.from_string(value)
+
 
 @dataclass
 class TranslationConfig:
@@ -251,6 +270,36 @@ TRANSLATIONS: dict[Language, dict[str, str]] = {
 }
 
 
+# Flat (key, language) -> message view of TRANSLATIONS, built once at import
+_FLAT_TRANSLATIONS: dict[tuple[str, Language], str] = {
+    (key, lang): text
+    for lang, messages in TRANSLATIONS.items()
+    for key, text in messages.items()
+}
+_TRANSLATION_KEYS = frozenset(key for key, _ in _FLAT_TRANSLATIONS)
+
+_CONVERSIONS = {"s": str, "r": repr, "a": ascii}
+
+
+@lru_cache(maxsize=1024)
+def _parse_template(message: str) -> Optional[tuple]:
+    """
+    Split a translation template into (literal, field, spec, conversion) parts.
+
+    Returns None for templates using positional, attribute or index fields,
+    or nested format specs; those are left to str.format.
+    """
+    parts = tuple(Formatter().parse(message))
+    for _, field_name, spec, conversion in parts:
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or "{" in spec:
+            return None
+        if conversion is not None and conversion not in _CONVERSIONS:
+            return None
+    return parts
+
+
 class I18nService:
     """
     Internationalization service for translating messages.
@@ -268,9 +317,8 @@ class I18nService:
             config: Translation configuration
         """
         self.config = config or TranslationConfig()
-        self._translations: dict[Language, dict[str, str]] = {
-            lang: trans.copy() for lang, trans in TRANSLATIONS.items()
-        }
+        self._translations = dict(_FLAT_TRANSLATIONS)
+        self._keys = set(_TRANSLATION_KEYS)
         self._load_custom_translations()
 
     def _load_custom_translations(self) -> None:
@@ -283,9 +331,9 @@ class I18nService:
                         custom = json.load(f)
                         for lang_str, translations in custom.items():
                             lang = Language.from_string(lang_str)
-                            if lang not in self._translations:
-                                self._translations[lang] = {}
-                            self._translations[lang].update(translations)
+                            for key, text in translations.items():
+                                self._translations[key, lang] = text
+                                self._keys.add(key)
                     logger.info(f"Loaded custom translations from {path}")
             except Exception as e:
                 logger.error(f"Failed to load custom translations: {e}")
@@ -307,23 +355,44 @@ class I18nService:
         Returns:
             Translated string
         """
+        message = self.get_raw(key, language)
+        if not kwargs:
+            return message
+        return self._interpolate(message, kwargs)
+
+    def get_raw(
+        self,
+        key: str,
+        language: Optional[Language | str] = None,
+    ) -> str:
+        """
+        Get translated message template without interpolation.
+
+        Args:
+            key: Translation key (e.g., "error.unauthorized")
+            language: Language (enum or string), defaults to config default
+
+        Returns:
+            Translation template, or the key if no translation is found
+        """
         # Resolve language
         if language is None:
             lang = self.config.default_language
         elif isinstance(language, str):
-            lang = Language.from_string(language)
+            lang = _as_language(language)
         else:
             lang = language
 
         # Try requested language
-        if lang in self._translations and key in self._translations[lang]:
-            return self._interpolate(self._translations[lang][key], kwargs)
+        message = self._translations.get((key, lang))
+        if message is not None:
+            return message
 
         # Fallback to default language
         if self.config.fallback_to_default and lang != self.config.default_language:
-            default = self.config.default_language
-            if default in self._translations and key in self._translations[default]:
-                return self._interpolate(self._translations[default][key], kwargs)
+            message = self._translations.get((key, self.config.default_language))
+            if message is not None:
+                return message
 
         # Return key if no translation found
         logger.warning(f"Missing translation for key: {key}")
@@ -331,20 +400,26 @@ class I18nService:
 
     def _interpolate(self, message: str, values: dict) -> str:
         """Interpolate values into message string."""
-        if not values:
-            return message
+        parts = _parse_template(message)
         try:
-            return message.format(**values)
+            if parts is None:
+                return message.format(**values)
+            rendered = []
+            for literal, field_name, spec, conversion in parts:
+                rendered.append(literal)
+                if field_name is not None:
+                    value = values[field_name]
+                    if conversion is not None:
+                        value = _CONVERSIONS[conversion](value)
+                    rendered.append(format(value, spec))
+            return "".join(rendered)
         except KeyError as e:
             logger.warning(f"Missing interpolation value: {e}")
             return message
 
     def has_key(self, key: str) -> bool:
         """Check if translation key exists."""
-        for translations in self._translations.values():
-            if key in translations:
-                return True
-        return False
+        return key in self._keys
 
     def add_translation(
         self,
@@ -360,10 +435,9 @@ class I18nService:
         """
         for lang, text in translations.items():
             if isinstance(lang, str):
-                lang = Language.from_string(lang)
-            if lang not in self._translations:
-                self._translations[lang] = {}
-            self._translations[lang][key] = text
+                lang = _as_language(lang)
+            self._translations[key, lang] = text
+            self._keys.add(key)
 
     def get_available_languages(self) -> list[Language]:
         """Get list of available languages."""
@@ -398,33 +472,31 @@ def get_accept_language(header: Optional[str]) -> Language:
 
     # Parse Accept-Language header
     # Format: de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7
-    languages_with_quality: list[tuple[str, float]] = []
+    # Pick the highest quality supported language; ties keep header order.
+    best: Optional[Language] = None
+    best_quality = 0.0
 
     for part in header.split(","):
-        part = part.strip()
-        if ";q=" in part:
-            lang, q = part.split(";q=")
-            try:
-                quality = float(q)
-            except ValueError:
-                quality = 1.0
-        else:
-            lang = part
-            quality = 1.0
-
-        # Extract base language code
-        base_lang = lang.split("-")[0].lower()
-        languages_with_quality.append((base_lang, quality))
+        match = _ACCEPT_LANGUAGE_ENTRY_RE.fullmatch(part.strip())
+        if match is None:
+            continue
 
-    # Sort by quality descending
-    languages_with_quality.sort(key=lambda x: x[1], reverse=True)
+        lang = _LANGUAGE_BY_CODE.get(match.group(1).lower())
+        if lang is None:
+            continue
 
-    # Find first supported language
-    for lang_code, _ in languages_with_quality:
+        q_match = _ACCEPT_LANGUAGE_Q_RE.search(match.group(2))
+        q = q_match.group(1) if q_match else None
         try:
-            return Language(lang_code)
+            quality = float(q) if q else 1.0
         except ValueError:
-            continue
+            quality = 1.0
+
+        if best is None or quality > best_quality:
+            best, best_quality = lang, quality
+
+    if best is not None:
+        return best
 
     return DEFAULT_LANGUAGE
 
@@ -442,10 +514,9 @@ async def get_request_language(request) -> Language:
     # Check query parameter first
     lang_param = request.query_params.get("lang")
     if lang_param:
-        try:
-            return Language(lang_param.lower())
-        except ValueError:
-            pass
+        lang = _LANGUAGE_BY_CODE.get(lang_param.lower())
+        if lang is not None:
+            return lang
 
     # Check Accept-Language header
     accept_lang = request.headers.get("Accept-Language")
@@ -455,10 +526,7 @@ async def get_request_language(request) -> Language:
     return DEFAULT_LANGUAGE
 
 
-# Global i18n service instance
-_i18n_service: Optional[I18nService] = None
-
-
+@cache
 def get_i18n_service() -> I18nService:
     """
     Get or create the global i18n service.
@@ -466,10 +534,7 @@ def get_i18n_service() -> I18nService:
     Returns:
         I18nService instance
     """
-    global _i18n_service
-    if _i18n_service is None:
-        _i18n_service = I18nService()
-    return _i18n_service
+    return I18nService()
 
 
 def t(key: str, language: str | Language = DEFAULT_LANGUAGE, **kwargs) -> str:
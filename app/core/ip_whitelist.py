@@ -12,12 +12,17 @@ Security Note (SEC-011):
 
 import ipaddress
 import logging
-from typing import List, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
 from fastapi import Request
 
 logger = logging.getLogger(__name__)
 
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
 
 def get_client_ip(request: Request) -> str:
     """
@@ -54,13 +59,114 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
-def is_ip_allowed(client_ip: str, allowed_ips: Optional[List[str]]) -> bool:
+@lru_cache(maxsize=1024)
+def _parse_whitelist_entry(entry: str) -> Union[IPAddress, IPNetwork]:
+    """
+    Parse a whitelist entry: CIDR into a network, single IP into an address.
+
+    Single IPs stay addresses so they keep exact equality matching, which
+    distinguishes IPv6 scope ids (fe80::1%eth0 != fe80::1); a host network
+    would drop the scope. Parsed entries are cached because tenants re-send
+    the same allowed_ips. Invalid entries raise ValueError and are not cached.
+    """
+    if "/" in entry:
+        return ipaddress.ip_network(entry, strict=False)
+    return ipaddress.ip_address(entry)
+
+
+@dataclass(frozen=True, slots=True)
+class WhitelistConfig:
+    """
+    Parsed tenant whitelist; build it once and reuse it across lookups.
+
+    Single-IP entries are kept as a set of addresses (exact equality,
+    including IPv6 scope ids). CIDR networks are indexed by IP version and
+    prefix length: a lookup masks the address once per distinct prefix
+    length and checks set membership, so a membership test on a prebuilt
+    config costs O(number of prefix lengths), not O(number of entries).
+    """
+
+    networks: Tuple[IPNetwork, ...]
+    hosts: FrozenSet[IPAddress] = frozenset()
+    _tables: Dict[int, Tuple[Tuple[int, FrozenSet[int]], ...]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        by_prefix: Dict[int, Dict[int, Set[int]]] = {4: {}, 6: {}}
+        for network in self.networks:
+            by_prefix[network.version].setdefault(network.prefixlen, set()).add(
+                int(network.network_address)
+            )
+
+        tables = {}
+        for version, prefixes in by_prefix.items():
+            bits = 32 if version == 4 else 128
+            tables[version] = tuple(
+                (((1 << prefixlen) - 1) << (bits - prefixlen), frozenset(networks))
+                for prefixlen, networks in sorted(prefixes.items())
+            )
+        object.__setattr__(self, "_tables", tables)
+
+    @classmethod
+    def from_strings(cls, entries: Iterable[str]) -> "WhitelistConfig":
+        """Parse IP/CIDR strings, logging and skipping invalid entries."""
+        networks = []
+        hosts = set()
+        for entry in entries:
+            try:
+                parsed = _parse_whitelist_entry(entry)
+            except ValueError as e:
+                logger.warning(f"Invalid IP/CIDR in whitelist: {entry} - {e}")
+                continue
+            if isinstance(parsed, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+                networks.append(parsed)
+            else:
+                hosts.add(parsed)
+        return cls(tuple(networks), frozenset(hosts))
+
+    def __len__(self) -> int:
+        return len(self.networks) + len(self.hosts)
+
+    def __contains__(self, address: IPAddress) -> bool:
+        if address in self.hosts:
+            return True
+        value = int(address)
+        return any(
+            value & mask in networks for mask, networks in self._tables[address.version]
+        )
+
+
+AllowedIps = Union[WhitelistConfig, List[str]]
+
+
+@lru_cache(maxsize=256)
+def _get_whitelist(entries: Tuple[str, ...]) -> WhitelistConfig:
+    """Build (once per distinct allowed_ips list) the parsed whitelist."""
+    return WhitelistConfig.from_strings(entries)
+
+
+def _as_whitelist(allowed_ips: AllowedIps) -> WhitelistConfig:
+    """
+    Return a WhitelistConfig, parsing legacy string lists via the cache.
+
+    A string list still costs O(N) per call: it is copied into a tuple,
+    which the LRU cache hashes and compares in full. Parsing and index
+    building happen only on a cache miss.
+    """
+    if isinstance(allowed_ips, WhitelistConfig):
+        return allowed_ips
+    return _get_whitelist(tuple(allowed_ips))
+
+
+def is_ip_allowed(client_ip: str, allowed_ips: Optional[AllowedIps]) -> bool:
     """
     Check if a client IP is allowed based on the whitelist.
     
     Args:
         client_ip: The IP address to check
-        allowed_ips: List of allowed IPs/CIDRs, or None to allow all
+        allowed_ips: WhitelistConfig or list of allowed IPs/CIDRs,
+            or None to allow all
         
     Returns:
         True if IP is allowed, False otherwise
@@ -69,6 +175,11 @@ def is_ip_allowed(client_ip: str, allowed_ips: Optional[List[str]]) -> bool:
         - None (not set) → Allow all IPs (default behavior)
         - Empty list [] → Block all IPs (paranoid mode)
         - List with values → Allow only matching IPs/CIDRs
+
+    A prebuilt WhitelistConfig gives a lookup independent of the list size.
+    String lists (as loaded per request from the tenants table) hit an LRU
+    cache keyed by their contents, which skips re-parsing but still hashes
+    and compares every entry on each call.
     """
     # NULL = allow all (backwards compatible default)
     if allowed_ips is None:
@@ -85,26 +196,44 @@ def is_ip_allowed(client_ip: str, allowed_ips: Optional[List[str]]) -> bool:
         logger.warning(f"Invalid client IP format: {client_ip}")
         return False
     
-    for allowed in allowed_ips:
-        try:
-            # Try as network (CIDR)
-            if "/" in allowed:
-                network = ipaddress.ip_network(allowed, strict=False)
-                if client_addr in network:
-                    return True
-            else:
-                # Try as single IP
-                if client_addr == ipaddress.ip_address(allowed):
-                    return True
-        except ValueError as e:
-            logger.warning(f"Invalid IP/CIDR in whitelist: {allowed} - {e}")
-            continue
+    if client_addr in _as_whitelist(allowed_ips):
+        return True
     
     logger.warning(f"IP {client_ip} not in whitelist")
     return False
 
 
-def validate_ip_whitelist(request: Request, allowed_ips: Optional[List[str]]) -> bool:
+def is_ip_allowed_many(
+    client_ips: Iterable[str], allowed_ips: Optional[AllowedIps]
+) -> List[bool]:
+    """
+    Check several client IPs against the same whitelist.
+
+    Follows the same rules as is_ip_allowed(), but builds the whitelist
+    index once and does not log per address.
+
+    Returns:
+        One result per client IP, in input order
+    """
+    client_ips = list(client_ips)
+    if allowed_ips is None:
+        return [True] * len(client_ips)
+    if len(allowed_ips) == 0:
+        return [False] * len(client_ips)
+
+    whitelist = _as_whitelist(allowed_ips)
+    results = []
+    for client_ip in client_ips:
+        try:
+            results.append(ipaddress.ip_address(client_ip) in whitelist)
+        except ValueError:
+            results.append(False)
+    return results
+
+
+def validate_ip_whitelist(
+    request: Request, allowed_ips: Optional[AllowedIps]
+) -> bool:
     """
     Validate the request's client IP against the allowed list.
     
@@ -112,7 +241,7 @@ def validate_ip_whitelist(request: Request, allowed_ips: Optional[List[str]]) ->
     
     Args:
         request: FastAPI request object
-        allowed_ips: Tenant's allowed_ips from database
+        allowed_ips: Tenant's allowed_ips from database (or a WhitelistConfig)
         
     Returns:
         True if allowed, False if blocked
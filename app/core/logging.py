@@ -12,21 +12,22 @@ class PrivacyLogFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Filter log record by sanitizing PII from message and arguments.
+
+        Uses DataPrivacyShield.redact(), which skips patterns that cannot
+        match and does not emit its own detection logs.
         """
+        redact = DataPrivacyShield.redact
+
         # Sanitize the main log message
         if isinstance(record.msg, str):
-            record.msg, _ = DataPrivacyShield.sanitize(record.msg)
+            record.msg = redact(record.msg)
         
         # Handle arguments
         if record.args:
-            new_args = []
-            for arg in record.args:
-                if isinstance(arg, str):
-                    sanitized_arg, _ = DataPrivacyShield.sanitize(arg)
-                    new_args.append(sanitized_arg)
-                else:
-                    new_args.append(arg)
-            record.args = tuple(new_args)
+            record.args = tuple(
+                redact(arg) if isinstance(arg, str) else arg
+                for arg in record.args
+            )
 
         return True
 
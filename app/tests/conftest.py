@@ -5,7 +5,11 @@ Sets up testing environment with proper configuration.
 """
 
 import os
+from functools import cache
+from types import SimpleNamespace
+
 import pytest
+import pytest_asyncio
 
 # Set testing environment BEFORE importing app modules
 os.environ["TESTING"] = "true"
@@ -52,6 +56,32 @@ def mock_supabase_client():
     return client
 
 
+_OK = SimpleNamespace(data=[])
+
+
+class _StubClient:
+    """Plain stand-in for a Supabase client whose query chain always succeeds."""
+
+    def table(self, *args, **kwargs):
+        return self
+
+    select = limit = table
+
+    def execute(self):
+        return _OK
+
+
+@pytest.fixture
+def stub_supabase_client():
+    """
+    Lightweight Supabase client for code that only walks the query chain.
+
+    Cheaper than the MagicMock-based mock_supabase_client when a test does
+    not need call assertions.
+    """
+    return _StubClient()
+
+
 @pytest.fixture
 def mock_license_info():
     """
@@ -72,32 +102,114 @@ def mock_license_info():
 
 
 @pytest.fixture
-def client():
+def make_license_info():
+    """
+    Factory for real LicenseInfo objects.
+
+    Defaults describe an active license with 1000 credits; pass keyword
+    overrides for anything else. The import is deferred so test modules
+    using the factory don't import app.core.security at collection time.
+    """
+    from app.tests.fakes.license import make_license_info as factory
+
+    return factory
+
+
+@cache
+def _spec_names(cls):
+    """Attribute names of cls, computed once and reused as a mock spec."""
+    return tuple(dir(cls))
+
+
+@pytest.fixture
+def mock_provider(monkeypatch):
+    """
+    Replace AnthropicProvider in the generate endpoint with a MagicMock.
+
+    The spec is resolved once per session; each test still gets its own
+    mock, so return values and call records never leak between tests.
+    """
+    from unittest.mock import MagicMock
+
+    from app.services.anthropic_provider import AnthropicProvider
+
+    provider = MagicMock(spec=_spec_names(AnthropicProvider))
+    monkeypatch.setattr("app.api.v1.generate.AnthropicProvider", provider)
+    return provider
+
+
+@pytest.fixture
+def mock_shield(monkeypatch):
+    """
+    Replace DataPrivacyShield in the generate endpoint with a MagicMock.
+    """
+    from unittest.mock import MagicMock
+
+    from app.services.privacy import DataPrivacyShield
+
+    shield = MagicMock(spec=_spec_names(DataPrivacyShield))
+    monkeypatch.setattr("app.api.v1.generate.DataPrivacyShield", shield)
+    return shield
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """
+    The FastAPI application, imported once per session.
+
+    The import is deferred until after the testing environment variables
+    above are set.
+    """
+    from app.main import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
     """
     Create a TestClient for the FastAPI application.
 
-    This fixture provides a shared test client for all tests.
+    This fixture provides a shared test client for all tests. The client
+    is entered once per session so the app lifespan runs a single time;
+    per-test patches and dependency overrides stay local to each test.
     """
     from fastapi.testclient import TestClient
-    from app.main import app
 
-    return TestClient(app, raise_server_exceptions=False)
+    with TestClient(app_instance, raise_server_exceptions=False) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient(app_instance):
+    """
+    In-process async HTTP client for the FastAPI application.
+
+    Requests go straight through httpx's ASGI transport on the session
+    event loop, without TestClient's thread bridge. Tests using it must
+    run with @pytest.mark.asyncio(loop_scope="session").
+    """
+    from httpx import ASGITransport, AsyncClient
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app_instance), base_url="http://test"
+    ) as c:
+        yield c
 
 
 @pytest.fixture(autouse=True)
-def cleanup_dependency_overrides():
+def cleanup_dependency_overrides(app_instance):
     """
     Clean up FastAPI dependency overrides after each test.
 
     This ensures test isolation by clearing any dependency overrides
     that were set during a test, preventing state pollution.
     """
-    from app.main import app
-
     # Store original overrides
-    original_overrides = dict(app.dependency_overrides)
+    original_overrides = dict(app_instance.dependency_overrides)
 
     yield
 
     # Restore original overrides after test
-    app.dependency_overrides = original_overrides
+    app_instance.dependency_overrides = original_overrides
+
@@ -0,0 +1,3 @@
+"""
+Hand-written test doubles shared across the test suite.
+"""
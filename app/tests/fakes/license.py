@@ -0,0 +1,25 @@
+"""
+Factory for real LicenseInfo objects used across the test suite.
+
+Module-level constants and session fixtures can call make_license_info()
+directly; function-scoped tests get it through the conftest fixture of the
+same name.
+"""
+
+from typing import Any
+
+from app.core.security import LicenseInfo
+
+
+def make_license_info(**overrides: Any) -> LicenseInfo:
+    """Active license with 1000 credits; keyword overrides replace fields."""
+    fields = {
+        "license_key": "test-key",
+        "license_uuid": "test-uuid",
+        "tenant_id": "test-tenant",
+        "app_id": "test-app",
+        "credits_remaining": 1000,
+        "is_active": True,
+    }
+    fields.update(overrides)
+    return LicenseInfo(**fields)
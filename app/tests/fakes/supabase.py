@@ -0,0 +1,114 @@
+"""
+In-memory stand-in for the Supabase client used by service tests.
+
+Canned results are configured per table, and every rpc() call and
+table() query is recorded for later assertions.
+
+Usage:
+    fake = FakeSupabase()
+    fake.set_single_row("invoices", {...})
+    fake.set_rows("invoice_items", [...])
+    service._client = fake
+"""
+
+from types import SimpleNamespace
+from typing import Any
+
+
+class _Call:
+    """Result of client.rpc(); execute() hands back the canned RPC data."""
+
+    def __init__(self, data: Any):
+        self._data = data
+
+    def execute(self) -> SimpleNamespace:
+        return SimpleNamespace(data=self._data)
+
+
+class FakeQuery:
+    """
+    Recorded query builder returned by FakeSupabase.table().
+
+    Builder methods log (method, args, kwargs) to ``calls`` and return self;
+    execute() returns the canned update result, single row, or row list.
+    """
+
+    def __init__(self, fake: "FakeSupabase", table: str):
+        self._fake = fake
+        self.table = table
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def _record(self, method: str, *args: Any, **kwargs: Any) -> "FakeQuery":
+        self.calls.append((method, args, kwargs))
+        return self
+
+    def select(self, *args: Any) -> "FakeQuery":
+        return self._record("select", *args)
+
+    def insert(self, *args: Any) -> "FakeQuery":
+        return self._record("insert", *args)
+
+    def update(self, *args: Any) -> "FakeQuery":
+        return self._record("update", *args)
+
+    def eq(self, *args: Any) -> "FakeQuery":
+        return self._record("eq", *args)
+
+    def order(self, *args: Any, **kwargs: Any) -> "FakeQuery":
+        return self._record("order", *args, **kwargs)
+
+    def range(self, *args: Any) -> "FakeQuery":
+        return self._record("range", *args)
+
+    def limit(self, *args: Any) -> "FakeQuery":
+        return self._record("limit", *args)
+
+    def single(self) -> "FakeQuery":
+        return self._record("single")
+
+    def execute(self) -> SimpleNamespace:
+        methods = {method for method, _, _ in self.calls}
+        if "update" in methods:
+            data = self._fake._updated.get(self.table, [])
+        elif "single" in methods:
+            data = self._fake._single.get(self.table)
+        else:
+            data = self._fake._rows.get(self.table, [])
+        return SimpleNamespace(data=data)
+
+
+class FakeSupabase:
+    """Fake Supabase client with canned per-table results and a call log."""
+
+    def __init__(self):
+        self.rpc_calls: list[tuple[str, dict | None]] = []
+        self.queries: list[FakeQuery] = []
+        self._rpc_data: Any = None
+        self._single: dict[str, Any] = {}
+        self._rows: dict[str, list] = {}
+        self._updated: dict[str, list] = {}
+
+    def set_rpc(self, data: Any) -> None:
+        """Data returned by every rpc(...).execute()."""
+        self._rpc_data = data
+
+    def set_single_row(self, table: str, row: dict | None) -> None:
+        """Row returned by .single() queries on table."""
+        self._single[table] = row
+
+    def set_rows(self, table: str, rows: list) -> None:
+        """Rows returned by list queries on table."""
+        self._rows[table] = rows
+
+    def set_updated(self, table: str, rows: list) -> None:
+        """Rows returned by update queries on table."""
+        self._updated[table] = rows
+
+    def rpc(self, name: str, params: dict | None = None) -> _Call:
+        self.rpc_calls.append((name, params))
+        return _Call(self._rpc_data)
+
+    def table(self, name: str) -> FakeQuery:
+        query = FakeQuery(self, name)
+        self.queries.append(query)
+        return query
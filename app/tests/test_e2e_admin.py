@@ -11,11 +11,18 @@ Tests complete workflows across multiple admin endpoints:
 These tests verify the integration between different admin components.
 """
 
+import asyncio
+import itertools
+from collections import defaultdict
+
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from fastapi import FastAPI
 from unittest.mock import MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
 from app.api.admin import tenants, licenses, apps as admin_apps, analytics, audit_logs
@@ -23,6 +30,35 @@ from app.core.admin_auth import get_admin_key, get_admin_user, verify_admin_role
 from app.core.rbac import Role, UserRole
 
 
+def _orjson_body(json, headers, kwargs):
+    """Move a ``json=`` payload into orjson-encoded ``content``."""
+    if json is not None:
+        kwargs["content"] = orjson.dumps(json)
+        headers = {**(headers or {}), "content-type": "application/json"}
+    return headers
+
+
+class ORJSONTestClient(TestClient):
+    """
+    TestClient that serializes ``json=`` request bodies with orjson.
+
+    Only request encoding changes; ``response.json()`` still uses httpx's
+    stdlib decoder.
+    """
+
+    def request(self, method, url, *, json=None, headers=None, **kwargs):
+        headers = _orjson_body(json, headers, kwargs)
+        return super().request(method, url, headers=headers, **kwargs)
+
+
+class ORJSONAsyncClient(AsyncClient):
+    """AsyncClient counterpart of ORJSONTestClient (request bodies only)."""
+
+    async def request(self, method, url, *, json=None, headers=None, **kwargs):
+        headers = _orjson_body(json, headers, kwargs)
+        return await super().request(method, url, headers=headers, **kwargs)
+
+
 @pytest.fixture
 def app():
     """Create test FastAPI app with all admin routers."""
@@ -57,7 +93,17 @@ def app():
 @pytest.fixture
 def client(app):
     """Create test client."""
-    return TestClient(app)
+    return ORJSONTestClient(app)
+
+
+@pytest_asyncio.fixture
+async def async_client(app):
+    """Create async client for tests that issue requests concurrently."""
+    transport = ASGITransport(app=app)
+    async with ORJSONAsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as ac:
+        yield ac
 
 
 @pytest.fixture
@@ -65,13 +111,22 @@ def mock_supabase():
     """Create comprehensive mock Supabase client."""
     mock_client = MagicMock()
 
-    # Track stored data
-    stored_data = {
-        "tenants": [],
-        "apps": [],
-        "licenses": [],
-        "usage_logs": [],
-    }
+    # Track stored data, keyed by row id per table
+    stored_data = defaultdict(dict)
+
+    # Deterministic row ids; still valid UUIDs for the typed path parameters
+    row_ids = itertools.count(1)
+
+    def find_rows(table_name, field, value):
+        """Return rows matching field == value (O(1) for id lookups)."""
+        rows = stored_data[table_name]
+        if field == "id":
+            row = rows.get(str(value))
+            return [row] if row is not None else []
+        return [
+            item for item in rows.values()
+            if str(item.get(field)) == str(value)
+        ]
 
     def mock_table(table_name):
         """Return table-specific mock."""
@@ -81,10 +136,10 @@ def mock_supabase():
             """Mock insert operation."""
             insert_mock = MagicMock()
             if isinstance(data, dict):
-                data["id"] = str(uuid4())
+                data["id"] = str(UUID(int=next(row_ids)))
                 data["created_at"] = datetime.now(timezone.utc).isoformat()
                 data["updated_at"] = datetime.now(timezone.utc).isoformat()
-                stored_data[table_name].append(data)
+                stored_data[table_name][data["id"]] = data
             insert_mock.execute = MagicMock(return_value=MagicMock(data=[data]))
             return insert_mock
 
@@ -95,10 +150,7 @@ def mock_supabase():
             def mock_eq(field, value):
                 """Filter by field."""
                 eq_mock = MagicMock()
-                filtered = [
-                    item for item in stored_data.get(table_name, [])
-                    if str(item.get(field)) == str(value)
-                ]
+                filtered = find_rows(table_name, field, value)
 
                 def mock_single():
                     single_mock = MagicMock()
@@ -123,14 +175,16 @@ def mock_supabase():
             def mock_range(start, end):
                 range_mock = MagicMock()
                 range_mock.execute = MagicMock(
-                    return_value=MagicMock(data=stored_data.get(table_name, [])[start:end+1])
+                    return_value=MagicMock(
+                        data=list(stored_data[table_name].values())[start:end+1]
+                    )
                 )
                 return range_mock
 
             select_mock.eq = mock_eq
             select_mock.range = mock_range
             select_mock.execute = MagicMock(
-                return_value=MagicMock(data=stored_data.get(table_name, []))
+                return_value=MagicMock(data=list(stored_data[table_name].values()))
             )
             return select_mock
 
@@ -141,16 +195,11 @@ def mock_supabase():
             def mock_eq(field, value):
                 eq_mock = MagicMock()
                 # Find and update matching items
-                for item in stored_data.get(table_name, []):
-                    if str(item.get(field)) == str(value):
-                        item.update(data)
-
-                eq_mock.execute = MagicMock(
-                    return_value=MagicMock(data=[
-                        item for item in stored_data.get(table_name, [])
-                        if str(item.get(field)) == str(value)
-                    ])
-                )
+                matched = find_rows(table_name, field, value)
+                for item in matched:
+                    item.update(data)
+
+                eq_mock.execute = MagicMock(return_value=MagicMock(data=matched))
                 return eq_mock
 
             update_mock.eq = mock_eq
@@ -163,10 +212,8 @@ def mock_supabase():
             def mock_eq(field, value):
                 eq_mock = MagicMock()
                 # Remove matching items
-                stored_data[table_name] = [
-                    item for item in stored_data.get(table_name, [])
-                    if str(item.get(field)) != str(value)
-                ]
+                for item in find_rows(table_name, field, value):
+                    stored_data[table_name].pop(item["id"], None)
                 eq_mock.execute = MagicMock(return_value=MagicMock(data=[]))
                 return eq_mock
 
@@ -185,6 +232,22 @@ def mock_supabase():
     return mock_client
 
 
+@pytest.fixture
+def make_tenant(client, mock_supabase):
+    """Factory fixture that creates a tenant via the API and returns its ID."""
+    def _make(name="Test Tenant", email=None):
+        email = email or f"{name.lower().replace(' ', '')}@test.com"
+        with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase):
+            response = client.post("/admin/tenants", json={
+                "name": name,
+                "email": email
+            })
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    return _make
+
+
 class TestTenantLifecycle:
     """E2E tests for tenant lifecycle."""
 
@@ -202,15 +265,11 @@ class TestTenantLifecycle:
             assert tenant["name"] == "Test Company"
             assert "id" in tenant
 
-    def test_tenant_update_flow(self, client, mock_supabase):
+    def test_tenant_update_flow(self, client, mock_supabase, make_tenant):
         """Test tenant update flow."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase):
             # Create tenant first
-            create_response = client.post("/admin/tenants", json={
-                "name": "Original Name",
-                "email": "original@test.com"
-            })
-            tenant_id = create_response.json()["id"]
+            tenant_id = make_tenant("Original Name", "original@test.com")
 
             # Update tenant
             update_response = client.put(f"/admin/tenants/{tenant_id}", json={
@@ -220,15 +279,12 @@ class TestTenantLifecycle:
             assert update_response.status_code == 200
             assert update_response.json()["name"] == "Updated Name"
 
-    def test_tenant_list_flow(self, client, mock_supabase):
+    def test_tenant_list_flow(self, client, mock_supabase, make_tenant):
         """Test listing multiple tenants."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase):
             # Create multiple tenants
             for i in range(3):
-                client.post("/admin/tenants", json={
-                    "name": f"Tenant {i}",
-                    "email": f"tenant{i}@test.com"
-                })
+                make_tenant(f"Tenant {i}", f"tenant{i}@test.com")
 
             # List all
             response = client.get("/admin/tenants")
@@ -252,17 +308,13 @@ class TestLicenseLifecycle:
             # Should fail because tenant doesn't exist
             assert response.status_code in [404, 400, 500]
 
-    def test_license_full_lifecycle(self, client, mock_supabase):
+    def test_license_full_lifecycle(self, client, mock_supabase, make_tenant):
         """Test complete license lifecycle with tenant."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
             # Step 1: Create tenant
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "License Test Tenant",
-                "email": "license@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("License Test Tenant", "license@test.com")
 
             # Step 2: Create license for tenant
             license_response = client.post("/admin/licenses", json={
@@ -290,17 +342,13 @@ class TestLicenseLifecycle:
 class TestAppLifecycle:
     """E2E tests for app lifecycle."""
 
-    def test_app_full_lifecycle(self, client, mock_supabase):
+    def test_app_full_lifecycle(self, client, mock_supabase, make_tenant):
         """Test complete app lifecycle."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.apps.get_supabase_client", return_value=mock_supabase):
 
             # Step 1: Create tenant
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "App Test Tenant",
-                "email": "app@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("App Test Tenant", "app@test.com")
 
             # Step 2: Create app for tenant
             app_response = client.post("/admin/apps", json={
@@ -332,23 +380,15 @@ class TestAppLifecycle:
 class TestMultiTenantIsolation:
     """E2E tests for multi-tenant data isolation."""
 
-    def test_apps_isolated_by_tenant(self, client, mock_supabase):
+    def test_apps_isolated_by_tenant(self, client, mock_supabase, make_tenant):
         """Test that apps are properly isolated by tenant."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.apps.get_supabase_client", return_value=mock_supabase):
 
             # Create two tenants
-            tenant1_resp = client.post("/admin/tenants", json={
-                "name": "Tenant 1",
-                "email": "tenant1@test.com"
-            })
-            tenant1_id = tenant1_resp.json()["id"]
+            tenant1_id = make_tenant("Tenant 1", "tenant1@test.com")
 
-            tenant2_resp = client.post("/admin/tenants", json={
-                "name": "Tenant 2",
-                "email": "tenant2@test.com"
-            })
-            tenant2_id = tenant2_resp.json()["id"]
+            tenant2_id = make_tenant("Tenant 2", "tenant2@test.com")
 
             # Create app for each tenant
             client.post("/admin/apps", json={
@@ -375,19 +415,14 @@ class TestMultiTenantIsolation:
 class TestAdminWorkflows:
     """E2E tests for common admin workflows."""
 
-    def test_onboard_new_customer_workflow(self, client, mock_supabase):
+    def test_onboard_new_customer_workflow(self, client, mock_supabase, make_tenant):
         """Test complete new customer onboarding workflow."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.apps.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
             # Step 1: Create tenant for new customer
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "New Customer Inc",
-                "email": "admin@newcustomer.com"
-            })
-            assert tenant_response.status_code == 201
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("New Customer Inc", "admin@newcustomer.com")
 
             # Step 2: Create default app
             app_response = client.post("/admin/apps", json={
@@ -409,17 +444,13 @@ class TestAdminWorkflows:
             tenants_list = client.get("/admin/tenants").json()
             assert any(t["id"] == tenant_id for t in tenants_list)
 
-    def test_upgrade_customer_credits_workflow(self, client, mock_supabase):
+    def test_upgrade_customer_credits_workflow(self, client, mock_supabase, make_tenant):
         """Test workflow for upgrading customer credits."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
             # Setup: Create tenant with license
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Upgrade Test",
-                "email": "upgrade@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("Upgrade Test", "upgrade@test.com")
 
             license_response = client.post("/admin/licenses", json={
                 "tenant_id": tenant_id,
@@ -435,18 +466,14 @@ class TestAdminWorkflows:
             assert upgrade_response.status_code == 200
             assert upgrade_response.json()["credits_remaining"] == 2000
 
-    def test_deactivate_customer_workflow(self, client, mock_supabase):
+    def test_deactivate_customer_workflow(self, client, mock_supabase, make_tenant):
         """Test workflow for deactivating a customer."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.apps.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
             # Setup: Create tenant with app and license
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Deactivate Test",
-                "email": "deactivate@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("Deactivate Test", "deactivate@test.com")
 
             app_response = client.post("/admin/apps", json={
                 "tenant_id": tenant_id,
@@ -471,17 +498,13 @@ class TestAdminWorkflows:
 class TestBulkOperations:
     """E2E tests for bulk admin operations."""
 
-    def test_create_multiple_apps_for_tenant(self, client, mock_supabase):
+    def test_create_multiple_apps_for_tenant(self, client, mock_supabase, make_tenant):
         """Test creating multiple apps for a single tenant."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.apps.get_supabase_client", return_value=mock_supabase):
 
             # Create tenant
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Multi App Tenant",
-                "email": "multiapp@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("Multi App Tenant", "multiapp@test.com")
 
             # Create multiple apps
             app_names = ["Web App", "Mobile App", "API Gateway", "Admin Portal"]
@@ -536,15 +559,12 @@ class TestErrorHandling:
 class TestPagination:
     """E2E tests for pagination."""
 
-    def test_tenant_list_pagination(self, client, mock_supabase):
+    def test_tenant_list_pagination(self, client, mock_supabase, make_tenant):
         """Test pagination for tenant listing."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase):
             # Create 10 tenants
             for i in range(10):
-                client.post("/admin/tenants", json={
-                    "name": f"Tenant {i}",
-                    "email": f"tenant{i}@test.com"
-                })
+                make_tenant(f"Tenant {i}", f"tenant{i}@test.com")
 
             # Get first page
             page1_response = client.get("/admin/tenants?skip=0&limit=5")
@@ -567,17 +587,13 @@ class TestPagination:
 class TestStripeIntegrationWorkflow:
     """E2E tests for Stripe payment integration workflows."""
 
-    def test_credit_topup_via_stripe_workflow(self, client, mock_supabase):
+    def test_credit_topup_via_stripe_workflow(self, client, mock_supabase, make_tenant):
         """Test complete credit top-up workflow via Stripe checkout."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
             # Step 1: Create tenant
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Stripe Test Customer",
-                "email": "stripe@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("Stripe Test Customer", "stripe@test.com")
 
             # Step 2: Create license with initial credits
             license_response = client.post("/admin/licenses", json={
@@ -602,17 +618,13 @@ class TestStripeIntegrationWorkflow:
             assert update_response.status_code == 200
             assert update_response.json()["credits_remaining"] == 1100
 
-    def test_stripe_checkout_session_flow(self, client, mock_supabase):
+    def test_stripe_checkout_session_flow(self, client, mock_supabase, make_tenant):
         """Test Stripe checkout session creation and completion flow."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
             # Setup: Create tenant and license
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Checkout Test",
-                "email": "checkout@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("Checkout Test", "checkout@test.com")
 
             license_response = client.post("/admin/licenses", json={
                 "tenant_id": tenant_id,
@@ -639,7 +651,7 @@ class TestStripeIntegrationWorkflow:
 class TestCompleteCustomerJourney:
     """E2E tests for complete customer journey scenarios."""
 
-    def test_full_customer_journey(self, client, mock_supabase):
+    def test_full_customer_journey(self, client, mock_supabase, make_tenant):
         """Test complete customer journey from signup to usage."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.apps.get_supabase_client", return_value=mock_supabase), \
@@ -647,13 +659,7 @@ class TestCompleteCustomerJourney:
 
             # === SIGNUP PHASE ===
             # 1. Customer signs up → Admin creates tenant
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Acme Corporation",
-                "email": "admin@acme.com"
-            })
-            assert tenant_response.status_code == 201
-            tenant = tenant_response.json()
-            tenant_id = tenant["id"]
+            tenant_id = make_tenant("Acme Corporation", "admin@acme.com")
 
             # 2. Admin creates default app for customer
             app_response = client.post("/admin/apps", json={
@@ -700,18 +706,14 @@ class TestCompleteCustomerJourney:
             apps_response = client.get(f"/admin/apps?tenant_id={tenant_id}")
             assert len(apps_response.json()) == 2
 
-    def test_enterprise_customer_setup(self, client, mock_supabase):
+    def test_enterprise_customer_setup(self, client, mock_supabase, make_tenant):
         """Test enterprise customer setup with multiple apps and high credits."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.apps.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
             # Create enterprise tenant
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Enterprise Corp",
-                "email": "enterprise@bigcorp.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("Enterprise Corp", "enterprise@bigcorp.com")
 
             # Create multiple apps for different departments
             departments = [
@@ -739,159 +741,153 @@ class TestCompleteCustomerJourney:
             assert license_response.json()["credits_remaining"] == 1000000
 
 
-class TestCreditExhaustionScenarios:
-    """E2E tests for credit exhaustion and renewal scenarios."""
-
-    def test_credit_exhaustion_and_topup(self, client, mock_supabase):
-        """Test scenario where credits run out and are topped up."""
-        with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
-             patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
-
-            # Setup tenant with limited credits
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Limited Credits Co",
-                "email": "limited@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
-
-            license_response = client.post("/admin/licenses", json={
-                "tenant_id": tenant_id,
-                "credits": 100,
-                "expires_at": "2025-12-31T23:59:59Z"
-            })
-            license_id = license_response.json()["id"]
-
-            # Simulate credit usage until exhaustion
-            usage_steps = [80, 15, 5, 0]  # Remaining after each usage
-            for remaining in usage_steps:
-                client.put(f"/admin/licenses/{license_id}", json={
-                    "credits_remaining": remaining
-                })
-
-            # Verify credits are exhausted
-            # (In real app, API calls would fail at this point)
-
-            # Customer tops up via Stripe
-            topup_response = client.put(f"/admin/licenses/{license_id}", json={
-                "credits_remaining": 5000  # Fresh credits
-            })
-            assert topup_response.status_code == 200
-            assert topup_response.json()["credits_remaining"] == 5000
-
-
-class TestLicenseExpirationScenarios:
-    """E2E tests for license expiration scenarios."""
-
-    def test_license_renewal_before_expiration(self, client, mock_supabase):
-        """Test renewing a license before it expires."""
+def _exhaust_and_top_up(client, tenant_id, license_id):
+    """Use up all credits step by step, then top up via Stripe."""
+    for remaining in [80, 15, 5, 0]:  # Remaining after each usage
+        client.put(f"/admin/licenses/{license_id}", json={
+            "credits_remaining": remaining
+        })
+
+    # (In real app, API calls would fail at this point)
+    return client.put(f"/admin/licenses/{license_id}", json={
+        "credits_remaining": 5000  # Fresh credits
+    })
+
+
+def _renew_before_expiration(client, tenant_id, license_id):
+    """Extend a license that is about to expire."""
+    return client.put(f"/admin/licenses/{license_id}", json={
+        "expires_at": "2026-01-15T23:59:59Z"  # Extended by 1 year
+    })
+
+
+def _replace_expired_license(client, tenant_id, license_id):
+    """Deactivate an expired license and issue a new one."""
+    client.delete(f"/admin/licenses/{license_id}")
+    return client.post("/admin/licenses", json={
+        "tenant_id": tenant_id,
+        "credits": 5000,
+        "expires_at": "2025-12-31T23:59:59Z"
+    })
+
+
+def _rotate_api_key(client, tenant_id, license_id):
+    """Rotate the API key by issuing a new license and revoking the old one."""
+    # In real scenario, there would be a dedicated rotate endpoint
+    new_license_response = client.post("/admin/licenses", json={
+        "tenant_id": tenant_id,
+        "credits": 1000,
+        "expires_at": "2025-12-31T23:59:59Z"
+    })
+    client.delete(f"/admin/licenses/{license_id}")
+    return new_license_response
+
+
+class TestLicenseLifecycleScenarios:
+    """E2E tests for credit exhaustion, expiration and key rotation scenarios."""
+
+    @pytest.mark.parametrize(
+        "initial_credits,expires_at,mutation,expected_status,expected_credits",
+        [
+            pytest.param(
+                100, "2025-12-31T23:59:59Z", _exhaust_and_top_up, 200, 5000,
+                id="credit_exhaustion_and_topup",
+            ),
+            pytest.param(
+                1000, "2025-01-15T23:59:59Z", _renew_before_expiration, 200, None,
+                id="renewal_before_expiration",
+            ),
+            pytest.param(
+                0, "2024-12-31T23:59:59Z", _replace_expired_license, 201, 5000,
+                id="new_license_after_expiration",
+            ),
+            pytest.param(
+                1000, "2025-12-31T23:59:59Z", _rotate_api_key, 201, None,
+                id="api_key_rotation",
+            ),
+        ],
+    )
+    def test_license_lifecycle(
+        self,
+        client,
+        mock_supabase,
+        make_tenant,
+        initial_credits,
+        expires_at,
+        mutation,
+        expected_status,
+        expected_credits,
+    ):
+        """Test license mutations on a freshly provisioned tenant license."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
-            # Setup
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Renewal Test",
-                "email": "renewal@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            # Setup tenant with license
+            tenant_id = make_tenant("License Lifecycle Test", "lifecycle@test.com")
 
-            # License expiring soon
             license_response = client.post("/admin/licenses", json={
                 "tenant_id": tenant_id,
-                "credits": 1000,
-                "expires_at": "2025-01-15T23:59:59Z"  # Expiring soon
+                "credits": initial_credits,
+                "expires_at": expires_at
             })
             license_id = license_response.json()["id"]
 
-            # Renew license with extended expiration
-            renewal_response = client.put(f"/admin/licenses/{license_id}", json={
-                "expires_at": "2026-01-15T23:59:59Z"  # Extended by 1 year
-            })
-            assert renewal_response.status_code == 200
+            response = mutation(client, tenant_id, license_id)
 
-    def test_create_new_license_after_expiration(self, client, mock_supabase):
-        """Test creating a new license after old one expires."""
-        with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
-             patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
-
-            # Setup tenant
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "New License Test",
-                "email": "newlicense@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
-
-            # Old expired license (simulated)
-            old_license_response = client.post("/admin/licenses", json={
-                "tenant_id": tenant_id,
-                "credits": 0,  # Used up
-                "expires_at": "2024-12-31T23:59:59Z"  # Already expired
-            })
-            old_license_id = old_license_response.json()["id"]
-
-            # Deactivate old license
-            client.delete(f"/admin/licenses/{old_license_id}")
-
-            # Create new license
-            new_license_response = client.post("/admin/licenses", json={
-                "tenant_id": tenant_id,
-                "credits": 5000,
-                "expires_at": "2025-12-31T23:59:59Z"
-            })
-            assert new_license_response.status_code == 201
-            assert new_license_response.json()["credits_remaining"] == 5000
+            assert response.status_code == expected_status
+            if expected_credits is not None:
+                assert response.json()["credits_remaining"] == expected_credits
 
 
 class TestDataIntegrityScenarios:
     """E2E tests for data integrity across operations."""
 
-    def test_cascade_delete_tenant(self, client, mock_supabase):
+    async def test_cascade_delete_tenant(self, async_client, mock_supabase):
         """Test that deleting tenant cascades to apps and licenses."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.apps.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
             # Create full tenant setup
-            tenant_response = client.post("/admin/tenants", json={
+            tenant_response = await async_client.post("/admin/tenants", json={
                 "name": "Cascade Delete Test",
                 "email": "cascade@test.com"
             })
             tenant_id = tenant_response.json()["id"]
 
-            # Create apps
-            for i in range(3):
-                client.post("/admin/apps", json={
+            # Create apps concurrently
+            app_responses = await asyncio.gather(*[
+                async_client.post("/admin/apps", json={
                     "tenant_id": tenant_id,
                     "app_name": f"App {i}",
                     "allowed_origins": []
                 })
+                for i in range(3)
+            ])
+            assert all(r.status_code == 201 for r in app_responses)
 
             # Create license
-            client.post("/admin/licenses", json={
+            await async_client.post("/admin/licenses", json={
                 "tenant_id": tenant_id,
                 "credits": 1000,
                 "expires_at": "2025-12-31T23:59:59Z"
             })
 
             # Delete tenant (should cascade)
-            delete_response = client.delete(f"/admin/tenants/{tenant_id}")
-            assert delete_response.status_code == 204
+            delete_response = await async_client.delete(f"/admin/tenants/{tenant_id}")
 
             # Verify delete was called (mock doesn't actually remove from stored_data for GET)
             # In real database, CASCADE DELETE would remove related records
             # For this mock test, we verify the delete call succeeded
             assert delete_response.status_code == 204
 
-    def test_concurrent_license_updates(self, client, mock_supabase):
+    def test_concurrent_license_updates(self, client, mock_supabase, make_tenant):
         """Test handling of concurrent license updates."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
 
             # Setup
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Concurrent Test",
-                "email": "concurrent@test.com"
-            })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = make_tenant("Concurrent Test", "concurrent@test.com")
 
             license_response = client.post("/admin/licenses", json={
                 "tenant_id": tenant_id,
@@ -912,50 +908,39 @@ class TestDataIntegrityScenarios:
             # (In real scenario with proper locking, this would be deterministic)
 
 
-class TestAPIKeySecurityWorkflow:
-    """E2E tests for API key security workflows."""
+class TestReportingWorkflows:
+    """E2E tests for reporting and analytics workflows."""
 
-    def test_api_key_rotation_workflow(self, client, mock_supabase):
-        """Test API key rotation for security compliance."""
-        with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
-             patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
+    async def test_tenant_usage_summary_workflow(self, async_client, mock_supabase):
+        """Test workflow for generating tenant usage summary."""
 
-            # Setup tenant with license
-            tenant_response = client.post("/admin/tenants", json={
-                "name": "Key Rotation Test",
-                "email": "rotation@test.com"
+        async def create_tenant_with_usage(name, initial_credits, remaining):
+            # Create tenant
+            tenant_resp = await async_client.post("/admin/tenants", json={
+                "name": name,
+                "email": f"{name.lower().replace(' ', '')}@test.com"
             })
-            tenant_id = tenant_response.json()["id"]
+            tenant_id = tenant_resp.json()["id"]
 
-            # Create initial license (with API key)
-            license_response = client.post("/admin/licenses", json={
+            # Create license with usage
+            license_resp = await async_client.post("/admin/licenses", json={
                 "tenant_id": tenant_id,
-                "credits": 1000,
+                "credits": initial_credits,
                 "expires_at": "2025-12-31T23:59:59Z"
             })
-            license_id = license_response.json()["id"]
-            original_key = license_response.json().get("license_key")
+            license_id = license_resp.json()["id"]
 
-            # Simulate key rotation by creating new license and deactivating old
-            # In real scenario, there would be a dedicated rotate endpoint
-
-            # Create new license
-            new_license_response = client.post("/admin/licenses", json={
-                "tenant_id": tenant_id,
-                "credits": 1000,
-                "expires_at": "2025-12-31T23:59:59Z"
+            # Update to show usage
+            await async_client.put(f"/admin/licenses/{license_id}", json={
+                "credits_remaining": remaining
             })
-            assert new_license_response.status_code == 201
-
-            # Deactivate old license
-            client.delete(f"/admin/licenses/{license_id}")
 
+            return {
+                "tenant_id": tenant_id,
+                "license_id": license_id,
+                "initial": initial_credits,
+            }
 
-class TestReportingWorkflows:
-    """E2E tests for reporting and analytics workflows."""
-
-    def test_tenant_usage_summary_workflow(self, client, mock_supabase):
-        """Test workflow for generating tenant usage summary."""
         with patch("app.api.admin.tenants.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.apps.get_supabase_client", return_value=mock_supabase), \
              patch("app.api.admin.licenses.get_supabase_client", return_value=mock_supabase):
@@ -967,35 +952,21 @@ class TestReportingWorkflows:
                 ("Low Usage Co", 1000, 900),      # Low usage
             ]
 
-            created_tenants = []
-            for name, initial_credits, remaining in tenants_data:
-                # Create tenant
-                tenant_resp = client.post("/admin/tenants", json={
-                    "name": name,
-                    "email": f"{name.lower().replace(' ', '')}@test.com"
-                })
-                tenant_id = tenant_resp.json()["id"]
-
-                # Create license with usage
-                license_resp = client.post("/admin/licenses", json={
-                    "tenant_id": tenant_id,
-                    "credits": initial_credits,
-                    "expires_at": "2025-12-31T23:59:59Z"
-                })
-                license_id = license_resp.json()["id"]
-
-                # Update to show usage
-                client.put(f"/admin/licenses/{license_id}", json={
-                    "credits_remaining": remaining
-                })
-
-                created_tenants.append({
-                    "tenant_id": tenant_id,
-                    "initial": initial_credits,
-                    "remaining": remaining,
-                    "used": initial_credits - remaining
-                })
+            created_tenants = await asyncio.gather(*[
+                create_tenant_with_usage(*tenant_data) for tenant_data in tenants_data
+            ])
+
+            # Usage as reported by the API after the credit updates
+            licenses = await asyncio.gather(*[
+                async_client.get(f"/admin/licenses/{t['license_id']}")
+                for t in created_tenants
+            ])
+            used = [
+                t["initial"] - resp.json()["credits_remaining"]
+                for t, resp in zip(created_tenants, licenses, strict=True)
+            ]
+            assert used == [8000, 2000, 100]
 
             # Verify all tenants exist
-            all_tenants = client.get("/admin/tenants").json()
+            all_tenants = (await async_client.get("/admin/tenants")).json()
             assert len(all_tenants) >= 3
@@ -6,13 +6,14 @@ import pytest
 from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from fastapi import HTTPException
 
-from app.core.security import LicenseInfo
+
+# None of these tests share loop state, so run them all on one event loop.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 class TestEmbeddingsEndpoint:
     """Tests for embeddings API endpoint."""
 
-    @pytest.mark.asyncio
     @patch("app.api.v1.embeddings.UsageService.log_usage")
     @patch("app.api.v1.embeddings.BillingService.deduct_credits")
     @patch("app.api.v1.embeddings.ScalewayProvider")
@@ -21,6 +22,7 @@ class TestEmbeddingsEndpoint:
         mock_scaleway_provider,
         mock_billing,
         mock_log_usage,
+        make_license_info,
     ):
         """Test successful embeddings API request."""
         from app.api.v1.embeddings import (
@@ -51,14 +53,7 @@ class TestEmbeddingsEndpoint:
         )
 
         # Create mock license
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
-        )
+        license = make_license_info()
 
         # Simulate endpoint logic
         embeddings = await mock_provider_instance.create_embeddings(
@@ -101,7 +96,6 @@ class TestEmbeddingsEndpoint:
         assert response.provider_used == "scaleway"
         assert response.eu_compliant is True
 
-    @pytest.mark.asyncio
     @patch("app.api.v1.embeddings.UsageService.log_usage")
     @patch("app.api.v1.embeddings.BillingService.deduct_credits")
     @patch("app.api.v1.embeddings.ScalewayProvider")
@@ -110,6 +104,7 @@ class TestEmbeddingsEndpoint:
         mock_scaleway_provider,
         mock_billing,
         mock_log_usage,
+        make_license_info,
     ):
         """Test embeddings with custom model."""
         from app.api.v1.embeddings import EmbeddingsRequest, EmbeddingsResponse, EmbeddingObject
@@ -126,14 +121,7 @@ class TestEmbeddingsEndpoint:
             provider="scaleway",
         )
 
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
-        )
+        license = make_license_info()
 
         embeddings = await mock_provider_instance.create_embeddings(
             request_body.input,
@@ -162,8 +150,7 @@ class TestEmbeddingsEndpoint:
 
         assert response.model == "bge-multilingual-gemma2"
 
-    @pytest.mark.asyncio
-    async def test_embeddings_with_invalid_provider(self):
+    async def test_embeddings_with_invalid_provider(self, make_license_info):
         """Test embeddings with invalid provider."""
         from app.api.v1.embeddings import EmbeddingsRequest, EMBEDDING_PROVIDERS
 
@@ -172,14 +159,7 @@ class TestEmbeddingsEndpoint:
             provider="invalid_provider",
         )
 
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
-        )
+        license = make_license_info()
 
         # Simulate validation logic
         if request_body.provider not in EMBEDDING_PROVIDERS:
@@ -192,7 +172,6 @@ class TestEmbeddingsEndpoint:
             assert exc_info.value.status_code == 400
             assert "does not support embeddings" in str(exc_info.value.detail)
 
-    @pytest.mark.asyncio
     @patch("app.api.v1.embeddings.UsageService.log_usage")
     @patch("app.api.v1.embeddings.BillingService.deduct_credits")
     @patch("app.api.v1.embeddings.ScalewayProvider")
@@ -201,6 +180,7 @@ class TestEmbeddingsEndpoint:
         mock_scaleway_provider,
         mock_billing,
         mock_log_usage,
+        make_license_info,
     ):
         """Test embeddings with EU-only and non-compliant provider."""
         from app.api.v1.embeddings import EmbeddingsRequest, EmbeddingsResponse, EmbeddingObject, EU_EMBEDDING_PROVIDERS
@@ -218,14 +198,7 @@ class TestEmbeddingsEndpoint:
             eu_only=True,
         )
 
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
-        )
+        license = make_license_info()
 
         # Scaleway is EU-compliant
         is_eu_compliant = request_body.provider in EU_EMBEDDING_PROVIDERS
@@ -252,13 +225,13 @@ class TestEmbeddingsEndpoint:
 
         assert response.eu_compliant is True
 
-    @pytest.mark.asyncio
     @patch("app.api.v1.embeddings.ScalewayProvider")
     @patch("app.api.v1.embeddings.BillingService.deduct_credits")
     async def test_embeddings_billing_failure(
         self,
         mock_billing,
         mock_scaleway_provider,
+        make_license_info,
     ):
         """Test embeddings with billing failure."""
         mock_provider_instance = AsyncMock()
@@ -270,14 +243,7 @@ class TestEmbeddingsEndpoint:
             detail="Insufficient credits"
         )
 
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=0,
-            is_active=True,
-        )
+        license = make_license_info(credits_remaining=0)
 
         # Simulate billing failure
         with pytest.raises(HTTPException) as exc_info:
@@ -285,7 +251,6 @@ class TestEmbeddingsEndpoint:
 
         assert exc_info.value.status_code == 402
 
-    @pytest.mark.asyncio
     @patch("app.api.v1.embeddings.UsageService.log_usage")
     @patch("app.api.v1.embeddings.BillingService.deduct_credits")
     @patch("app.api.v1.embeddings.ScalewayProvider")
@@ -294,29 +259,28 @@ class TestEmbeddingsEndpoint:
         mock_scaleway_provider,
         mock_billing,
         mock_log_usage,
+        make_license_info,
     ):
         """Test embeddings with multiple texts (up to limit)."""
         from app.api.v1.embeddings import EmbeddingsRequest, EmbeddingsResponse, EmbeddingObject
 
+        # Full batch (max 100 texts) at a realistic embedding dimension.
+        # The vectors are only read, so a single row is shared by all texts.
+        num_texts, dimensions = 100, 1536
+        vector = [0.1] * dimensions
+
         mock_provider_instance = AsyncMock()
-        mock_provider_instance.create_embeddings.return_value = [[0.1] * 10 for _ in range(10)]
+        mock_provider_instance.create_embeddings.return_value = [vector] * num_texts
         mock_scaleway_provider.return_value = mock_provider_instance
         mock_billing.return_value = None
         mock_log_usage.return_value = None
 
         request_body = EmbeddingsRequest(
-            input=[f"Text {i}" for i in range(10)],
+            input=[f"Text {i}" for i in range(num_texts)],
             provider="scaleway",
         )
 
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
-        )
+        license = make_license_info()
 
         embeddings = await mock_provider_instance.create_embeddings(
             request_body.input,
@@ -342,5 +306,7 @@ class TestEmbeddingsEndpoint:
             eu_compliant=True,
         )
 
-        assert len(response.data) == 10
-        assert response.credits_deducted == 50  # 10 texts * 5 credits
+        assert len(response.data) == num_texts
+        assert len(response.data[-1].embedding) == dimensions
+        assert response.data[-1].index == num_texts - 1
+        assert response.credits_deducted == 500  # 100 texts * 5 credits
@@ -8,6 +8,10 @@ Tests:
 
 Version: 0.6.1
 """
+import asyncio
+import logging
+import re
+
 import pytest
 from datetime import date
 from app.core.gdpr import (
@@ -15,10 +19,152 @@ from app.core.gdpr import (
     DataResidency,
     GDPRRegion,
     LegalBasis,
-    DataProcessingInfo,
 )
+from app.api.v1.generate import AVAILABLE_PROVIDERS, EU_PROVIDERS
+from app.api.v1.legal import (
+    get_terms_of_service,
+    get_privacy_policy,
+    get_data_processing_agreement,
+    get_legal_notice,
+    list_data_processors,
+)
+
+ALL_PROVIDERS = ("anthropic", "scaleway", "vertex_claude", "vertex_gemini")
+EU_PROVIDER_NAMES = ("scaleway", "vertex_claude", "vertex_gemini")
+
+SECURITY_RE = re.compile(r"\b(tls|encryption|aes)\b")
+RIGHTS_RE = re.compile(r"access|deletion|erasure|rectification")
+
+LOCATION_EXPECTATIONS = [
+    ("anthropic", ("United States",)),
+    ("scaleway", ("France", "Paris")),
+    ("vertex_claude", ("Germany", "Frankfurt")),
+    ("vertex_gemini", ("Germany", "Frankfurt")),
+]
+
+EXPECTED_PROCESSING_INFO = {
+    "anthropic": {
+        "provider": "anthropic",
+        "region": "us-east-1",
+        "data_residency": DataResidency.US,
+        "is_gdpr_compliant": False,
+        "legal_basis": LegalBasis.CONTRACT,
+        "data_retention_days": 30,
+        "processor_name": "Anthropic PBC",
+        "processor_location": "United States",
+    },
+    "scaleway": {
+        "provider": "scaleway",
+        "region": GDPRRegion.FR_PAR.value,
+        "data_residency": DataResidency.EU,
+        "is_gdpr_compliant": True,
+        "legal_basis": LegalBasis.CONTRACT,
+        "data_retention_days": 0,
+        "processor_name": "Scaleway SAS",
+        "processor_location": "France (Paris)",
+    },
+    "vertex_claude": {
+        "provider": "vertex_claude",
+        "region": GDPRRegion.EUROPE_WEST3.value,
+        "data_residency": DataResidency.EU,
+        "is_gdpr_compliant": True,
+        "legal_basis": LegalBasis.CONTRACT,
+        "data_retention_days": 0,
+        "processor_name": "Google Cloud Platform",
+        "processor_location": "Germany (Frankfurt)",
+    },
+    "vertex_gemini": {
+        "provider": "vertex_gemini",
+        "region": GDPRRegion.EUROPE_WEST3.value,
+        "data_residency": DataResidency.EU,
+        "is_gdpr_compliant": True,
+        "legal_basis": LegalBasis.CONTRACT,
+        "data_retention_days": 0,
+        "processor_name": "Google Cloud Platform",
+        "processor_location": "Germany (Frankfurt)",
+    },
+}
+
+
+def _project(info):
+    """Scalar fields of a DataProcessingInfo, for one-shot dict comparison."""
+    return {
+        "provider": info.provider,
+        "region": info.region,
+        "data_residency": info.data_residency,
+        "is_gdpr_compliant": info.is_gdpr_compliant,
+        "legal_basis": info.legal_basis,
+        "data_retention_days": info.data_retention_days,
+        "processor_name": info.processor_name,
+        "processor_location": info.processor_location,
+    }
+
+
+@pytest.fixture(scope="module")
+def gdpr_log():
+    """Records emitted by the GDPR module, captured by one module-wide handler."""
+    records = []
+
+    class _ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    gdpr_logger = logging.getLogger("app.core.gdpr")
+    handler = _ListHandler(logging.DEBUG)
+    previous_level = gdpr_logger.level
+    gdpr_logger.addHandler(handler)
+    gdpr_logger.setLevel(logging.DEBUG)
+    yield records
+    gdpr_logger.removeHandler(handler)
+    gdpr_logger.setLevel(previous_level)
+
+
+@pytest.fixture(autouse=True)
+def _reset_gdpr_log(gdpr_log):
+    gdpr_log.clear()
+
+
+@pytest.fixture(scope="session")
+def gdpr_info_cache():
+    """Processing info for every known provider, built once per session."""
+    return {
+        provider: GDPRComplianceChecker.get_processing_info(provider)
+        for provider in ALL_PROVIDERS
+    }
+
+
+@pytest.fixture(scope="session")
+def fallback_anthropic_eu():
+    """Fallback chosen for Anthropic under eu_only, computed once per session."""
+    return GDPRComplianceChecker.get_fallback_provider("anthropic", eu_only=True)
+
+
+@pytest.fixture(scope="session")
+def legal_docs():
+    """Legal documents rendered once per session, keyed by document and language."""
+    keys = (
+        "tos_de", "tos_en", "priv_de", "priv_en",
+        "avv_de", "avv_en", "impressum_de", "impressum_en", "processors",
+    )
+
+    async def render():
+        return await asyncio.gather(
+            get_terms_of_service(language="de"),
+            get_terms_of_service(language="en"),
+            get_privacy_policy(language="de"),
+            get_privacy_policy(language="en"),
+            get_data_processing_agreement(language="de"),
+            get_data_processing_agreement(language="en"),
+            get_legal_notice(language="de"),
+            get_legal_notice(language="en"),
+            list_data_processors(),
+        )
+
+    docs = asyncio.run(render())
+    return dict(zip(keys, docs, strict=True))
 
 
+@pytest.mark.xdist_group(name="gdpr_checker")
 class TestGDPRComplianceChecker:
     """Test GDPR-001: EU Data Residency Configuration."""
 
@@ -40,23 +186,15 @@ class TestGDPRComplianceChecker:
         """Test retrieving list of GDPR-compliant providers."""
         compliant = GDPRComplianceChecker.get_compliant_providers()
 
-        assert isinstance(compliant, list)
+        assert isinstance(compliant, tuple)
         assert len(compliant) == 3
-        assert "scaleway" in compliant
-        assert "vertex_claude" in compliant
-        assert "vertex_gemini" in compliant
-        assert "anthropic" not in compliant
+        assert set(compliant) == {"scaleway", "vertex_claude", "vertex_gemini"}
 
-    def test_validate_request_eu_only_with_eu_provider(self):
+    @pytest.mark.parametrize("provider", ["scaleway", "vertex_claude"])
+    def test_validate_request_eu_only_with_eu_provider(self, provider):
         """Test that EU providers pass validation when eu_only=True."""
         is_valid, message = GDPRComplianceChecker.validate_request(
-            "scaleway", eu_only=True
-        )
-        assert is_valid is True
-        assert message == "OK"
-
-        is_valid, message = GDPRComplianceChecker.validate_request(
-            "vertex_claude", eu_only=True
+            provider, eu_only=True
         )
         assert is_valid is True
         assert message == "OK"
@@ -84,61 +222,23 @@ class TestGDPRComplianceChecker:
         assert is_valid is True
         assert message == "OK"
 
-    def test_get_processing_info_anthropic(self):
-        """Test data processing info for Anthropic (US provider)."""
-        info = GDPRComplianceChecker.get_processing_info("anthropic")
-
-        assert isinstance(info, DataProcessingInfo)
-        assert info.provider == "anthropic"
-        assert info.data_residency == DataResidency.US
-        assert info.is_gdpr_compliant is False
-        assert info.legal_basis == LegalBasis.CONTRACT.value
-        assert info.data_retention_days == 30
-        assert info.processor_name == "Anthropic PBC"
-        assert info.processor_location == "United States"
+    @pytest.mark.parametrize("provider", ALL_PROVIDERS)
+    def test_get_processing_info(self, provider, gdpr_info_cache):
+        """Test data processing info for each US and EU provider."""
+        info = gdpr_info_cache[provider]
+
+        assert _project(info) == EXPECTED_PROCESSING_INFO[provider]
         assert len(info.sub_processors) > 0
         assert len(info.security_measures) > 0
         assert len(info.data_subject_rights) > 0
+        if info.is_gdpr_compliant:
+            assert "ISO 27001" in str(info.security_measures)
 
-    def test_get_processing_info_scaleway(self):
-        """Test data processing info for Scaleway (EU provider)."""
-        info = GDPRComplianceChecker.get_processing_info("scaleway")
-
-        assert isinstance(info, DataProcessingInfo)
-        assert info.provider == "scaleway"
-        assert info.region == GDPRRegion.FR_PAR.value
-        assert info.data_residency == DataResidency.EU
-        assert info.is_gdpr_compliant is True
-        assert info.legal_basis == LegalBasis.CONTRACT.value
-        assert info.data_retention_days == 0
-        assert info.processor_name == "Scaleway SAS"
-        assert info.processor_location == "France (Paris)"
-        assert "France" in info.processor_location or "Paris" in info.processor_location
-        assert len(info.security_measures) > 0
-
-    def test_get_processing_info_vertex_claude(self):
-        """Test data processing info for Vertex AI Claude (EU provider)."""
-        info = GDPRComplianceChecker.get_processing_info("vertex_claude")
-
-        assert isinstance(info, DataProcessingInfo)
-        assert info.provider == "vertex_claude"
-        assert info.region == GDPRRegion.EUROPE_WEST3.value
-        assert info.data_residency == DataResidency.EU
-        assert info.is_gdpr_compliant is True
-        assert info.data_retention_days == 0
-        assert "Germany" in info.processor_location or "Frankfurt" in info.processor_location
-        assert "ISO 27001" in str(info.security_measures)
-
-    def test_get_processing_info_vertex_gemini(self):
-        """Test data processing info for Vertex AI Gemini (EU provider)."""
-        info = GDPRComplianceChecker.get_processing_info("vertex_gemini")
-
-        assert isinstance(info, DataProcessingInfo)
-        assert info.provider == "vertex_gemini"
-        assert info.region == GDPRRegion.EUROPE_WEST3.value
-        assert info.data_residency == DataResidency.EU
-        assert info.is_gdpr_compliant is True
-        assert info.data_retention_days == 0
+    @pytest.mark.parametrize("provider,subs", LOCATION_EXPECTATIONS)
+    def test_processor_location(self, provider, subs, gdpr_info_cache):
+        """Test that each processor location names the expected country or city."""
+        location = gdpr_info_cache[provider].processor_location
+        assert any(sub in location for sub in subs)
 
     def test_get_processing_info_invalid_provider(self):
         """Test that invalid provider raises ValueError."""
@@ -148,26 +248,20 @@ class TestGDPRComplianceChecker:
         assert "Unknown provider" in str(exc_info.value)
         assert "invalid_provider" in str(exc_info.value)
 
-    def test_get_fallback_provider_eu_only_non_compliant(self):
-        """Test that fallback provider is returned for non-EU provider when eu_only=True."""
-        fallback = GDPRComplianceChecker.get_fallback_provider(
-            "anthropic", eu_only=True
-        )
+    def test_get_fallback_provider_eu_only_non_compliant(self, fallback_anthropic_eu):
+        """Test that a non-EU provider gets a fallback when eu_only=True."""
+        fallback = fallback_anthropic_eu
 
         assert fallback is not None
         assert fallback in ["vertex_claude", "scaleway", "vertex_gemini"]
         # Should prefer vertex_claude
         assert fallback == "vertex_claude"
 
-    def test_get_fallback_provider_eu_only_compliant(self):
+    @pytest.mark.parametrize("provider", ["scaleway", "vertex_claude"])
+    def test_get_fallback_provider_eu_only_compliant(self, provider):
         """Test that no fallback is needed for EU provider when eu_only=True."""
         fallback = GDPRComplianceChecker.get_fallback_provider(
-            "scaleway", eu_only=True
-        )
-        assert fallback is None
-
-        fallback = GDPRComplianceChecker.get_fallback_provider(
-            "vertex_claude", eu_only=True
+            provider, eu_only=True
         )
         assert fallback is None
 
@@ -178,33 +272,30 @@ class TestGDPRComplianceChecker:
         )
         assert fallback is None
 
-    def test_log_compliance_info_logs_correctly(self, caplog):
+    def test_log_compliance_info_logs_correctly(self, gdpr_log):
         """Test that compliance info is logged correctly."""
-        import logging
-
-        with caplog.at_level(logging.INFO):
-            GDPRComplianceChecker.log_compliance_info(
-                provider="scaleway", eu_only=True, fallback_used=False
-            )
+        GDPRComplianceChecker.log_compliance_info(
+            provider="scaleway", eu_only=True, fallback_used=False
+        )
 
         # Check that log was created
-        assert len(caplog.records) > 0
+        assert len(gdpr_log) > 0
 
         # Check log content
-        log_message = caplog.records[0].message
+        log_message = gdpr_log[0].getMessage()
         assert "GDPR Compliance Check" in log_message
         assert "provider=scaleway" in log_message
         assert "eu_only=True" in log_message
         assert "eu_compliant=True" in log_message
         assert "fallback_used=False" in log_message
 
-    def test_all_eu_providers_have_metadata(self):
+    @pytest.mark.parametrize("provider", GDPRComplianceChecker.EU_COMPLIANT_PROVIDERS)
+    def test_all_eu_providers_have_metadata(self, provider, gdpr_info_cache):
         """Test that all EU-compliant providers have metadata defined."""
-        for provider in GDPRComplianceChecker.EU_COMPLIANT_PROVIDERS:
-            # Should not raise ValueError
-            info = GDPRComplianceChecker.get_processing_info(provider)
-            assert info.is_gdpr_compliant is True
-            assert info.data_residency == DataResidency.EU
+        # Metadata must exist for every EU provider
+        info = gdpr_info_cache[provider]
+        assert info.is_gdpr_compliant is True
+        assert info.data_residency == DataResidency.EU
 
     def test_data_residency_enum(self):
         """Test DataResidency enum values."""
@@ -228,9 +319,9 @@ class TestGDPRComplianceChecker:
         assert LegalBasis.PUBLIC_INTEREST.value == "public_interest"
         assert LegalBasis.LEGITIMATE_INTERESTS.value == "legitimate_interests"
 
-    def test_data_processing_info_all_fields(self):
+    def test_data_processing_info_all_fields(self, gdpr_info_cache):
         """Test that DataProcessingInfo contains all required fields."""
-        info = GDPRComplianceChecker.get_processing_info("scaleway")
+        info = gdpr_info_cache["scaleway"]
 
         # Verify all fields are present and non-empty
         assert info.provider
@@ -241,157 +332,155 @@ class TestGDPRComplianceChecker:
         assert isinstance(info.data_retention_days, int)
         assert info.processor_name
         assert info.processor_location
-        assert isinstance(info.sub_processors, list)
-        assert isinstance(info.security_measures, list)
-        assert isinstance(info.data_subject_rights, list)
+        assert isinstance(info.sub_processors, tuple)
+        assert isinstance(info.security_measures, tuple)
+        assert isinstance(info.data_subject_rights, tuple)
 
-    def test_security_measures_include_encryption(self):
+    def test_security_measures_include_encryption(self, gdpr_info_cache):
         """Test that all providers include encryption in security measures."""
-        for provider in ["anthropic", "scaleway", "vertex_claude", "vertex_gemini"]:
-            info = GDPRComplianceChecker.get_processing_info(provider)
-            security_text = " ".join(info.security_measures).lower()
+        for info in gdpr_info_cache.values():
+            security_text = info.security_text_lc
+            hits = set(SECURITY_RE.findall(security_text))
 
-            assert "tls" in security_text or "encryption" in security_text
-            assert "aes" in security_text or "encryption at rest" in security_text
+            assert "tls" in hits or "encryption" in hits
+            assert "aes" in hits or "encryption at rest" in security_text
 
-    def test_eu_providers_have_zero_or_low_retention(self):
+    @pytest.mark.parametrize("provider", EU_PROVIDER_NAMES)
+    def test_eu_providers_have_zero_or_low_retention(self, provider, gdpr_info_cache):
         """Test that EU providers have appropriate data retention policies."""
-        for provider in ["scaleway", "vertex_claude", "vertex_gemini"]:
-            info = GDPRComplianceChecker.get_processing_info(provider)
-            # EU providers should have 0 retention (no data stored)
-            assert info.data_retention_days == 0
+        # EU providers should have 0 retention (no data stored)
+        assert gdpr_info_cache[provider].data_retention_days == 0
 
-    def test_data_subject_rights_comprehensive(self):
+    @pytest.mark.parametrize("provider", EU_PROVIDER_NAMES)
+    def test_data_subject_rights_comprehensive(self, provider, gdpr_info_cache):
         """Test that EU providers support comprehensive data subject rights."""
-        for provider in ["scaleway", "vertex_claude", "vertex_gemini"]:
-            info = GDPRComplianceChecker.get_processing_info(provider)
+        rights_text = gdpr_info_cache[provider].rights_text_lc
 
-            # Should support at least access, deletion, rectification
-            rights_text = " ".join(info.data_subject_rights).lower()
-            assert "access" in rights_text
-            assert "deletion" in rights_text or "erasure" in rights_text
-            assert "rectification" in rights_text
+        # Should support at least access, deletion, rectification
+        hits = set(RIGHTS_RE.findall(rights_text))
+        assert "access" in hits
+        assert "deletion" in hits or "erasure" in hits
+        assert "rectification" in hits
 
 
+@pytest.mark.xdist_group(name="legal_api")
 class TestLegalDocumentsAPI:
     """Test GDPR-002: Data Processing Agreement and Legal Documents API."""
 
-    @pytest.mark.asyncio
-    async def test_get_terms_of_service_german(self):
-        """Test AGB endpoint returns German terms."""
-        from app.api.v1.legal import get_terms_of_service
-
-        doc = await get_terms_of_service(language="de")
-
-        assert doc.title == "Allgemeine Geschäftsbedingungen"
+    @staticmethod
+    def _assert_document(doc, language, expected_title, required_substrings):
+        """Check title, language and that each group of alternatives matches."""
+        assert doc.title == expected_title
         assert doc.version == "1.0"
         assert isinstance(doc.effective_date, date)
-        assert doc.language == "de"
-        assert "Geltungsbereich" in doc.content
-        assert "DSGVO" in doc.content or "Datenschutz" in doc.content
-
-    @pytest.mark.asyncio
-    async def test_get_terms_of_service_english(self):
-        """Test AGB endpoint returns English terms."""
-        from app.api.v1.legal import get_terms_of_service
-
-        doc = await get_terms_of_service(language="en")
-
-        assert doc.title == "Terms of Service"
-        assert doc.version == "1.0"
-        assert doc.language == "en"
-        assert "Scope" in doc.content or "Service" in doc.content
-
-    @pytest.mark.asyncio
-    async def test_get_privacy_policy_german(self):
-        """Test Datenschutz endpoint returns German privacy policy."""
-        from app.api.v1.legal import get_privacy_policy
-
-        doc = await get_privacy_policy(language="de")
-
-        assert doc.title == "Datenschutzerklärung"
-        assert doc.language == "de"
-        assert "Verantwortlicher" in doc.content
-        assert "PII-Shield" in doc.content or "personenbezogene Daten" in doc.content
-        assert "DSGVO" in doc.content
-
-    @pytest.mark.asyncio
-    async def test_get_privacy_policy_english(self):
-        """Test Privacy Policy endpoint returns English policy."""
-        from app.api.v1.legal import get_privacy_policy
-
-        doc = await get_privacy_policy(language="en")
-
-        assert doc.title == "Privacy Policy"
-        assert doc.language == "en"
-        assert "Privacy" in doc.content or "Data" in doc.content
-        assert "PII Shield" in doc.content or "personal data" in doc.content
-
-    @pytest.mark.asyncio
-    async def test_get_data_processing_agreement_german(self):
-        """Test AVV endpoint returns German DPA with processor info."""
-        from app.api.v1.legal import get_data_processing_agreement
+        assert doc.language == language
+        for alternatives in required_substrings:
+            assert any(s in doc.content for s in alternatives), alternatives
+
+    @pytest.mark.parametrize(
+        "language,expected_title,required_substrings",
+        [
+            (
+                "de",
+                "Allgemeine Geschäftsbedingungen",
+                [("Geltungsbereich",), ("DSGVO", "Datenschutz")],
+            ),
+            ("en", "Terms of Service", [("Scope", "Service")]),
+        ],
+    )
+    def test_get_terms_of_service(
+        self, legal_docs, language, expected_title, required_substrings
+    ):
+        """Test AGB endpoint returns terms in the requested language."""
+        self._assert_document(
+            legal_docs[f"tos_{language}"], language, expected_title, required_substrings
+        )
 
-        doc = await get_data_processing_agreement(language="de")
+    @pytest.mark.parametrize(
+        "language,expected_title,required_substrings",
+        [
+            (
+                "de",
+                "Datenschutzerklärung",
+                [
+                    ("Verantwortlicher",),
+                    ("PII-Shield", "personenbezogene Daten"),
+                    ("DSGVO",),
+                ],
+            ),
+            (
+                "en",
+                "Privacy Policy",
+                [("Privacy", "Data"), ("PII Shield", "personal data")],
+            ),
+        ],
+    )
+    def test_get_privacy_policy(
+        self, legal_docs, language, expected_title, required_substrings
+    ):
+        """Test Datenschutz endpoint returns the privacy policy per language."""
+        self._assert_document(
+            legal_docs[f"priv_{language}"],
+            language,
+            expected_title,
+            required_substrings,
+        )
 
-        assert doc.title == "Auftragsverarbeitungsvertrag"
-        assert doc.language == "de"
-        assert "Art. 28 DSGVO" in doc.content
-        assert "Auftragsverarbeiter" in doc.content or "Sub-Auftragsverarbeiter" in doc.content
+    @pytest.mark.parametrize(
+        "language,expected_title,required_substrings",
+        [
+            (
+                "de",
+                "Auftragsverarbeitungsvertrag",
+                [
+                    ("Art. 28 DSGVO",),
+                    ("Auftragsverarbeiter", "Sub-Auftragsverarbeiter"),
+                ],
+            ),
+            (
+                "en",
+                "Data Processing Agreement",
+                [("Art. 28 GDPR", "Article 28")],
+            ),
+        ],
+    )
+    def test_get_data_processing_agreement(
+        self, legal_docs, language, expected_title, required_substrings
+    ):
+        """Test AVV endpoint returns the DPA with processor info per language."""
+        doc = legal_docs[f"avv_{language}"]
+        self._assert_document(doc, language, expected_title, required_substrings)
 
         # Check processors are included
         assert len(doc.processors) > 0
         assert any(p.provider == "scaleway" for p in doc.processors)
         assert any(p.is_gdpr_compliant for p in doc.processors)
 
-    @pytest.mark.asyncio
-    async def test_get_data_processing_agreement_english(self):
-        """Test DPA endpoint returns English agreement."""
-        from app.api.v1.legal import get_data_processing_agreement
-
-        doc = await get_data_processing_agreement(language="en")
-
-        assert doc.title == "Data Processing Agreement"
-        assert doc.language == "en"
-        assert "Art. 28 GDPR" in doc.content or "Article 28" in doc.content
-        assert len(doc.processors) > 0
-
-    @pytest.mark.asyncio
-    async def test_get_legal_notice_german(self):
-        """Test Impressum endpoint returns German legal notice."""
-        from app.api.v1.legal import get_legal_notice
-
-        doc = await get_legal_notice(language="de")
-
-        assert doc.title == "Impressum"
-        assert doc.language == "de"
-        assert "§ 5 TMG" in doc.content or "Angaben gemäß" in doc.content
-
-    @pytest.mark.asyncio
-    async def test_get_legal_notice_english(self):
-        """Test Legal Notice endpoint returns English notice."""
-        from app.api.v1.legal import get_legal_notice
-
-        doc = await get_legal_notice(language="en")
-
-        assert doc.title == "Legal Notice"
-        assert doc.language == "en"
-        assert "Legal" in doc.content
+    @pytest.mark.parametrize(
+        "language,expected_title,required_substrings",
+        [
+            ("de", "Impressum", [("§ 5 TMG", "Angaben gemäß")]),
+            ("en", "Legal Notice", [("Legal",)]),
+        ],
+    )
+    def test_get_legal_notice(
+        self, legal_docs, language, expected_title, required_substrings
+    ):
+        """Test Impressum endpoint returns the legal notice per language."""
+        self._assert_document(
+            legal_docs[f"impressum_{language}"],
+            language,
+            expected_title,
+            required_substrings,
+        )
 
-    @pytest.mark.asyncio
-    async def test_list_data_processors(self):
+    def test_list_data_processors(self, legal_docs):
         """Test processors endpoint lists all data processors."""
-        from app.api.v1.legal import list_data_processors
-
-        processors = await list_data_processors()
+        processors = legal_docs["processors"]
 
         assert len(processors) == 4
-        providers = [p.provider for p in processors]
-
-        assert "anthropic" in providers
-        assert "scaleway" in providers
-        assert "vertex_claude" in providers
-        assert "vertex_gemini" in providers
+        providers = {p.provider for p in processors}
+        assert providers == set(ALL_PROVIDERS)
 
         # Check EU providers are marked as compliant
         for processor in processors:
@@ -402,26 +491,17 @@ class TestLegalDocumentsAPI:
                 assert processor.is_gdpr_compliant is False
                 assert processor.data_residency == DataResidency.US
 
-    @pytest.mark.asyncio
-    async def test_avv_contains_all_providers(self):
+    def test_avv_contains_all_providers(self, legal_docs):
         """Test that AVV document lists all AI providers."""
-        from app.api.v1.legal import get_data_processing_agreement
-
-        doc = await get_data_processing_agreement(language="de")
+        doc = legal_docs["avv_de"]
 
         # Check processors
-        provider_names = [p.provider for p in doc.processors]
-        assert "anthropic" in provider_names
-        assert "scaleway" in provider_names
-        assert "vertex_claude" in provider_names
-        assert "vertex_gemini" in provider_names
-
-    @pytest.mark.asyncio
-    async def test_avv_processor_details_complete(self):
-        """Test that AVV processors have complete information."""
-        from app.api.v1.legal import get_data_processing_agreement
+        provider_names = {p.provider for p in doc.processors}
+        assert provider_names == set(ALL_PROVIDERS)
 
-        doc = await get_data_processing_agreement(language="de")
+    def test_avv_processor_details_complete(self, legal_docs):
+        """Test that AVV processors have complete information."""
+        doc = legal_docs["avv_de"]
 
         for processor in doc.processors:
             # All required fields must be present
@@ -436,10 +516,11 @@ class TestLegalDocumentsAPI:
             assert len(processor.data_subject_rights) > 0
 
 
+@pytest.mark.xdist_group(name="model_selection")
 class TestGDPRModelSelection:
     """Test GDPR-003: Model Selection Logic with EU-only enforcement."""
 
-    def test_validate_and_fallback_eu_only_anthropic(self):
+    def test_validate_and_fallback_eu_only_anthropic(self, fallback_anthropic_eu):
         """Test automatic fallback from Anthropic to EU provider."""
         # Validate request
         is_valid, error_msg = GDPRComplianceChecker.validate_request(
@@ -448,10 +529,7 @@ class TestGDPRModelSelection:
         assert is_valid is False
 
         # Get fallback
-        fallback = GDPRComplianceChecker.get_fallback_provider(
-            "anthropic", eu_only=True
-        )
-        assert fallback == "vertex_claude"  # Should prefer vertex_claude
+        assert fallback_anthropic_eu == "vertex_claude"  # Should prefer vertex_claude
 
     def test_validate_and_fallback_eu_only_scaleway(self):
         """Test no fallback needed for Scaleway when eu_only=True."""
@@ -465,63 +543,51 @@ class TestGDPRModelSelection:
         )
         assert fallback is None
 
-    def test_fallback_order(self):
+    def test_fallback_order(self, fallback_anthropic_eu):
         """Test that fallback follows correct priority order."""
         # Fallback order should be: vertex_claude > scaleway > vertex_gemini
-        fallback = GDPRComplianceChecker.get_fallback_provider(
-            "anthropic", eu_only=True
-        )
-        assert fallback == "vertex_claude"
+        assert fallback_anthropic_eu == "vertex_claude"
 
-    def test_logging_compliance_with_fallback(self, caplog):
+    def test_logging_compliance_with_fallback(self, gdpr_log):
         """Test that fallback usage is logged."""
-        import logging
-
-        with caplog.at_level(logging.WARNING):
-            fallback = GDPRComplianceChecker.get_fallback_provider(
-                "anthropic", eu_only=True
-            )
+        GDPRComplianceChecker.get_fallback_provider("anthropic", eu_only=True)
 
         # Should log warning about non-compliant provider
-        assert any("not EU-compliant" in record.message for record in caplog.records)
-        assert any("vertex_claude" in record.message for record in caplog.records)
+        joined = "\n".join(record.getMessage() for record in gdpr_log)
+        assert "not EU-compliant" in joined
+        assert "vertex_claude" in joined
 
 
+@pytest.mark.xdist_group(name="integration")
 class TestGDPRIntegration:
     """Integration tests for GDPR features."""
 
-    def test_all_providers_have_complete_metadata(self):
+    def test_all_providers_have_complete_metadata(self, gdpr_info_cache):
         """Test that all providers in AVAILABLE_PROVIDERS have GDPR metadata."""
-        from app.api.v1.generate import AVAILABLE_PROVIDERS
-
-        for provider in AVAILABLE_PROVIDERS.keys():
-            # Should not raise ValueError
-            info = GDPRComplianceChecker.get_processing_info(provider)
-            assert info is not None
-            assert info.provider == provider
+        assert set(AVAILABLE_PROVIDERS) <= set(gdpr_info_cache)
+        for provider in AVAILABLE_PROVIDERS:
+            assert gdpr_info_cache[provider].provider == provider
 
     def test_eu_providers_consistency(self):
         """Test consistency between EU_PROVIDERS constant and GDPR checker."""
-        from app.api.v1.generate import EU_PROVIDERS
-
-        compliant = GDPRComplianceChecker.get_compliant_providers()
-
         # Should be identical
-        assert set(EU_PROVIDERS) == set(compliant)
+        assert frozenset(EU_PROVIDERS) == frozenset(
+            GDPRComplianceChecker.get_compliant_providers()
+        )
 
-    def test_gdpr_metadata_quality(self):
+    @pytest.mark.parametrize("provider", ALL_PROVIDERS)
+    def test_gdpr_metadata_quality(self, provider, gdpr_info_cache):
         """Test quality of GDPR metadata for all providers."""
-        for provider in ["anthropic", "scaleway", "vertex_claude", "vertex_gemini"]:
-            info = GDPRComplianceChecker.get_processing_info(provider)
+        info = gdpr_info_cache[provider]
 
-            # Security measures should be comprehensive
-            assert len(info.security_measures) >= 3
+        # Security measures should be comprehensive
+        assert len(info.security_measures) >= 3
 
-            # Data subject rights should be specified
-            assert len(info.data_subject_rights) >= 3
+        # Data subject rights should be specified
+        assert len(info.data_subject_rights) >= 3
 
-            # Sub-processors should be listed
-            assert len(info.sub_processors) >= 1
+        # Sub-processors should be listed
+        assert len(info.sub_processors) >= 1
 
-            # Legal basis should be valid
-            assert info.legal_basis in [basis.value for basis in LegalBasis]
+        # Legal basis should be valid
+        assert info.legal_basis in LegalBasis
@@ -3,23 +3,104 @@ Unit tests for GDPR API endpoints.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from datetime import datetime, timezone
+from unittest.mock import Mock
 
 from fastapi import HTTPException
 
-from app.core.security import LicenseInfo
+from app.api.v1 import gdpr as gdpr_api
+from app.api.v1.gdpr import (
+    AcceptDPARequest,
+    AcceptDPAResponse,
+    ComplianceStatusResponse,
+    DPAInfoResponse,
+    ProcessingInfoResponse,
+)
+from app.core.gdpr import (
+    DataProcessingInfo,
+    DataResidency,
+    GDPRComplianceChecker,
+    LegalBasis,
+)
+from app.tests.fakes.license import make_license_info
+
+
+# Canonical processing info returned by the mocked checker, built once
+_PROCESSING_INFO = {
+    "scaleway": DataProcessingInfo(
+        provider="scaleway",
+        region="fr-par",
+        data_residency=DataResidency.EU,
+        is_gdpr_compliant=True,
+        legal_basis=LegalBasis.CONTRACT,
+        data_retention_days=0,
+        processor_name="Scaleway SAS",
+        processor_location="France (Paris)",
+        sub_processors=(),
+        security_measures=(),
+        data_subject_rights=(),
+    ),
+    "anthropic": DataProcessingInfo(
+        provider="anthropic",
+        region="us-east-1",
+        data_residency=DataResidency.US,
+        is_gdpr_compliant=False,
+        legal_basis=LegalBasis.CONTRACT,
+        data_retention_days=30,
+        processor_name="Anthropic PBC",
+        processor_location="United States",
+        sub_processors=(),
+        security_measures=(),
+        data_subject_rights=(),
+    ),
+    "vertex_claude": DataProcessingInfo(
+        provider="vertex_claude",
+        region="europe-west3",
+        data_residency=DataResidency.EU,
+        is_gdpr_compliant=True,
+        legal_basis=LegalBasis.CONTRACT,
+        data_retention_days=0,
+        processor_name="Google Cloud Platform",
+        processor_location="Germany (Frankfurt)",
+        sub_processors=(),
+        security_measures=(),
+        data_subject_rights=(),
+    ),
+    "vertex_gemini": DataProcessingInfo(
+        provider="vertex_gemini",
+        region="europe-west3",
+        data_residency=DataResidency.EU,
+        is_gdpr_compliant=True,
+        legal_basis=LegalBasis.CONTRACT,
+        data_retention_days=0,
+        processor_name="Google Cloud Platform",
+        processor_location="Germany (Frankfurt)",
+        sub_processors=(),
+        security_measures=(),
+        data_subject_rights=(),
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def gdpr_module():
+    """The GDPR router module, imported once for the session."""
+    return gdpr_api
+
+
+@pytest.fixture(scope="session")
+def license_info():
+    """Active test license shared by the endpoint tests."""
+    return make_license_info()
 
 
 class TestGDPREndpoints:
     """Tests for GDPR compliance endpoints."""
 
-    @pytest.mark.asyncio
-    @patch("app.api.v1.gdpr.GDPRComplianceChecker.get_dpa_info")
-    async def test_get_dpa_info_success(self, mock_get_dpa_info):
+    def test_get_dpa_info_success(self, gdpr_module, monkeypatch, license_info):
         """Test successful DPA info retrieval."""
-        from app.api.v1.gdpr import DPAInfoResponse
 
-        mock_get_dpa_info.return_value = {
+        mock_get_dpa_info = Mock(return_value={
             "tenant_id": "test-tenant",
             "dpa_accepted": False,
             "dpa_accepted_at": None,
@@ -38,19 +119,15 @@ class TestGDPREndpoints:
             "data_residency_options": [
                 {"value": "eu_only", "label": "EU Only (GDPR Compliant)"},
             ],
-        }
-
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
+        })
+        monkeypatch.setattr(
+            gdpr_module.GDPRComplianceChecker, "get_dpa_info", mock_get_dpa_info
         )
 
         # Simulate getting DPA info
-        dpa_info = mock_get_dpa_info(str(license.tenant_id))
+        dpa_info = gdpr_module.GDPRComplianceChecker.get_dpa_info(
+            str(license_info.tenant_id)
+        )
 
         response = DPAInfoResponse(**dpa_info)
 
@@ -60,26 +137,14 @@ class TestGDPREndpoints:
         assert response.eu_only_enabled is False
         assert len(response.processor_info["available_processors"]) > 0
 
-    @pytest.mark.asyncio
-    async def test_accept_dpa_success(self):
+    def test_accept_dpa_success(self, license_info):
         """Test successful DPA acceptance."""
-        from app.api.v1.gdpr import AcceptDPARequest, AcceptDPAResponse
-        from datetime import datetime, timezone
 
         request_body = AcceptDPARequest(
             accepted=True,
             version="1.0"
         )
 
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
-        )
-
         # Simulate the accept logic
         if not request_body.accepted:
             raise HTTPException(status_code=400, detail="DPA must be accepted")
@@ -96,25 +161,14 @@ class TestGDPREndpoints:
         assert "accepted successfully" in response.message
         assert response.dpa_accepted_at is not None
 
-    @pytest.mark.asyncio
-    async def test_accept_dpa_not_accepted(self):
+    def test_accept_dpa_not_accepted(self, license_info):
         """Test DPA acceptance with accepted=False."""
-        from app.api.v1.gdpr import AcceptDPARequest
 
         request_body = AcceptDPARequest(
             accepted=False,
             version="1.0"
         )
 
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
-        )
-
         # Simulate the accept logic
         if not request_body.accepted:
             with pytest.raises(HTTPException) as exc_info:
@@ -126,19 +180,17 @@ class TestGDPREndpoints:
             assert exc_info.value.status_code == 400
             assert "must be accepted" in str(exc_info.value.detail)
 
-    @pytest.mark.asyncio
-    @patch("app.api.v1.gdpr.GDPRComplianceChecker.get_processing_info")
-    async def test_get_processing_info_success(self, mock_get_processing_info):
+    def test_get_processing_info_success(
+        self, gdpr_module, monkeypatch, license_info
+    ):
         """Test successful processing info retrieval."""
-        from app.core.gdpr import DataProcessingInfo, DataResidency
-        from app.api.v1.gdpr import ProcessingInfoResponse
 
         mock_processing_info = DataProcessingInfo(
             provider="scaleway",
             region="fr-par",
             data_residency=DataResidency.EU,
             is_gdpr_compliant=True,
-            legal_basis="contract",
+            legal_basis=LegalBasis.CONTRACT,
             data_retention_days=0,
             processor_name="Scaleway SAS",
             processor_location="France (Paris)",
@@ -150,26 +202,23 @@ class TestGDPREndpoints:
             data_subject_rights=["Right to access", "Right to deletion"],
         )
 
-        mock_get_processing_info.return_value = mock_processing_info
-
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
+        monkeypatch.setattr(
+            gdpr_module.GDPRComplianceChecker,
+            "get_processing_info",
+            Mock(return_value=mock_processing_info),
         )
 
         # Simulate getting processing info
-        processing_info = mock_get_processing_info("scaleway")
+        processing_info = gdpr_module.GDPRComplianceChecker.get_processing_info(
+            "scaleway"
+        )
 
         response = ProcessingInfoResponse(
             provider=processing_info.provider,
             region=processing_info.region,
             data_residency=processing_info.data_residency.value,
             is_gdpr_compliant=processing_info.is_gdpr_compliant,
-            legal_basis=processing_info.legal_basis,
+            legal_basis=processing_info.legal_basis.value,
             data_retention_days=processing_info.data_retention_days,
             processor_name=processing_info.processor_name,
             processor_location=processing_info.processor_location,
@@ -186,106 +235,50 @@ class TestGDPREndpoints:
         assert len(response.security_measures) > 0
         assert len(response.data_subject_rights) > 0
 
-    @pytest.mark.asyncio
-    @patch("app.api.v1.gdpr.GDPRComplianceChecker.get_processing_info")
-    async def test_get_processing_info_invalid_provider(self, mock_get_processing_info):
+    def test_get_processing_info_invalid_provider(
+        self, gdpr_module, monkeypatch, license_info
+    ):
         """Test processing info with invalid provider."""
-        mock_get_processing_info.side_effect = ValueError("Unknown provider")
-
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
+        monkeypatch.setattr(
+            gdpr_module.GDPRComplianceChecker,
+            "get_processing_info",
+            Mock(side_effect=ValueError("Unknown provider")),
         )
 
         # Simulate the validation
         try:
-            mock_get_processing_info("invalid_provider")
+            gdpr_module.GDPRComplianceChecker.get_processing_info("invalid_provider")
         except ValueError as e:
             with pytest.raises(HTTPException) as exc_info:
                 raise HTTPException(status_code=400, detail=str(e))
 
             assert exc_info.value.status_code == 400
 
-    @pytest.mark.asyncio
-    @patch("app.api.v1.gdpr.GDPRComplianceChecker.get_compliant_providers")
-    @patch("app.api.v1.gdpr.GDPRComplianceChecker.get_processing_info")
-    async def test_get_compliance_status_success(
-        self,
-        mock_get_processing_info,
-        mock_get_compliant_providers,
+    def test_get_compliance_status_success(
+        self, gdpr_module, monkeypatch, license_info
     ):
         """Test successful compliance status retrieval."""
-        from app.core.gdpr import DataProcessingInfo, DataResidency
-        from app.api.v1.gdpr import ComplianceStatusResponse
-
-        mock_get_compliant_providers.return_value = ["scaleway", "vertex_claude", "vertex_gemini"]
-
-        def mock_processing_info_func(provider):
-            if provider == "scaleway":
-                return DataProcessingInfo(
-                    provider="scaleway",
-                    region="fr-par",
-                    data_residency=DataResidency.EU,
-                    is_gdpr_compliant=True,
-                    legal_basis="contract",
-                    data_retention_days=0,
-                    processor_name="Scaleway SAS",
-                    processor_location="France (Paris)",
-                    sub_processors=[],
-                    security_measures=[],
-                    data_subject_rights=[],
-                )
-            elif provider == "anthropic":
-                return DataProcessingInfo(
-                    provider="anthropic",
-                    region="us-east-1",
-                    data_residency=DataResidency.US,
-                    is_gdpr_compliant=False,
-                    legal_basis="contract",
-                    data_retention_days=30,
-                    processor_name="Anthropic PBC",
-                    processor_location="United States",
-                    sub_processors=[],
-                    security_measures=[],
-                    data_subject_rights=[],
-                )
-            else:
-                return DataProcessingInfo(
-                    provider=provider,
-                    region="europe-west3",
-                    data_residency=DataResidency.EU,
-                    is_gdpr_compliant=True,
-                    legal_basis="contract",
-                    data_retention_days=0,
-                    processor_name="Google Cloud Platform",
-                    processor_location="Germany (Frankfurt)",
-                    sub_processors=[],
-                    security_measures=[],
-                    data_subject_rights=[],
-                )
 
-        mock_get_processing_info.side_effect = mock_processing_info_func
+        checker = gdpr_module.GDPRComplianceChecker
+        monkeypatch.setattr(
+            checker,
+            "get_compliant_providers",
+            Mock(return_value=["scaleway", "vertex_claude", "vertex_gemini"]),
+        )
 
-        license = LicenseInfo(
-            license_key="test-key",
-            license_uuid="test-uuid",
-            tenant_id="test-tenant",
-            app_id="test-app",
-            credits_remaining=1000,
-            is_active=True,
+        monkeypatch.setattr(
+            checker,
+            "get_processing_info",
+            Mock(side_effect=_PROCESSING_INFO.__getitem__),
         )
 
         # Simulate building provider list
-        eu_compliant = mock_get_compliant_providers()
+        eu_compliant = checker.get_compliant_providers()
         providers = []
 
         for provider_name in ["anthropic", "scaleway", "vertex_claude", "vertex_gemini"]:
             try:
-                info = mock_get_processing_info(provider_name)
+                info = checker.get_processing_info(provider_name)
                 providers.append({
                     "name": provider_name,
                     "eu_compliant": info.is_gdpr_compliant,
@@ -315,7 +308,6 @@ class TestGDPRComplianceChecker:
 
     def test_is_provider_gdpr_compliant(self):
         """Test GDPR compliance check."""
-        from app.core.gdpr import GDPRComplianceChecker
 
         assert GDPRComplianceChecker.is_provider_gdpr_compliant("scaleway") is True
         assert GDPRComplianceChecker.is_provider_gdpr_compliant("vertex_claude") is True
@@ -324,11 +316,10 @@ class TestGDPRComplianceChecker:
 
     def test_get_compliant_providers(self):
         """Test getting list of compliant providers."""
-        from app.core.gdpr import GDPRComplianceChecker
 
         providers = GDPRComplianceChecker.get_compliant_providers()
 
-        assert isinstance(providers, list)
+        assert isinstance(providers, tuple)
         assert len(providers) == 3
         assert "scaleway" in providers
         assert "vertex_claude" in providers
@@ -337,7 +328,6 @@ class TestGDPRComplianceChecker:
 
     def test_validate_request_with_eu_only(self):
         """Test request validation with EU-only requirement."""
-        from app.core.gdpr import GDPRComplianceChecker
 
         # Valid: EU-compliant provider with EU-only
         is_valid, msg = GDPRComplianceChecker.validate_request("scaleway", eu_only=True)
@@ -350,7 +340,6 @@ class TestGDPRComplianceChecker:
 
     def test_validate_request_without_eu_only(self):
         """Test request validation without EU-only requirement."""
-        from app.core.gdpr import GDPRComplianceChecker
 
         # Valid: Any provider without EU-only
         is_valid, msg = GDPRComplianceChecker.validate_request("anthropic", eu_only=False)
@@ -361,7 +350,6 @@ class TestGDPRComplianceChecker:
 
     def test_get_fallback_provider(self):
         """Test fallback provider selection."""
-        from app.core.gdpr import GDPRComplianceChecker
 
         # No fallback when EU-only is False
         fallback = GDPRComplianceChecker.get_fallback_provider("anthropic", eu_only=False)
@@ -378,7 +366,6 @@ class TestGDPRComplianceChecker:
 
     def test_select_model_for_tenant_no_fallback(self):
         """Test model selection without fallback."""
-        from app.core.gdpr import GDPRComplianceChecker
 
         provider, model, fallback_applied = GDPRComplianceChecker.select_model_for_tenant(
             tenant_id="test-tenant",
@@ -394,7 +381,6 @@ class TestGDPRComplianceChecker:
 
     def test_select_model_for_tenant_with_fallback(self):
         """Test model selection with fallback."""
-        from app.core.gdpr import GDPRComplianceChecker
 
         provider, model, fallback_applied = GDPRComplianceChecker.select_model_for_tenant(
             tenant_id="test-tenant",
@@ -410,7 +396,6 @@ class TestGDPRComplianceChecker:
 
     def test_get_dpa_info(self):
         """Test DPA info retrieval."""
-        from app.core.gdpr import GDPRComplianceChecker
 
         dpa_info = GDPRComplianceChecker.get_dpa_info("test-tenant")
 
@@ -2,239 +2,288 @@
 Unit tests for /api/v1/generate endpoint (with API key validation).
 """
 
+import orjson
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
-from fastapi.testclient import TestClient
+from fastapi import HTTPException
+from pydantic import ValidationError
 
-from app.core.security import LicenseInfo, get_current_license
-from app.main import app
+from app.api.v1.generate import GenerateRequest
+from app.core.security import get_current_license
+from app.services.ai_gateway import ProviderAPIError
+from app.tests.fakes.license import make_license_info
 
 API_PREFIX = "/api/v1"
 
+_HDR = {"X-License-Key": "lic_test123"}
+_JSON_HDR = {**_HDR, "Content-Type": "application/json"}
 
-# Create mock license for dependency override
-def get_mock_license():
-    """Mock license dependency for testing."""
-    return LicenseInfo(
-        license_key="lic_test123",
-        license_uuid="license-mock-123",
-        tenant_id="tenant-mock-123",
-        app_id="app-mock-123",
-        credits_remaining=1000,
-        is_active=True,
-        expires_at=None,
-    )
+# Constant payloads are encoded once at import
+_MIN_BODY = orjson.dumps({"prompt": "Test"})
+_INVALID_PROVIDER_BODY = orjson.dumps({"prompt": "Test", "provider": "invalid"})
+_LONG_PROMPT = "a" * 10001
+_EMPTY_BODY = orjson.dumps({"prompt": ""})
+_MISSING_PROMPT_BODY = orjson.dumps({})
+_LONG_PROMPT_BODY = orjson.dumps({"prompt": _LONG_PROMPT})
 
 
-@pytest.fixture(autouse=True)
-def setup_license_override():
+# Mock license for dependency override, built once and reused per request
+_LICENSE = make_license_info(license_key="lic_test123")
+
+
+def get_mock_license():
+    """Mock license dependency for testing."""
+    return _LICENSE
+
+
+def _fake_provider(text=None, tokens=0, *, error=None):
+    """Build a minimal provider class whose generate() returns or raises."""
+
+    class _FakeProvider:
+        def __init__(self):
+            self.prompts = []
+
+        async def generate(self, prompt, *args, **kwargs):
+            self.prompts.append(prompt)
+            if error is not None:
+                raise error
+            return text, tokens
+
+    return _FakeProvider
+
+
+def _wire_mocks(mock_provider, mock_shield, mock_billing, text, tokens, *, sanitized):
+    """Wire provider, shield and billing mocks; returns the provider instance."""
+    if mock_shield is not None:
+        mock_shield.sanitize.return_value = sanitized
+
+    provider = _fake_provider(text, tokens)()
+    mock_provider.return_value = provider
+    mock_billing.deduct_credits = AsyncMock(return_value=400)
+    return provider
+
+
+def _assert_generate(data, *, content, tokens, credits, pii):
+    """Check the fields every successful /generate response carries."""
+    assert data["content"] == content
+    assert data["tokens_used"] == tokens
+    assert data["credits_deducted"] == credits
+    assert data["pii_detected"] is pii
+
+
+# sanitized=None runs the real DataPrivacyShield instead of a mock.
+GENERATE_CASES = [
+    pytest.param(
+        {
+            "provider_path": "app.api.v1.generate.AnthropicProvider",
+            "sanitized": ("sanitized prompt", False),
+            "result": ("Generated response", 127),
+            "body": {"prompt": "Write a professional email"},
+            "pii": False,
+        },
+        id="success",
+    ),
+    pytest.param(
+        {
+            "provider_path": "app.api.v1.generate.AnthropicProvider",
+            "sanitized": ("Email <EMAIL_REMOVED> about meeting", True),
+            "result": ("Response about meeting", 95),
+            "body": {"prompt": "Email john@example.com about meeting"},
+            "pii": True,
+        },
+        id="pii",
+    ),
+    pytest.param(
+        {
+            "provider_path": "app.api.v1.generate.AnthropicProvider",
+            "sanitized": ("prompt", False),
+            "result": ("response", 250),
+            "body": {"prompt": "Test"},
+            "pii": False,
+        },
+        id="credits-equal-tokens",
+    ),
+    pytest.param(
+        {
+            "provider_path": "app.api.v1.generate.ScalewayProvider",
+            "sanitized": ("sanitized prompt", False),
+            "result": ("Scaleway response", 80),
+            "body": {"prompt": "Test", "provider": "scaleway"},
+            "pii": False,
+        },
+        id="scaleway",
+    ),
+    pytest.param(
+        {
+            "provider_path": "app.api.v1.generate.AnthropicProvider",
+            "sanitized": ("prompt", False),
+            "result": ("Anthropic response", 100),
+            "body": {"prompt": "Test"},  # No provider specified
+            "pii": False,
+        },
+        id="anthropic-default",
+    ),
+    pytest.param(
+        {
+            "provider_path": "app.api.v1.generate.AnthropicProvider",
+            "sanitized": None,
+            "result": ("Sanitized response", 100),
+            "body": {"prompt": "Contact me at user@example.com or +49 123 456789"},
+            "pii": True,
+            "forwarded_excludes": ("user@example.com", "+49 123 456789"),
+            "forwarded_includes": ("<EMAIL_REMOVED>", "<PHONE_REMOVED>"),
+        },
+        id="real-privacy-shield",
+    ),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_license_override(app_instance):
     """Set up license override for all tests in this module."""
-    app.dependency_overrides[get_current_license] = get_mock_license
+    app_instance.dependency_overrides[get_current_license] = get_mock_license
     yield
-    # Cleanup handled by conftest.py cleanup_dependency_overrides fixture
+    app_instance.dependency_overrides.pop(get_current_license, None)
 
 
-client = TestClient(app)
+@pytest.fixture
+def without_license_override(app_instance):
+    """Temporarily remove the license override to exercise real auth."""
+    app_instance.dependency_overrides.pop(get_current_license, None)
+    try:
+        yield
+    finally:
+        app_instance.dependency_overrides[get_current_license] = get_mock_license
 
 
 class TestGenerateEndpoint:
     """Tests for /api/v1/generate endpoint."""
 
-    def test_endpoint_exists(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_endpoint_exists(self, aclient):
         """Test that /api/v1/generate endpoint exists."""
-        response = client.options(f"{API_PREFIX}/generate")
+        response = await aclient.options(f"{API_PREFIX}/generate")
         assert response.status_code in [200, 405]
 
-    @patch("app.api.v1.generate.UsageService", autospec=True)
-    @patch("app.api.v1.generate.BillingService")
-    @patch("app.api.v1.generate.AnthropicProvider")
-    @patch("app.api.v1.generate.DataPrivacyShield")
-    def test_successful_generation(self, mock_shield, mock_provider, mock_billing, mock_usage):
-        """Test successful AI generation."""
-        mock_shield.sanitize.return_value = ("sanitized prompt", False)
-
-        mock_instance = AsyncMock()
-        mock_instance.generate.return_value = ("Generated response", 127)
-        mock_provider.return_value = mock_instance
-        mock_billing.deduct_credits = AsyncMock(return_value=450)
+    @pytest.mark.parametrize("case", GENERATE_CASES)
+    def test_generate_matrix(self, case, client, request, monkeypatch):
+        """Test successful generation across shield, provider and PII variants."""
+        monkeypatch.setattr("app.api.v1.generate.UsageService", MagicMock())
+        mock_billing = MagicMock()
+        monkeypatch.setattr("app.api.v1.generate.BillingService", mock_billing)
+        mock_provider = MagicMock()
+        monkeypatch.setattr(case["provider_path"], mock_provider)
+        mock_shield = None
+        if case["sanitized"] is not None:
+            mock_shield = request.getfixturevalue("mock_shield")
+        provider = _wire_mocks(
+            mock_provider, mock_shield, mock_billing, *case["result"],
+            sanitized=case["sanitized"],
+        )
 
         response = client.post(
             f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": "Write a professional email"},
+            headers=_HDR,
+            json=case["body"],
         )
 
         assert response.status_code == 200
         data = response.json()
-
-        assert "content" in data
-        assert "tokens_used" in data
-        assert "credits_deducted" in data
-        assert "pii_detected" in data
-
-        assert data["content"] == "Generated response"
-        assert data["tokens_used"] == 127
-        assert data["credits_deducted"] == 127
-        assert data["pii_detected"] is False
-        
-        # Verify usage logging
-        # FIXME: Mocking UsageService.log_usage calls fails in test environment despite code verification
-        # mock_usage.log_usage.assert_called_once()
-        # call_kwargs = mock_usage.log_usage.call_args[1]
-        # assert call_kwargs["license_id"] == "license-mock-123"
-        # assert call_kwargs["app_id"] == "app-mock-123"
-        # assert call_kwargs["credits_deducted"] == 127
-
-
-    @patch("app.api.v1.generate.UsageService")
-    @patch("app.api.v1.generate.BillingService")
-    @patch("app.api.v1.generate.AnthropicProvider")
-    @patch("app.api.v1.generate.DataPrivacyShield")
-    def test_generation_with_pii_detected(self, mock_shield, mock_provider, mock_billing, mock_usage):
-        """Test generation when PII is detected."""
-        mock_shield.sanitize.return_value = (
-            "Email <EMAIL_REMOVED> about meeting",
-            True,
+        text, tokens = case["result"]
+        # MVP: credits_deducted equals tokens_used (1:1)
+        _assert_generate(
+            data, content=text, tokens=tokens, credits=tokens, pii=case["pii"]
         )
 
-        mock_instance = AsyncMock()
-        mock_instance.generate.return_value = ("Response about meeting", 95)
-        mock_provider.return_value = mock_instance
-        mock_billing.deduct_credits = AsyncMock(return_value=400)
+        mock_provider.assert_called_once()
+        assert len(provider.prompts) == 1
+        forwarded_prompt = provider.prompts[0]
+        for fragment in case.get("forwarded_excludes", ()):
+            assert fragment not in forwarded_prompt
+        for fragment in case.get("forwarded_includes", ()):
+            assert fragment in forwarded_prompt
 
-        response = client.post(
-            f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": "Email john@example.com about meeting"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["pii_detected"] is True
-        assert data["tokens_used"] == 95
-        assert data["credits_deducted"] == 95
-        
         # FIXME: Mocking UsageService.log_usage calls fails in test environment
-        # mock_usage.log_usage.assert_called_once()
-        # assert mock_usage.log_usage.call_args[1]["pii_detected"] is True
-
-    @patch("app.api.v1.generate.UsageService")
-    @patch("app.api.v1.generate.BillingService")
-    @patch("app.api.v1.generate.AnthropicProvider")
-    @patch("app.api.v1.generate.DataPrivacyShield")
-    def test_credits_equal_tokens(self, mock_shield, mock_provider, mock_billing, mock_usage):
-        """Test that credits_deducted equals tokens_used (MVP 1:1)."""
-        mock_shield.sanitize.return_value = ("prompt", False)
-
-        mock_instance = AsyncMock()
-        mock_instance.generate.return_value = ("response", 250)
-        mock_provider.return_value = mock_instance
-        mock_billing.deduct_credits = AsyncMock(return_value=250)
-
-        response = client.post(
-            f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": "Test"},
-        )
-
-        data = response.json()
-        assert data["tokens_used"] == 250
-        assert data["credits_deducted"] == 250
+        # despite code verification, so usage logging is not asserted here.
 
 
 class TestGenerateValidation:
     """Tests for request validation."""
 
-    def test_empty_prompt_rejected(self):
-        """Test that empty prompt is rejected."""
-        response = client.post(
-            f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": ""},
-        )
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-
-    def test_missing_prompt_rejected(self):
-        """Test that missing prompt is rejected."""
-        response = client.post(
-            f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={},
-        )
-
-        assert response.status_code == 422
-
-    def test_prompt_too_long_rejected(self):
-        """Test that prompt exceeding max length is rejected."""
-        long_prompt = "a" * 10001
-
-        response = client.post(
+    @pytest.mark.parametrize(
+        "body,error_type",
+        [
+            pytest.param(_EMPTY_BODY, "string_too_short", id="empty"),
+            pytest.param(_MISSING_PROMPT_BODY, "missing", id="missing"),
+            pytest.param(_LONG_PROMPT_BODY, "string_too_long", id="too-long"),
+        ],
+    )
+    def test_invalid_prompt_rejected(self, body, error_type):
+        """Test that empty, missing and over-long prompts are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            GenerateRequest.model_validate_json(body)
+
+        errors = exc_info.value.errors()
+        assert [(e["loc"], e["type"]) for e in errors] == [
+            (("prompt",), error_type)
+        ]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_invalid_prompt_returns_422(self, aclient):
+        """Smoke test that /generate validates its body with GenerateRequest."""
+        response = await aclient.post(
             f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": long_prompt},
+            headers=_JSON_HDR,
+            content=_EMPTY_BODY,
         )
 
         assert response.status_code == 422
+        # The error body itself is covered by test_invalid_prompt_rejected
+        assert response.headers["content-type"].startswith("application/json")
 
 
 class TestGenerateAuthentication:
     """Tests for authentication (header validation)."""
 
-    def test_missing_license_header_rejected(self):
+    async def test_missing_license_header_rejected(self):
         """Test that missing X-License-Key header is rejected."""
-        # Temporarily remove override to test auth
-        app.dependency_overrides.pop(get_current_license, None)
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_license(None)
 
-        response = client.post(
-            f"{API_PREFIX}/generate", json={"prompt": "Test prompt"}
-        )
-
-        assert response.status_code == 401
-
-        # Restore override
-        app.dependency_overrides[get_current_license] = get_mock_license
+        assert exc_info.value.status_code == 401
 
-    def test_empty_license_header_rejected(self):
+    async def test_empty_license_header_rejected(self):
         """Test that empty X-License-Key header is rejected."""
-        # Temporarily remove override
-        app.dependency_overrides.pop(get_current_license, None)
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_license("")
 
+        assert exc_info.value.status_code == 401
+
+    def test_generate_requires_license_header(self, client, without_license_override):
+        """Smoke test that /generate is wired to the license dependency."""
         response = client.post(
-            f"{API_PREFIX}/generate",
-            headers={"X-License-Key": ""},
-            json={"prompt": "Test"},
+            f"{API_PREFIX}/generate", json={"prompt": "Test prompt"}
         )
 
         assert response.status_code == 401
 
-        # Restore override
-        app.dependency_overrides[get_current_license] = get_mock_license
-
 
 class TestGenerateErrorHandling:
     """Tests for error handling."""
 
-    @patch("app.api.v1.generate.AnthropicProvider")
-    @patch("app.api.v1.generate.DataPrivacyShield")
-    def test_ai_provider_error_returns_500(self, mock_shield, mock_provider):
+    def test_ai_provider_error_returns_500(self, mock_shield, mock_provider, client):
         """Test that AI provider errors return 500."""
-        from app.services.ai_gateway import ProviderAPIError
-
         mock_shield.sanitize.return_value = ("prompt", False)
 
-        mock_instance = AsyncMock()
-        mock_instance.generate.side_effect = ProviderAPIError("API error")
-        mock_provider.return_value = mock_instance
+        mock_provider.return_value = _fake_provider(
+            error=ProviderAPIError("API error")
+        )()
 
         response = client.post(
             f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": "Test"},
+            headers=_JSON_HDR,
+            content=_MIN_BODY,
         )
 
         assert response.status_code == 500
@@ -242,15 +291,14 @@ class TestGenerateErrorHandling:
         assert "detail" in data
         # SEC-010: 5xx errors show generic messages in production
 
-    @patch("app.api.v1.generate.DataPrivacyShield")
-    def test_unexpected_error_returns_500(self, mock_shield):
+    def test_unexpected_error_returns_500(self, mock_shield, client):
         """Test that unexpected errors return 500."""
         mock_shield.sanitize.side_effect = Exception("Unexpected error")
 
         response = client.post(
             f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": "Test"},
+            headers=_JSON_HDR,
+            content=_MIN_BODY,
         )
 
         assert response.status_code == 500
@@ -261,97 +309,14 @@ class TestGenerateErrorHandling:
 class TestProviderSelection:
     """Tests for provider parameter."""
 
-    @patch("app.api.v1.generate.UsageService")
-    @patch("app.api.v1.generate.BillingService")
-    @patch("app.api.v1.generate.ScalewayProvider")
-    @patch("app.api.v1.generate.DataPrivacyShield")
-    def test_scaleway_provider_selection(self, mock_shield, mock_scaleway, mock_billing, mock_usage):
-        """Test generation with Scaleway provider."""
-        mock_shield.sanitize.return_value = ("sanitized prompt", False)
-
-        mock_instance = AsyncMock()
-        mock_instance.generate.return_value = ("Scaleway response", 80)
-        mock_scaleway.return_value = mock_instance
-        mock_billing.deduct_credits = AsyncMock(return_value=420)
-
-        response = client.post(
-            f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": "Test", "provider": "scaleway"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["content"] == "Scaleway response"
-        assert data["tokens_used"] == 80
-        
-        # FIXME: Mocking UsageService.log_usage calls fails in test environment
-        # mock_usage.log_usage.assert_called_once()
-        # assert mock_usage.log_usage.call_args[1]["provider"] == "scaleway"
-
-    @patch("app.api.v1.generate.UsageService")
-    @patch("app.api.v1.generate.BillingService")
-    @patch("app.api.v1.generate.AnthropicProvider")
-    @patch("app.api.v1.generate.DataPrivacyShield")
-    def test_anthropic_provider_default(self, mock_shield, mock_anthropic, mock_billing, mock_usage):
-        """Test that Anthropic is used by default."""
-        mock_shield.sanitize.return_value = ("prompt", False)
-
-        mock_instance = AsyncMock()
-        mock_instance.generate.return_value = ("Anthropic response", 100)
-        mock_anthropic.return_value = mock_instance
-        mock_billing.deduct_credits = AsyncMock(return_value=400)
-
-        response = client.post(
-            f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": "Test"},  # No provider specified
-        )
-
-        assert response.status_code == 200
-        mock_anthropic.assert_called_once()
-
-    def test_invalid_provider_rejected(self):
+    def test_invalid_provider_rejected(self, client):
         """Test that invalid provider is rejected."""
         response = client.post(
             f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": "Test", "provider": "invalid"},
+            headers=_JSON_HDR,
+            content=_INVALID_PROVIDER_BODY,
         )
 
         assert response.status_code == 400
         data = response.json()
         assert "Invalid provider" in data["detail"]
-
-
-class TestGenerateIntegration:
-    """Integration tests with real components."""
-
-    @patch("app.api.v1.generate.UsageService")
-    @patch("app.api.v1.generate.BillingService")
-    @patch("app.api.v1.generate.AnthropicProvider")
-    def test_real_privacy_shield_integration(self, mock_provider, mock_billing, mock_usage):
-        """Test with real DataPrivacyShield (not mocked)."""
-        mock_instance = AsyncMock()
-        mock_instance.generate.return_value = ("Sanitized response", 100)
-        mock_provider.return_value = mock_instance
-        mock_billing.deduct_credits = AsyncMock(return_value=400)
-
-        response = client.post(
-            f"{API_PREFIX}/generate",
-            headers={"X-License-Key": "lic_test123"},
-            json={"prompt": "Contact me at user@example.com or +49 123 456789"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["pii_detected"] is True
-
-        mock_instance.generate.assert_called_once()
-        call_args = mock_instance.generate.call_args[0][0]
-
-        assert "user@example.com" not in call_args
-        assert "+49 123 456789" not in call_args
-        assert "<EMAIL_REMOVED>" in call_args
-        assert "<PHONE_REMOVED>" in call_args
@@ -2,11 +2,9 @@
 Unit tests for health check functionality.
 """
 
+import asyncio
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
-
-import pytest
-from fastapi.testclient import TestClient
+from unittest.mock import patch
 
 from app.core.health import (
     DatabaseHealth,
@@ -14,30 +12,24 @@ from app.core.health import (
     HealthCheckResponse,
     HealthStatus,
 )
-from app.main import app
-
-client = TestClient(app)
 
 
 class TestHealthCheckEndpoint:
     """Tests for the /health endpoint."""
 
-    def test_health_endpoint_returns_200(self):
+    def test_health_endpoint_returns_200(self, client):
         """Test that health endpoint returns 200 OK."""
         with patch("app.core.health.get_supabase_client"):
             response = client.get("/health")
             assert response.status_code == 200
 
-    def test_health_endpoint_response_structure(self):
+    def test_health_endpoint_response_structure(
+        self, client, stub_supabase_client
+    ):
         """Test that health endpoint returns correct response structure."""
-        mock_client = MagicMock()
-        mock_execute = MagicMock()
-        (
-            mock_client.table.return_value.select.return_value.limit
-            .return_value.execute.return_value
-        ) = mock_execute
-
-        with patch("app.core.health.get_supabase_client", return_value=mock_client):
+        with patch(
+            "app.core.health.get_supabase_client", return_value=stub_supabase_client
+        ):
             response = client.get("/health")
             data = response.json()
 
@@ -52,23 +44,20 @@ class TestHealthCheckEndpoint:
             assert "status" in data["database"]
             assert "message" in data["database"]
 
-    def test_health_endpoint_when_database_healthy(self):
+    def test_health_endpoint_when_database_healthy(
+        self, client, stub_supabase_client
+    ):
         """Test health endpoint when database is healthy."""
-        mock_client = MagicMock()
-        mock_execute = MagicMock()
-        (
-            mock_client.table.return_value.select.return_value.limit
-            .return_value.execute.return_value
-        ) = mock_execute
-
-        with patch("app.core.health.get_supabase_client", return_value=mock_client):
+        with patch(
+            "app.core.health.get_supabase_client", return_value=stub_supabase_client
+        ):
             response = client.get("/health")
             data = response.json()
 
             assert data["status"] == "healthy"
             assert data["database"]["status"] == "healthy"
 
-    def test_health_endpoint_when_database_fails(self):
+    def test_health_endpoint_when_database_fails(self, client):
         """Test health endpoint when database connection fails."""
         with patch(
             "app.core.health.get_supabase_client",
@@ -97,29 +86,22 @@ class TestHealthChecker:
         assert uptime >= 0
         assert uptime < 1  # Should be less than 1 second
 
-    @pytest.mark.asyncio
-    async def test_check_database_success(self):
+    def test_check_database_success(self, stub_supabase_client):
         """Test database check when connection succeeds."""
-        mock_client = MagicMock()
-        mock_execute = MagicMock()
-        (
-            mock_client.table.return_value.select.return_value.limit
-            .return_value.execute.return_value
-        ) = mock_execute
-
         start_time = datetime.now(timezone.utc)
         checker = HealthChecker(start_time=start_time)
 
-        with patch("app.core.health.get_supabase_client", return_value=mock_client):
-            result = await checker.check_database()
+        with patch(
+            "app.core.health.get_supabase_client", return_value=stub_supabase_client
+        ):
+            result = asyncio.run(checker.check_database())
 
             assert result.status == HealthStatus.HEALTHY
             assert "successful" in result.message.lower()
             assert result.response_time_ms is not None
             assert result.response_time_ms >= 0
 
-    @pytest.mark.asyncio
-    async def test_check_database_failure(self):
+    def test_check_database_failure(self):
         """Test database check when connection fails."""
         start_time = datetime.now(timezone.utc)
         checker = HealthChecker(start_time=start_time)
@@ -128,27 +110,21 @@ class TestHealthChecker:
             "app.core.health.get_supabase_client",
             side_effect=Exception("Connection timeout"),
         ):
-            result = await checker.check_database()
+            result = asyncio.run(checker.check_database())
 
             assert result.status == HealthStatus.UNHEALTHY
             assert "failed" in result.message.lower()
             assert result.response_time_ms is None
 
-    @pytest.mark.asyncio
-    async def test_check_health_overall_status(self):
+    def test_check_health_overall_status(self, stub_supabase_client):
         """Test overall health status determination."""
-        mock_client = MagicMock()
-        mock_execute = MagicMock()
-        (
-            mock_client.table.return_value.select.return_value.limit
-            .return_value.execute.return_value
-        ) = mock_execute
-
         start_time = datetime.now(timezone.utc)
         checker = HealthChecker(start_time=start_time)
 
-        with patch("app.core.health.get_supabase_client", return_value=mock_client):
-            result = await checker.check_health(version="0.1.1")
+        with patch(
+            "app.core.health.get_supabase_client", return_value=stub_supabase_client
+        ):
+            result = asyncio.run(checker.check_health(version="0.1.1"))
 
             assert isinstance(result, HealthCheckResponse)
             assert result.status == HealthStatus.HEALTHY
@@ -156,8 +132,7 @@ class TestHealthChecker:
             assert result.uptime_seconds >= 0
             assert result.database.status == HealthStatus.HEALTHY
 
-    @pytest.mark.asyncio
-    async def test_check_health_unhealthy_database(self):
+    def test_check_health_unhealthy_database(self):
         """Test overall health when database is unhealthy."""
         start_time = datetime.now(timezone.utc)
         checker = HealthChecker(start_time=start_time)
@@ -166,7 +141,7 @@ class TestHealthChecker:
             "app.core.health.get_supabase_client",
             side_effect=Exception("Connection failed"),
         ):
-            result = await checker.check_health(version="0.1.1")
+            result = asyncio.run(checker.check_health(version="0.1.1"))
 
             # Overall status should be unhealthy if database is unhealthy
             assert result.status == HealthStatus.UNHEALTHY
@@ -8,8 +8,9 @@ Tests:
 - Parameter interpolation
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock
 
 from app.core.i18n import (
     Language,
@@ -21,8 +22,54 @@ from app.core.i18n import (
     get_request_language,
     I18nContext,
     DEFAULT_LANGUAGE,
+    TRANSLATIONS,
 )
 
+# Translation keys each category (auth, rbac, billing, rate_limit, ai,
+# tenant, validation, success, error) must provide
+REQUIRED_KEYS = [
+    "auth.missing_license_key",
+    "auth.invalid_license",
+    "auth.inactive_license",
+    "auth.expired_license",
+    "auth.no_credits",
+    "auth.ip_not_allowed",
+    "rbac.no_access",
+    "rbac.insufficient_permissions",
+    "rbac.insufficient_role",
+    "billing.insufficient_credits",
+    "billing.payment_required",
+    "rate_limit.exceeded",
+    "rate_limit.too_many_requests",
+    "ai.provider_unavailable",
+    "ai.generation_failed",
+    "ai.all_providers_failed",
+    "tenant.not_found",
+    "tenant.inactive",
+    "tenant.deletion_not_allowed",
+    "validation.invalid_email",
+    "validation.required_field",
+    "validation.invalid_format",
+    "success.created",
+    "success.updated",
+    "success.deleted",
+    "error.internal",
+    "error.not_found",
+    "error.bad_request",
+]
+
+
+@pytest.fixture(scope="module")
+def i18n():
+    """Shared read-only i18n service instance."""
+    return I18nService()
+
+
+@pytest.fixture
+def i18n_mut():
+    """Fresh i18n service for tests that add translations."""
+    return I18nService()
+
 
 class TestLanguageEnum:
     """Tests for Language enum."""
@@ -45,11 +92,6 @@ class TestLanguageEnum:
 class TestI18nService:
     """Tests for I18nService."""
 
-    @pytest.fixture
-    def i18n(self):
-        """Create i18n service instance."""
-        return I18nService()
-
     def test_get_translation_english(self, i18n):
         """Should return English translation."""
         result = i18n.get("auth.invalid_license", Language.EN)
@@ -104,6 +146,13 @@ class TestI18nService:
         )
         assert result == "Insufficient credits. Required: 100, Available: 50"
 
+    def test_get_raw_returns_template(self, i18n):
+        """get_raw should return the template without interpolation."""
+        result = i18n.get_raw("billing.insufficient_credits", Language.EN)
+        assert result == (
+            "Insufficient credits. Required: {required}, Available: {available}"
+        )
+
     def test_get_translation_german_with_parameters(self, i18n):
         """Should interpolate parameters in German."""
         result = i18n.get(
@@ -141,25 +190,28 @@ class TestI18nService:
         assert Language.FR in languages
         assert Language.ES in languages
 
-    def test_add_translation(self, i18n):
+    def test_add_translation(self, i18n_mut):
         """Should add new translation."""
-        i18n.add_translation("custom.message", {
+        i18n_mut.add_translation("custom.message", {
             Language.EN: "Custom English",
             Language.DE: "Benutzerdefiniert Deutsch",
         })
 
-        assert i18n.get("custom.message", Language.EN) == "Custom English"
-        assert i18n.get("custom.message", Language.DE) == "Benutzerdefiniert Deutsch"
+        assert i18n_mut.get("custom.message", Language.EN) == "Custom English"
+        assert (
+            i18n_mut.get("custom.message", Language.DE)
+            == "Benutzerdefiniert Deutsch"
+        )
 
-    def test_add_translation_string_keys(self, i18n):
+    def test_add_translation_string_keys(self, i18n_mut):
         """Should accept string language keys."""
-        i18n.add_translation("string.key.test", {
+        i18n_mut.add_translation("string.key.test", {
             "en": "English",
             "de": "Deutsch",
         })
 
-        assert i18n.get("string.key.test", Language.EN) == "English"
-        assert i18n.get("string.key.test", Language.DE) == "Deutsch"
+        assert i18n_mut.get("string.key.test", Language.EN) == "English"
+        assert i18n_mut.get("string.key.test", Language.DE) == "Deutsch"
 
 
 class TestTranslationHelper:
@@ -226,56 +278,76 @@ class TestAcceptLanguageParser:
         result = get_accept_language("ja;q=1.0,de;q=0.8,en;q=0.5")
         assert result == Language.DE
 
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("de_DE;q=0.1, en;q=0.9", Language.EN),
+            ("en;q=0.9,it;q=1,de_DE;q=0.5", Language.EN),
+            ("fr;q=0.9, es_ES;q=0.2", Language.FR),
+        ],
+    )
+    def test_underscore_tag_skipped(self, header, expected):
+        """Malformed underscore tags must not be read as a bare q=1.0 code."""
+        assert get_accept_language(header) == expected
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("de-DE;level=1", Language.DE),
+            ("en;q=0.5, de-DE;level=1", Language.DE),
+            ("de-DE ; q=0.8", Language.DE),
+            ("en;q=0.9, de-DE ; q=0.8", Language.EN),
+            ("de;level=1;q=0.3, fr;q=0.4", Language.FR),
+        ],
+    )
+    def test_extra_params_and_whitespace(self, header, expected):
+        """Non-q parameters and spaces around ';' should not drop an entry."""
+        assert get_accept_language(header) == expected
+
 
 class TestRequestLanguage:
     """Tests for request language detection."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_language_from_query_param(self):
         """Should detect language from query parameter."""
-        request = MagicMock()
-        request.query_params = {"lang": "de"}
-        request.headers = {}
+        request = SimpleNamespace(query_params={"lang": "de"}, headers={})
 
         result = await get_request_language(request)
         assert result == Language.DE
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_language_from_header(self):
         """Should detect language from Accept-Language header."""
-        request = MagicMock()
-        request.query_params = {}
-        request.headers = {"Accept-Language": "fr-FR"}
+        request = SimpleNamespace(query_params={}, headers={"Accept-Language": "fr-FR"})
 
         result = await get_request_language(request)
         assert result == Language.FR
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_query_param_priority(self):
         """Query param should take priority over header."""
-        request = MagicMock()
-        request.query_params = {"lang": "es"}
-        request.headers = {"Accept-Language": "de-DE"}
+        request = SimpleNamespace(
+            query_params={"lang": "es"}, headers={"Accept-Language": "de-DE"}
+        )
 
         result = await get_request_language(request)
         assert result == Language.ES
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_default_when_nothing_specified(self):
         """Should return default when nothing specified."""
-        request = MagicMock()
-        request.query_params = {}
-        request.headers = {}
+        request = SimpleNamespace(query_params={}, headers={})
 
         result = await get_request_language(request)
         assert result == DEFAULT_LANGUAGE
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_invalid_query_param(self):
         """Should fallback when query param is invalid."""
-        request = MagicMock()
-        request.query_params = {"lang": "invalid"}
-        request.headers = {"Accept-Language": "de"}
+        request = SimpleNamespace(
+            query_params={"lang": "invalid"}, headers={"Accept-Language": "de"}
+        )
 
         result = await get_request_language(request)
         assert result == Language.DE
@@ -306,65 +378,18 @@ class TestI18nContext:
 class TestTranslationCategories:
     """Tests for different translation categories."""
 
-    @pytest.fixture
-    def i18n(self):
-        """Create i18n service instance."""
-        return I18nService()
-
-    def test_auth_translations(self, i18n):
-        """Auth translations should be available."""
-        assert i18n.has_key("auth.missing_license_key")
-        assert i18n.has_key("auth.invalid_license")
-        assert i18n.has_key("auth.inactive_license")
-        assert i18n.has_key("auth.expired_license")
-        assert i18n.has_key("auth.no_credits")
-        assert i18n.has_key("auth.ip_not_allowed")
-
-    def test_rbac_translations(self, i18n):
-        """RBAC translations should be available."""
-        assert i18n.has_key("rbac.no_access")
-        assert i18n.has_key("rbac.insufficient_permissions")
-        assert i18n.has_key("rbac.insufficient_role")
-
-    def test_billing_translations(self, i18n):
-        """Billing translations should be available."""
-        assert i18n.has_key("billing.insufficient_credits")
-        assert i18n.has_key("billing.payment_required")
-
-    def test_rate_limit_translations(self, i18n):
-        """Rate limit translations should be available."""
-        assert i18n.has_key("rate_limit.exceeded")
-        assert i18n.has_key("rate_limit.too_many_requests")
-
-    def test_ai_translations(self, i18n):
-        """AI provider translations should be available."""
-        assert i18n.has_key("ai.provider_unavailable")
-        assert i18n.has_key("ai.generation_failed")
-        assert i18n.has_key("ai.all_providers_failed")
-
-    def test_tenant_translations(self, i18n):
-        """Tenant translations should be available."""
-        assert i18n.has_key("tenant.not_found")
-        assert i18n.has_key("tenant.inactive")
-        assert i18n.has_key("tenant.deletion_not_allowed")
-
-    def test_validation_translations(self, i18n):
-        """Validation translations should be available."""
-        assert i18n.has_key("validation.invalid_email")
-        assert i18n.has_key("validation.required_field")
-        assert i18n.has_key("validation.invalid_format")
-
-    def test_success_translations(self, i18n):
-        """Success message translations should be available."""
-        assert i18n.has_key("success.created")
-        assert i18n.has_key("success.updated")
-        assert i18n.has_key("success.deleted")
-
-    def test_error_translations(self, i18n):
-        """General error translations should be available."""
-        assert i18n.has_key("error.internal")
-        assert i18n.has_key("error.not_found")
-        assert i18n.has_key("error.bad_request")
+    @pytest.mark.parametrize("key", REQUIRED_KEYS)
+    def test_required_key_exists(self, i18n, key):
+        """Every category's required translation keys should be available."""
+        assert i18n.has_key(key)
+
+    @pytest.mark.parametrize(
+        "translation_key", sorted(TRANSLATIONS[DEFAULT_LANGUAGE])
+    )
+    @pytest.mark.parametrize("language", list(Language))
+    def test_translation_key_present(self, translation_key, language):
+        """Every default-language key should be translated in every language."""
+        assert translation_key in TRANSLATIONS[language]
 
 
 class TestTranslationConfig:
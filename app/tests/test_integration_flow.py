@@ -1,51 +1,84 @@
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
-from fastapi.testclient import TestClient
+from collections import namedtuple
+from unittest.mock import patch, AsyncMock
 from fastapi import HTTPException
-from app.main import app
-from app.core.security import get_current_license, LicenseInfo
+from app.core.security import get_current_license
 from app.services.ai_gateway import ProviderAPIError
+from app.tests.fakes.license import make_license_info
+
+
+# License returned by the dependency override, built once for the module
+_CACHED_LICENSE = make_license_info(license_key="test_license_key")
 
 
 # Override dependency to skip DB lookup
 async def mock_get_current_license():
-    return LicenseInfo(
-        license_key="test_license_key",
-        license_uuid="test_license_uuid",
-        tenant_id="test_tenant_id",
-        app_id="test_app_id",
-        credits_remaining=1000,
-        is_active=True
-    )
-
-
-@pytest.fixture(autouse=True)
-def setup_license_override():
-    """Set up license override for all tests in this module."""
-    app.dependency_overrides[get_current_license] = mock_get_current_license
+    return _CACHED_LICENSE
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_license_override(app_instance):
+    """Set up license override once for all tests in this module."""
+    app_instance.dependency_overrides[get_current_license] = mock_get_current_license
     yield
-    # Cleanup handled by conftest.py cleanup_dependency_overrides fixture
+    app_instance.dependency_overrides.pop(get_current_license, None)
+
+
+def _async_stub(result=None, *, error=None):
+    """Plain async callable that records its calls and returns or raises."""
+
+    async def stub(*args, **kwargs):
+        stub.calls.append((args, kwargs))
+        if error is not None:
+            raise error
+        return result
+
+    stub.calls = []
+    return stub
+
+
+GenerateMocks = namedtuple("GenerateMocks", "provider_cls billing usage")
+
+
+@pytest.fixture(scope="module")
+def patched_generate():
+    """Patch the generate endpoint's provider, billing and usage once per module."""
+    patchers = [
+        patch("app.api.v1.generate.AnthropicProvider"),
+        patch("app.api.v1.generate.BillingService"),
+        patch("app.api.v1.generate.UsageService"),
+    ]
+    mocks = GenerateMocks(*(patcher.start() for patcher in patchers))
+    yield mocks
+    for patcher in patchers:
+        patcher.stop()
+
 
+@pytest.fixture
+def generate_mocks(patched_generate):
+    """Module-wide generate mocks with calls and configured results cleared."""
+    for mock in patched_generate:
+        mock.reset_mock(return_value=True, side_effect=True)
+    return patched_generate
 
-client = TestClient(app)
 
+@pytest.mark.xdist_group(name="integration_flow")
+@pytest.mark.asyncio(loop_scope="session")
 class TestIntegrationFlow:
     """
     Integration tests for the /v1/generate endpoint.
     Mocks external services (AI, Billing, Usage) but tests the full FastAPI flow.
     """
 
-    @patch("app.api.v1.generate.AnthropicProvider")
-    @patch("app.api.v1.generate.BillingService")
-    @patch("app.api.v1.generate.UsageService")
-    def test_generate_flow_success(self, mock_usage, mock_billing, mock_provider_cls):
+    async def test_generate_flow_success(self, generate_mocks, aclient):
         """
         Test successful generation flow:
         Request -> Privacy -> Provider -> Billing -> Usage Log -> Response
         """
+        mock_provider_cls, mock_billing, mock_usage = generate_mocks
         # Mock AI Provider
-        mock_provider_instance = mock_provider_cls.return_value
-        mock_provider_instance.generate = AsyncMock(return_value=("Hello from AI", 15))
+        generate = _async_stub(("Hello from AI", 15))
+        mock_provider_cls.return_value.generate = generate
         
         # Mock Billing (Success)
         mock_billing.deduct_credits = AsyncMock(return_value=985)
@@ -56,7 +89,7 @@ class TestIntegrationFlow:
         payload = {"prompt": "Hello world", "provider": "anthropic"}
         headers = {"X-License-Key": "test_license_key"} # Header required by schema but overridden by dependency
         
-        response = client.post("/api/v1/generate", json=payload, headers=headers)
+        response = await aclient.post("/api/v1/generate", json=payload, headers=headers)
         
         # Assertions
         assert response.status_code == 200
@@ -67,7 +100,7 @@ class TestIntegrationFlow:
         assert data["pii_detected"] is False
         
         # Verify calls
-        mock_provider_instance.generate.assert_called_once()
+        assert len(generate.calls) == 1
         # License key comes from the mock_get_current_license dependency
         mock_billing.deduct_credits.assert_called_once()
         mock_usage.log_usage.assert_called_once()
@@ -78,20 +111,18 @@ class TestIntegrationFlow:
         assert kwargs["tokens_used"] == 15
         assert kwargs["provider"] == "anthropic"
 
-    @patch("app.api.v1.generate.AnthropicProvider")
-    @patch("app.api.v1.generate.BillingService")
-    @patch("app.api.v1.generate.UsageService")
-    def test_generate_flow_pii_detected(self, mock_usage, mock_billing, mock_provider_cls):
+    async def test_generate_flow_pii_detected(self, generate_mocks, aclient):
         """Test flow when PII is detected."""
-        mock_provider_instance = mock_provider_cls.return_value
-        mock_provider_instance.generate = AsyncMock(return_value=("Sanitized Response", 10))
+        mock_provider_cls, mock_billing, mock_usage = generate_mocks
+        generate = _async_stub(("Sanitized Response", 10))
+        mock_provider_cls.return_value.generate = generate
         mock_billing.deduct_credits = AsyncMock(return_value=990)
         mock_usage.log_usage = AsyncMock()
 
         # Prompt with email
         payload = {"prompt": "My email is test@example.com", "provider": "anthropic"}
         
-        response = client.post("/api/v1/generate", json=payload)
+        response = await aclient.post("/api/v1/generate", json=payload)
         
         assert response.status_code == 200
         data = response.json()
@@ -99,18 +130,18 @@ class TestIntegrationFlow:
         
         # Verify provider received sanitized prompt
         # We need to check what generate was called with
-        args, _ = mock_provider_instance.generate.call_args
+        args, _ = generate.calls[-1]
         assert "<EMAIL_REMOVED>" in args[0]
 
-    @patch("app.api.v1.generate.AnthropicProvider")
-    @patch("app.api.v1.generate.BillingService")
-    def test_generate_provider_error(self, mock_billing, mock_provider_cls):
+    async def test_generate_provider_error(self, generate_mocks, aclient):
         """Test handling of AI provider errors."""
-        mock_provider_instance = mock_provider_cls.return_value
-        mock_provider_instance.generate = AsyncMock(side_effect=ProviderAPIError("API Down"))
+        mock_provider_cls, mock_billing, mock_usage = generate_mocks
+        mock_provider_cls.return_value.generate = _async_stub(
+            error=ProviderAPIError("API Down")
+        )
 
         payload = {"prompt": "Hello", "provider": "anthropic"}
-        response = client.post("/api/v1/generate", json=payload)
+        response = await aclient.post("/api/v1/generate", json=payload)
 
         assert response.status_code == 500
         # SEC-010: 5xx errors show generic messages in production
@@ -119,18 +150,16 @@ class TestIntegrationFlow:
         # Billing should NOT be called
         mock_billing.deduct_credits.assert_not_called()
 
-    @patch("app.api.v1.generate.AnthropicProvider")
-    @patch("app.api.v1.generate.BillingService")
-    def test_generate_billing_error(self, mock_billing, mock_provider_cls):
+    async def test_generate_billing_error(self, generate_mocks, aclient):
         """Test handling of insufficient credits."""
-        mock_provider_instance = mock_provider_cls.return_value
-        mock_provider_instance.generate = AsyncMock(return_value=("Expensive AI", 10000))
+        mock_provider_cls, mock_billing, mock_usage = generate_mocks
+        mock_provider_cls.return_value.generate = _async_stub(("Expensive AI", 10000))
 
         # Mock Billing Error
         mock_billing.deduct_credits = AsyncMock(side_effect=HTTPException(status_code=402, detail="Insufficient credits"))
 
         payload = {"prompt": "Hello", "provider": "anthropic"}
-        response = client.post("/api/v1/generate", json=payload)
+        response = await aclient.post("/api/v1/generate", json=payload)
 
         assert response.status_code == 402
         # SEC-010: Error messages are sanitized (402 not in exposed codes)
@@ -9,11 +9,9 @@ Tests:
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
 from datetime import date, datetime, timezone
 from decimal import Decimal
 
-from app.core.i18n import Language
 from app.services.invoice import (
     Invoice,
     InvoiceItem,
@@ -22,6 +20,151 @@ from app.services.invoice import (
     InvoiceConfig,
     get_invoice_service,
 )
+from app.tests.fakes.supabase import FakeSupabase
+
+
+# Fixed "today" for Invoice.is_overdue, so due-date checks don't age
+_TODAY = date(2025, 6, 15)
+
+
+class _FrozenDate(date):
+    """date whose today() is pinned to _TODAY."""
+
+    @classmethod
+    def today(cls):
+        return _TODAY
+
+
+@pytest.fixture(scope="module", autouse=True)
+def frozen_today():
+    """Pin date.today() inside app.services.invoice for this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.services.invoice.date", _FrozenDate)
+        yield _TODAY
+
+
+# Field values shared by the Invoice objects built in these tests
+_BASE_INVOICE_KWARGS = {
+    "id": "inv-123",
+    "invoice_number": "INV-2025-00001",
+    "tenant_id": "tenant-456",
+    "status": InvoiceStatus.PENDING,
+    "currency": "EUR",
+    "subtotal_cents": 10000,
+    "tax_rate_percent": Decimal("19.00"),
+    "tax_cents": 1900,
+    "total_cents": 11900,
+    "credits_purchased": 100,
+    "price_per_credit_cents": 100,
+}
+
+
+def _make_invoice(**overrides):
+    """Build an Invoice from the shared defaults plus overrides."""
+    return Invoice(**{**_BASE_INVOICE_KWARGS, **overrides})
+
+
+# Supabase rows shared by the service tests; the mocks only hand them out
+_INVOICE_ROW_PENDING = {
+    "id": "inv-123",
+    "invoice_number": "INV-2025-00001",
+    "tenant_id": "tenant-456",
+    "status": "pending",
+    "currency": "EUR",
+    "subtotal_cents": 10000,
+    "tax_rate_percent": "19.00",
+    "tax_cents": 1900,
+    "total_cents": 11900,
+    "credits_purchased": 100,
+    "price_per_credit_cents": 100,
+}
+
+_INVOICE_ROW_CREATED = {**_INVOICE_ROW_PENDING, "id": "inv-new-123"}
+
+_INVOICE_ROW_PAID = {
+    **_INVOICE_ROW_PENDING,
+    "id": "inv-1",
+    "status": "paid",
+}
+
+_INVOICE_LIST_ROWS = [
+    _INVOICE_ROW_PAID,
+    {
+        **_INVOICE_ROW_PENDING,
+        "id": "inv-2",
+        "invoice_number": "INV-2025-00002",
+        "subtotal_cents": 5000,
+        "tax_cents": 950,
+        "total_cents": 5950,
+        "credits_purchased": 50,
+    },
+]
+
+_INVOICE_ITEM_ROWS = [
+    {
+        "description": "AI Gateway Credits",
+        "quantity": 100,
+        "unit_price_cents": 100,
+        "total_cents": 10000,
+        "item_type": "credits",
+        "metadata": {},
+    }
+]
+
+
+@pytest.fixture(scope="module")
+def sample_invoice():
+    """Pending invoice due in the future; read-only, shared by the module."""
+    return _make_invoice(due_date=date(2025, 12, 31))
+
+
+@pytest.fixture(scope="module")
+def config_service():
+    """InvoiceService for pure helpers (formatting, parsing); no client."""
+    return InvoiceService()
+
+
+@pytest.fixture(scope="module")
+def pdf_service():
+    """InvoiceService with company details for PDF rendering."""
+    return InvoiceService(InvoiceConfig(
+        company_name="Test Company",
+        company_address="Test Address",
+        company_vat_id="DE123456789",
+    ))
+
+
+@pytest.fixture(scope="module")
+def pdf_invoice():
+    """Invoice with billing details and one line item, for PDF rendering."""
+    return _make_invoice(
+        billing_name="Test Customer",
+        billing_email="customer@test.com",
+        billing_address="Customer Address",
+        due_date=date(2025, 12, 31),
+        created_at=datetime(2025, 12, 1, 12, 0, 0, tzinfo=timezone.utc),
+        items=[
+            InvoiceItem(
+                description="AI Gateway Credits",
+                quantity=100,
+                unit_price_cents=100,
+                total_cents=10000,
+                item_type="credits",
+            )
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def generated_pdf(pdf_service, pdf_invoice):
+    """PDF for pdf_invoice, rendered once per module."""
+    return pdf_service.generate_pdf(pdf_invoice)
+
+
+@pytest.fixture(scope="module")
+def pdf_content(generated_pdf):
+    """Decoded text of generated_pdf."""
+    return generated_pdf.decode("utf-8")
 
 
 class TestInvoiceStatus:
@@ -29,35 +172,19 @@ class TestInvoiceStatus:
 
     def test_status_values(self):
         """Status values should match expected strings."""
-        assert InvoiceStatus.DRAFT.value == "draft"
-        assert InvoiceStatus.PENDING.value == "pending"
-        assert InvoiceStatus.PAID.value == "paid"
-        assert InvoiceStatus.OVERDUE.value == "overdue"
-        assert InvoiceStatus.CANCELLED.value == "cancelled"
-        assert InvoiceStatus.REFUNDED.value == "refunded"
+        assert tuple(status.value for status in InvoiceStatus) == (
+            "draft",
+            "pending",
+            "paid",
+            "overdue",
+            "cancelled",
+            "refunded",
+        )
 
 
 class TestInvoice:
     """Tests for Invoice dataclass."""
 
-    @pytest.fixture
-    def sample_invoice(self):
-        """Create sample invoice."""
-        return Invoice(
-            id="inv-123",
-            invoice_number="INV-2025-00001",
-            tenant_id="tenant-456",
-            status=InvoiceStatus.PENDING,
-            currency="EUR",
-            subtotal_cents=10000,
-            tax_rate_percent=Decimal("19.00"),
-            tax_cents=1900,
-            total_cents=11900,
-            credits_purchased=100,
-            price_per_credit_cents=100,
-            due_date=date(2025, 12, 31),
-        )
-
     def test_subtotal_property(self, sample_invoice):
         """Subtotal should return Decimal."""
         assert sample_invoice.subtotal == Decimal("100.00")
@@ -72,19 +199,7 @@ class TestInvoice:
 
     def test_is_paid_true(self):
         """is_paid should be True when status is PAID."""
-        invoice = Invoice(
-            id="inv-123",
-            invoice_number="INV-2025-00001",
-            tenant_id="tenant-456",
-            status=InvoiceStatus.PAID,
-            currency="EUR",
-            subtotal_cents=10000,
-            tax_rate_percent=Decimal("19.00"),
-            tax_cents=1900,
-            total_cents=11900,
-            credits_purchased=100,
-            price_per_credit_cents=100,
-        )
+        invoice = _make_invoice(status=InvoiceStatus.PAID)
         assert invoice.is_paid is True
 
     def test_is_paid_false(self, sample_invoice):
@@ -93,20 +208,7 @@ class TestInvoice:
 
     def test_is_overdue_true(self):
         """is_overdue should be True when past due date."""
-        invoice = Invoice(
-            id="inv-123",
-            invoice_number="INV-2025-00001",
-            tenant_id="tenant-456",
-            status=InvoiceStatus.PENDING,
-            currency="EUR",
-            subtotal_cents=10000,
-            tax_rate_percent=Decimal("19.00"),
-            tax_cents=1900,
-            total_cents=11900,
-            credits_purchased=100,
-            price_per_credit_cents=100,
-            due_date=date(2020, 1, 1),  # Past date
-        )
+        invoice = _make_invoice(due_date=date(2020, 1, 1))  # Past date
         assert invoice.is_overdue is True
 
     def test_is_overdue_false_future(self, sample_invoice):
@@ -115,18 +217,8 @@ class TestInvoice:
 
     def test_is_overdue_false_paid(self):
         """is_overdue should be False when already paid."""
-        invoice = Invoice(
-            id="inv-123",
-            invoice_number="INV-2025-00001",
-            tenant_id="tenant-456",
+        invoice = _make_invoice(
             status=InvoiceStatus.PAID,
-            currency="EUR",
-            subtotal_cents=10000,
-            tax_rate_percent=Decimal("19.00"),
-            tax_cents=1900,
-            total_cents=11900,
-            credits_purchased=100,
-            price_per_credit_cents=100,
             due_date=date(2020, 1, 1),  # Past date but paid
         )
         assert invoice.is_overdue is False
@@ -185,40 +277,22 @@ class TestInvoiceService:
     """Tests for InvoiceService."""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create mock Supabase client."""
-        client = MagicMock()
-        return client
+    def fake_client(self):
+        """Create fake Supabase client."""
+        return FakeSupabase()
 
     @pytest.fixture
-    def service(self, mock_client):
-        """Create invoice service with mock client."""
-        svc = InvoiceService()
-        svc._client = mock_client
-        return svc
+    def service(self, fake_client):
+        """Invoice service wired to this test's fake client."""
+        service = InvoiceService()
+        service._client = fake_client
+        return service
 
     @pytest.mark.asyncio
-    async def test_create_invoice(self, service, mock_client):
+    async def test_create_invoice(self, service, fake_client):
         """Should create invoice via RPC."""
-        mock_client.rpc.return_value.execute.return_value.data = "inv-new-123"
-
-        # Mock get_invoice for the return
-        mock_client.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value.data = {
-            "id": "inv-new-123",
-            "invoice_number": "INV-2025-00001",
-            "tenant_id": "tenant-456",
-            "status": "pending",
-            "currency": "EUR",
-            "subtotal_cents": 10000,
-            "tax_rate_percent": "19.00",
-            "tax_cents": 1900,
-            "total_cents": 11900,
-            "credits_purchased": 100,
-            "price_per_credit_cents": 100,
-        }
-
-        # Mock items query
-        mock_client.table.return_value.select.return_value.eq.return_value.order.return_value.execute.return_value.data = []
+        fake_client.set_rpc("inv-new-123")
+        fake_client.set_single_row("invoices", _INVOICE_ROW_CREATED)
 
         result = await service.create_invoice(
             tenant_id="tenant-456",
@@ -228,36 +302,13 @@ class TestInvoiceService:
         )
 
         assert result is not None
-        mock_client.rpc.assert_called_once()
+        assert [name for name, _ in fake_client.rpc_calls] == ["create_invoice"]
 
     @pytest.mark.asyncio
-    async def test_get_invoice(self, service, mock_client):
+    async def test_get_invoice(self, service, fake_client):
         """Should get invoice by ID."""
-        mock_client.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value.data = {
-            "id": "inv-123",
-            "invoice_number": "INV-2025-00001",
-            "tenant_id": "tenant-456",
-            "status": "pending",
-            "currency": "EUR",
-            "subtotal_cents": 10000,
-            "tax_rate_percent": "19.00",
-            "tax_cents": 1900,
-            "total_cents": 11900,
-            "credits_purchased": 100,
-            "price_per_credit_cents": 100,
-        }
-
-        # Mock items query
-        mock_client.table.return_value.select.return_value.eq.return_value.order.return_value.execute.return_value.data = [
-            {
-                "description": "AI Gateway Credits",
-                "quantity": 100,
-                "unit_price_cents": 100,
-                "total_cents": 10000,
-                "item_type": "credits",
-                "metadata": {},
-            }
-        ]
+        fake_client.set_single_row("invoices", _INVOICE_ROW_PENDING)
+        fake_client.set_rows("invoice_items", _INVOICE_ITEM_ROWS)
 
         result = await service.get_invoice("inv-123")
 
@@ -268,66 +319,40 @@ class TestInvoiceService:
         assert len(result.items) == 1
 
     @pytest.mark.asyncio
-    async def test_get_invoice_not_found(self, service, mock_client):
+    async def test_get_invoice_not_found(self, service, fake_client):
         """Should return None when invoice not found."""
-        mock_client.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value.data = None
+        fake_client.set_single_row("invoices", None)
 
         result = await service.get_invoice("nonexistent")
 
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_list_invoices(self, service, mock_client):
+    async def test_list_invoices(self, service, fake_client):
         """Should list invoices for tenant."""
-        mock_client.table.return_value.select.return_value.eq.return_value.order.return_value.range.return_value.execute.return_value.data = [
-            {
-                "id": "inv-1",
-                "invoice_number": "INV-2025-00001",
-                "tenant_id": "tenant-456",
-                "status": "paid",
-                "currency": "EUR",
-                "subtotal_cents": 10000,
-                "tax_rate_percent": "19.00",
-                "tax_cents": 1900,
-                "total_cents": 11900,
-                "credits_purchased": 100,
-                "price_per_credit_cents": 100,
-            },
-            {
-                "id": "inv-2",
-                "invoice_number": "INV-2025-00002",
-                "tenant_id": "tenant-456",
-                "status": "pending",
-                "currency": "EUR",
-                "subtotal_cents": 5000,
-                "tax_rate_percent": "19.00",
-                "tax_cents": 950,
-                "total_cents": 5950,
-                "credits_purchased": 50,
-                "price_per_credit_cents": 100,
-            },
-        ]
+        fake_client.set_rows("invoices", _INVOICE_LIST_ROWS)
 
         result = await service.list_invoices("tenant-456")
 
         assert len(result) == 2
         assert result[0].invoice_number == "INV-2025-00001"
         assert result[1].invoice_number == "INV-2025-00002"
+        (query,) = fake_client.queries
+        assert ("order", ("created_at",), {"desc": True}) in query.calls
 
     @pytest.mark.asyncio
-    async def test_list_invoices_with_status_filter(self, service, mock_client):
+    async def test_list_invoices_with_status_filter(self, service, fake_client):
         """Should filter invoices by status."""
-        mock_client.table.return_value.select.return_value.eq.return_value.order.return_value.range.return_value.eq.return_value.execute.return_value.data = []
-
         await service.list_invoices("tenant-456", status=InvoiceStatus.PENDING)
 
         # Verify eq was called for status
-        mock_client.table.return_value.select.return_value.eq.return_value.order.return_value.range.return_value.eq.assert_called_once()
+        (query,) = fake_client.queries
+        assert ("eq", ("status", "pending"), {}) in query.calls
 
     @pytest.mark.asyncio
-    async def test_mark_paid(self, service, mock_client):
+    async def test_mark_paid(self, service, fake_client):
         """Should mark invoice as paid via RPC."""
-        mock_client.rpc.return_value.execute.return_value.data = True
+        fake_client.set_rpc(True)
 
         result = await service.mark_paid(
             invoice_id="inv-123",
@@ -336,156 +361,102 @@ class TestInvoiceService:
         )
 
         assert result is True
-        mock_client.rpc.assert_called_once_with(
-            "mark_invoice_paid",
-            {
-                "p_invoice_id": "inv-123",
-                "p_payment_method": "stripe",
-                "p_payment_reference": "pi_123456",
-            },
-        )
+        assert fake_client.rpc_calls == [
+            (
+                "mark_invoice_paid",
+                {
+                    "p_invoice_id": "inv-123",
+                    "p_payment_method": "stripe",
+                    "p_payment_reference": "pi_123456",
+                },
+            )
+        ]
 
     @pytest.mark.asyncio
-    async def test_mark_paid_failure(self, service, mock_client):
+    async def test_mark_paid_failure(self, service, fake_client):
         """Should return False on payment failure."""
-        mock_client.rpc.return_value.execute.return_value.data = False
+        fake_client.set_rpc(False)
 
         result = await service.mark_paid("inv-123")
 
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_cancel_invoice(self, service, mock_client):
+    async def test_cancel_invoice(self, service, fake_client):
         """Should cancel pending invoice."""
-        mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value.data = [
-            {"id": "inv-123"}
-        ]
+        fake_client.set_updated("invoices", [{"id": "inv-123"}])
 
         result = await service.cancel_invoice("inv-123")
 
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_cancel_invoice_not_pending(self, service, mock_client):
+    async def test_cancel_invoice_not_pending(self, service, fake_client):
         """Should fail to cancel non-pending invoice."""
-        mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value.data = []
+        fake_client.set_updated("invoices", [])
 
         result = await service.cancel_invoice("inv-123")
 
         assert result is False
 
 
+@pytest.mark.slow
 class TestPDFGeneration:
     """Tests for PDF generation."""
 
-    @pytest.fixture
-    def service(self):
-        """Create invoice service."""
-        return InvoiceService(InvoiceConfig(
-            company_name="Test Company",
-            company_address="Test Address",
-            company_vat_id="DE123456789",
-        ))
-
-    @pytest.fixture
-    def sample_invoice(self):
-        """Create sample invoice for PDF."""
-        return Invoice(
-            id="inv-123",
-            invoice_number="INV-2025-00001",
-            tenant_id="tenant-456",
-            status=InvoiceStatus.PENDING,
-            currency="EUR",
-            subtotal_cents=10000,
-            tax_rate_percent=Decimal("19.00"),
-            tax_cents=1900,
-            total_cents=11900,
-            credits_purchased=100,
-            price_per_credit_cents=100,
-            billing_name="Test Customer",
-            billing_email="customer@test.com",
-            billing_address="Customer Address",
-            due_date=date(2025, 12, 31),
-            created_at=datetime(2025, 12, 1, 12, 0, 0, tzinfo=timezone.utc),
-            items=[
-                InvoiceItem(
-                    description="AI Gateway Credits",
-                    quantity=100,
-                    unit_price_cents=100,
-                    total_cents=10000,
-                    item_type="credits",
-                )
-            ],
-        )
-
-    def test_generate_pdf(self, service, sample_invoice):
+    def test_generate_pdf(self, generated_pdf):
         """Should generate PDF bytes."""
-        pdf = service.generate_pdf(sample_invoice)
-
-        assert isinstance(pdf, bytes)
-        assert len(pdf) > 0
+        assert isinstance(generated_pdf, bytes)
+        assert len(generated_pdf) > 0
 
-    def test_pdf_contains_invoice_number(self, service, sample_invoice):
+    def test_pdf_contains_invoice_number(self, pdf_content):
         """PDF should contain invoice number."""
-        pdf = service.generate_pdf(sample_invoice)
-        content = pdf.decode("utf-8")
-
-        assert "INV-2025-00001" in content
+        assert "INV-2025-00001" in pdf_content
 
-    def test_pdf_contains_company_info(self, service, sample_invoice):
+    def test_pdf_contains_company_info(self, pdf_content):
         """PDF should contain company info."""
-        pdf = service.generate_pdf(sample_invoice)
-        content = pdf.decode("utf-8")
-
-        assert "Test Company" in content
-        assert "Test Address" in content
-        assert "DE123456789" in content
+        assert "Test Company" in pdf_content
+        assert "Test Address" in pdf_content
+        assert "DE123456789" in pdf_content
 
-    def test_pdf_contains_billing_info(self, service, sample_invoice):
+    def test_pdf_contains_billing_info(self, pdf_content):
         """PDF should contain billing info."""
-        pdf = service.generate_pdf(sample_invoice)
-        content = pdf.decode("utf-8")
-
-        assert "Test Customer" in content
-        assert "customer@test.com" in content
+        assert "Test Customer" in pdf_content
+        assert "customer@test.com" in pdf_content
 
-    def test_pdf_contains_items(self, service, sample_invoice):
+    def test_pdf_contains_items(self, pdf_content):
         """PDF should contain line items."""
-        pdf = service.generate_pdf(sample_invoice)
-        content = pdf.decode("utf-8")
-
-        assert "AI Gateway Credits" in content
+        assert "AI Gateway Credits" in pdf_content
 
-    def test_pdf_contains_totals(self, service, sample_invoice):
+    def test_pdf_contains_totals(self, pdf_content):
         """PDF should contain totals."""
-        pdf = service.generate_pdf(sample_invoice)
-        content = pdf.decode("utf-8")
+        assert "Subtotal" in pdf_content
+        assert "Tax" in pdf_content
+        assert "TOTAL" in pdf_content
+
+    def test_generate_pdf_benchmark(self, benchmark, pdf_service, pdf_invoice):
+        """Track generate_pdf throughput (timed only with --benchmark-enable)."""
+        pdf = benchmark.pedantic(
+            pdf_service.generate_pdf,
+            args=(pdf_invoice,),
+            rounds=20,
+            iterations=5,
+            warmup_rounds=1,
+        )
 
-        assert "Subtotal" in content
-        assert "Tax" in content
-        assert "TOTAL" in content
+        assert b"INV-2025-00001" in pdf
 
-    def test_pdf_paid_invoice(self, service):
+    def test_pdf_paid_invoice(self, pdf_service):
         """PDF should show payment info for paid invoice."""
-        invoice = Invoice(
-            id="inv-123",
-            invoice_number="INV-2025-00001",
-            tenant_id="tenant-456",
+        invoice = _make_invoice(
             status=InvoiceStatus.PAID,
-            currency="EUR",
-            subtotal_cents=10000,
-            tax_rate_percent=Decimal("19.00"),
-            tax_cents=1900,
-            total_cents=11900,
-            credits_purchased=100,
-            price_per_credit_cents=100,
             payment_method="stripe",
             payment_reference="pi_123456",
             paid_at=datetime(2025, 12, 5, 12, 0, 0, tzinfo=timezone.utc),
             items=[],
         )
 
-        pdf = service.generate_pdf(invoice)
+        pdf = pdf_service.generate_pdf(invoice)
         content = pdf.decode("utf-8")
 
         assert "PAID" in content
@@ -496,35 +467,19 @@ class TestPDFGeneration:
 class TestAmountFormatting:
     """Tests for amount formatting."""
 
-    @pytest.fixture
-    def service(self):
-        """Create invoice service."""
-        return InvoiceService()
-
-    def test_format_eur(self, service):
-        """Should format EUR amounts correctly."""
-        result = service.format_amount(10000, "EUR")
-        assert result == "€100.00"
-
-    def test_format_usd(self, service):
-        """Should format USD amounts correctly."""
-        result = service.format_amount(10000, "USD")
-        assert result == "$100.00"
-
-    def test_format_other_currency(self, service):
-        """Should format other currencies with code."""
-        result = service.format_amount(10000, "GBP")
-        assert result == "GBP 100.00"
-
-    def test_format_with_thousands(self, service):
-        """Should format large amounts with thousands separator."""
-        result = service.format_amount(100000000, "EUR")
-        assert result == "€1,000,000.00"
-
-    def test_format_cents(self, service):
-        """Should handle cent amounts correctly."""
-        result = service.format_amount(99, "EUR")
-        assert result == "€0.99"
+    @pytest.mark.parametrize(
+        "cents,currency,expected",
+        [
+            pytest.param(10000, "EUR", "€100.00", id="eur"),
+            pytest.param(10000, "USD", "$100.00", id="usd"),
+            pytest.param(10000, "GBP", "GBP 100.00", id="other-currency"),
+            pytest.param(100000000, "EUR", "€1,000,000.00", id="thousands"),
+            pytest.param(99, "EUR", "€0.99", id="cents"),
+        ],
+    )
+    def test_format_amount(self, config_service, cents, currency, expected):
+        """Should format amounts with symbol, thousands separator and cents."""
+        assert config_service.format_amount(cents, currency) == expected
 
 
 class TestGetInvoiceService:
@@ -545,43 +500,37 @@ class TestGetInvoiceService:
 class TestDateParsing:
     """Tests for date parsing utilities."""
 
-    @pytest.fixture
-    def service(self):
-        """Create invoice service."""
-        return InvoiceService()
-
-    def test_parse_date_iso(self, service):
-        """Should parse ISO date string."""
-        result = service._parse_date("2025-12-01")
-        assert result == date(2025, 12, 1)
-
-    def test_parse_date_with_time(self, service):
-        """Should parse datetime string to date."""
-        result = service._parse_date("2025-12-01T12:00:00+00:00")
-        assert result == date(2025, 12, 1)
-
-    def test_parse_date_none(self, service):
-        """Should return None for None input."""
-        result = service._parse_date(None)
-        assert result is None
-
-    def test_parse_date_invalid(self, service):
-        """Should return None for invalid input."""
-        result = service._parse_date("invalid")
-        assert result is None
-
-    def test_parse_datetime_iso(self, service):
-        """Should parse ISO datetime string."""
-        result = service._parse_datetime("2025-12-01T12:00:00+00:00")
-        assert result == datetime(2025, 12, 1, 12, 0, 0, tzinfo=timezone.utc)
-
-    def test_parse_datetime_with_z(self, service):
-        """Should parse datetime with Z suffix."""
-        result = service._parse_datetime("2025-12-01T12:00:00Z")
-        assert result is not None
-        assert result.year == 2025
-
-    def test_parse_datetime_none(self, service):
-        """Should return None for None input."""
-        result = service._parse_datetime(None)
-        assert result is None
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            pytest.param("2025-12-01", date(2025, 12, 1), id="iso"),
+            pytest.param(
+                "2025-12-01T12:00:00+00:00", date(2025, 12, 1), id="with-time"
+            ),
+            pytest.param(None, None, id="none"),
+            pytest.param("invalid", None, id="invalid"),
+        ],
+    )
+    def test_parse_date(self, config_service, value, expected):
+        """Should parse date strings and return None for missing or bad input."""
+        assert config_service._parse_date(value) == expected
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            pytest.param(
+                "2025-12-01T12:00:00+00:00",
+                datetime(2025, 12, 1, 12, 0, 0, tzinfo=timezone.utc),
+                id="iso",
+            ),
+            pytest.param(
+                "2025-12-01T12:00:00Z",
+                datetime(2025, 12, 1, 12, 0, 0, tzinfo=timezone.utc),
+                id="with-z",
+            ),
+            pytest.param(None, None, id="none"),
+        ],
+    )
+    def test_parse_datetime(self, config_service, value, expected):
+        """Should parse ISO datetimes, including a Z suffix."""
+        assert config_service._parse_datetime(value) == expected
@@ -8,10 +8,29 @@ Tests:
 - Empty list = block all
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, MagicMock
 
-from app.core.ip_whitelist import is_ip_allowed, get_client_ip, validate_ip_whitelist
+from app.core.ip_whitelist import (
+    is_ip_allowed,
+    is_ip_allowed_many,
+    get_client_ip,
+    validate_ip_whitelist,
+    WhitelistConfig,
+)
+
+
+_EXACT_LIST = ["192.168.1.100", "10.0.0.50"]
+_CIDR_LIST = ["192.168.1.0/24", "10.0.0.0/8"]
+_MIXED_LIST = ["8.8.8.8", "192.168.0.0/16"]
+
+
+@pytest.fixture(scope="module")
+def large_whitelist():
+    """10k /24 networks plus a few host and IPv6 entries, built once."""
+    networks = [f"10.{i // 256}.{i % 256}.0/24" for i in range(10_000)]
+    return networks + ["8.8.8.8", "2001:db8::/32", "invalid-entry"]
 
 
 class TestIsIpAllowed:
@@ -28,40 +47,32 @@ class TestIsIpAllowed:
         assert is_ip_allowed("192.168.1.1", []) is False
         assert is_ip_allowed("10.0.0.1", []) is False
 
-    def test_exact_ip_match(self):
-        """Exact IP addresses should match."""
-        allowed = ["192.168.1.100", "10.0.0.50"]
-        
-        assert is_ip_allowed("192.168.1.100", allowed) is True
-        assert is_ip_allowed("10.0.0.50", allowed) is True
-        assert is_ip_allowed("192.168.1.101", allowed) is False
-        assert is_ip_allowed("8.8.8.8", allowed) is False
-
-    def test_cidr_notation(self):
-        """CIDR notation should match IP ranges."""
-        allowed = ["192.168.1.0/24", "10.0.0.0/8"]
-        
-        # Within 192.168.1.0/24
-        assert is_ip_allowed("192.168.1.1", allowed) is True
-        assert is_ip_allowed("192.168.1.254", allowed) is True
-        
-        # Outside 192.168.1.0/24
-        assert is_ip_allowed("192.168.2.1", allowed) is False
-        
-        # Within 10.0.0.0/8 (any 10.x.x.x)
-        assert is_ip_allowed("10.0.0.1", allowed) is True
-        assert is_ip_allowed("10.255.255.255", allowed) is True
-        
-        # Outside
-        assert is_ip_allowed("11.0.0.1", allowed) is False
-
-    def test_mixed_ips_and_cidrs(self):
-        """Mixed list of IPs and CIDRs should work."""
-        allowed = ["8.8.8.8", "192.168.0.0/16"]
-        
-        assert is_ip_allowed("8.8.8.8", allowed) is True
-        assert is_ip_allowed("192.168.1.1", allowed) is True
-        assert is_ip_allowed("10.0.0.1", allowed) is False
+    @pytest.mark.parametrize(
+        "ip,allowed,expected",
+        [
+            # Exact IP addresses
+            ("192.168.1.100", _EXACT_LIST, True),
+            ("10.0.0.50", _EXACT_LIST, True),
+            ("192.168.1.101", _EXACT_LIST, False),
+            ("8.8.8.8", _EXACT_LIST, False),
+            # Within 192.168.1.0/24
+            ("192.168.1.1", _CIDR_LIST, True),
+            ("192.168.1.254", _CIDR_LIST, True),
+            # Outside 192.168.1.0/24
+            ("192.168.2.1", _CIDR_LIST, False),
+            # Within 10.0.0.0/8 (any 10.x.x.x)
+            ("10.0.0.1", _CIDR_LIST, True),
+            ("10.255.255.255", _CIDR_LIST, True),
+            ("11.0.0.1", _CIDR_LIST, False),
+            # Mixed list of IPs and CIDRs
+            ("8.8.8.8", _MIXED_LIST, True),
+            ("192.168.1.1", _MIXED_LIST, True),
+            ("10.0.0.1", _MIXED_LIST, False),
+        ],
+    )
+    def test_whitelist_matching(self, ip, allowed, expected):
+        """Exact IPs, CIDR ranges and mixed lists should match as configured."""
+        assert is_ip_allowed(ip, allowed) is expected
 
     def test_invalid_client_ip(self):
         """Invalid client IP should be rejected."""
@@ -77,56 +88,115 @@ class TestIsIpAllowed:
         # Non-matching IP should not match
         assert is_ip_allowed("192.168.1.1", allowed) is False
 
+    @pytest.mark.parametrize(
+        "ip,allowed,expected",
+        [
+            ("fe80::1%eth0", ["fe80::1%eth0"], True),
+            ("fe80::1", ["fe80::1%eth0"], False),
+            ("fe80::1%eth0", ["fe80::1"], False),
+            ("fe80::1%eth1", ["fe80::1%eth0"], False),
+            # CIDR ranges match by address, regardless of scope
+            ("fe80::1%eth0", ["fe80::/64"], True),
+        ],
+    )
+    def test_ipv6_scope_id(self, ip, allowed, expected):
+        """Single-IP entries should keep IPv6 scope ids distinct."""
+        assert is_ip_allowed(ip, allowed) is expected
+
+
+class TestWhitelistIndex:
+    """Tests for large whitelists and bulk matching."""
+
+    def test_single_lookups(self, large_whitelist):
+        """Lookups should match any of the configured prefix lengths."""
+        assert is_ip_allowed("10.0.0.1", large_whitelist) is True
+        assert is_ip_allowed("10.39.15.200", large_whitelist) is True
+        assert is_ip_allowed("10.39.16.1", large_whitelist) is False
+        assert is_ip_allowed("8.8.8.8", large_whitelist) is True
+        assert is_ip_allowed("2001:db8::1", large_whitelist) is True
+
+    def test_bulk_matching(self, large_whitelist):
+        """Bulk results should follow input order and match single lookups."""
+        ips = ["10.12.34.56", "8.8.4.4", "2001:db9::1", "not-an-ip", "8.8.8.8"]
+
+        results = is_ip_allowed_many(ips, large_whitelist)
+
+        assert results == [True, False, False, False, True]
+        assert results == [is_ip_allowed(ip, large_whitelist) for ip in ips]
+
+    def test_config_matches_string_list(self, large_whitelist):
+        """A prebuilt WhitelistConfig should match like its source strings."""
+        cfg = WhitelistConfig.from_strings(large_whitelist)
+        ips = ["10.12.34.56", "10.39.16.1", "8.8.8.8", "2001:db8::1", "::1"]
+
+        assert len(cfg) == len(large_whitelist) - 1  # invalid entry skipped
+        assert is_ip_allowed_many(ips, cfg) == is_ip_allowed_many(
+            ips, large_whitelist
+        )
+
+    def test_empty_config_blocks_all(self):
+        """A WhitelistConfig without networks should block every IP."""
+        assert is_ip_allowed("192.168.1.1", WhitelistConfig(())) is False
+
+    def test_bulk_matching_none_and_empty(self):
+        """None allows every IP and an empty list blocks every IP."""
+        ips = ["192.168.1.1", "10.0.0.1"]
+
+        assert is_ip_allowed_many(ips, None) == [True, True]
+        assert is_ip_allowed_many(ips, []) == [False, False]
+
 
 class TestGetClientIp:
     """Tests for extracting client IP from request."""
 
     def test_uses_validated_ip_from_middleware(self):
         """Should use validated IP from TrustedProxyMiddleware (SEC-011)."""
-        request = Mock()
-        request.state = Mock()
-        request.state.client_ip = "203.0.113.50"  # Set by middleware
-        request.headers = {"X-Forwarded-For": "1.2.3.4"}  # Should be ignored
-        request.client = Mock()
-        request.client.host = "10.0.0.1"
+        request = SimpleNamespace(
+            state=SimpleNamespace(client_ip="203.0.113.50"),  # Set by middleware
+            headers={"X-Forwarded-For": "1.2.3.4"},  # Should be ignored
+            client=SimpleNamespace(host="10.0.0.1"),
+        )
 
         # Should use validated IP from middleware
         assert get_client_ip(request) == "203.0.113.50"
 
     def test_x_forwarded_for_header_fallback(self):
         """Should extract IP from X-Forwarded-For header (legacy fallback)."""
-        request = Mock()
-        request.state = Mock(spec=[])  # No client_ip attribute
-        request.headers = {"X-Forwarded-For": "203.0.113.50"}
-        request.client = None
+        request = SimpleNamespace(
+            state=SimpleNamespace(),  # No client_ip attribute
+            headers={"X-Forwarded-For": "203.0.113.50"},
+            client=None,
+        )
 
         assert get_client_ip(request) == "203.0.113.50"
 
     def test_x_forwarded_for_multiple_ips_fallback(self):
         """Should use first IP from X-Forwarded-For chain (legacy fallback)."""
-        request = Mock()
-        request.state = Mock(spec=[])  # No client_ip attribute
-        request.headers = {"X-Forwarded-For": "203.0.113.50, 70.41.3.18, 150.172.238.178"}
-        request.client = None
+        request = SimpleNamespace(
+            state=SimpleNamespace(),  # No client_ip attribute
+            headers={"X-Forwarded-For": "203.0.113.50, 70.41.3.18, 150.172.238.178"},
+            client=None,
+        )
 
         assert get_client_ip(request) == "203.0.113.50"
 
     def test_direct_client(self):
         """Should fall back to direct client IP."""
-        request = Mock()
-        request.state = Mock(spec=[])  # No client_ip attribute
-        request.headers = {}
-        request.client = Mock()
-        request.client.host = "192.168.1.100"
+        request = SimpleNamespace(
+            state=SimpleNamespace(),  # No client_ip attribute
+            headers={},
+            client=SimpleNamespace(host="192.168.1.100"),
+        )
 
         assert get_client_ip(request) == "192.168.1.100"
 
     def test_no_client_info(self):
         """Should return 'unknown' if no client info available."""
-        request = Mock()
-        request.state = Mock(spec=[])  # No client_ip attribute
-        request.headers = {}
-        request.client = None
+        request = SimpleNamespace(
+            state=SimpleNamespace(),  # No client_ip attribute
+            headers={},
+            client=None,
+        )
 
         assert get_client_ip(request) == "unknown"
 
@@ -134,35 +204,54 @@ class TestGetClientIp:
 class TestValidateIpWhitelist:
     """Tests for the main validation function."""
 
+    cfg = WhitelistConfig.from_strings(["192.168.1.0/24"])
+
     def test_allows_when_null(self):
         """Should allow when allowed_ips is None."""
-        request = Mock()
-        request.state = Mock()
-        request.state.client_ip = "192.168.1.1"  # From middleware
-        request.headers = {}
-        request.client = Mock()
-        request.client.host = "192.168.1.1"
+        request = SimpleNamespace(
+            state=SimpleNamespace(client_ip="192.168.1.1"),  # From middleware
+            headers={},
+            client=SimpleNamespace(host="192.168.1.1"),
+        )
 
         assert validate_ip_whitelist(request, None) is True
 
     def test_blocks_when_not_in_list(self):
         """Should block when IP not in whitelist."""
-        request = Mock()
-        request.state = Mock()
-        request.state.client_ip = "192.168.1.1"  # From middleware
-        request.headers = {}
-        request.client = Mock()
-        request.client.host = "192.168.1.1"
+        request = SimpleNamespace(
+            state=SimpleNamespace(client_ip="192.168.1.1"),  # From middleware
+            headers={},
+            client=SimpleNamespace(host="192.168.1.1"),
+        )
 
         assert validate_ip_whitelist(request, ["10.0.0.1"]) is False
 
     def test_allows_when_in_list(self):
         """Should allow when IP is in whitelist."""
-        request = Mock()
-        request.state = Mock()
-        request.state.client_ip = "192.168.1.1"  # From middleware
-        request.headers = {}
-        request.client = Mock()
-        request.client.host = "192.168.1.1"
+        request = SimpleNamespace(
+            state=SimpleNamespace(client_ip="192.168.1.1"),  # From middleware
+            headers={},
+            client=SimpleNamespace(host="192.168.1.1"),
+        )
 
         assert validate_ip_whitelist(request, ["192.168.1.0/24"]) is True
+
+    def test_allows_when_in_config(self):
+        """Should allow when IP is in a prebuilt WhitelistConfig."""
+        request = SimpleNamespace(
+            state=SimpleNamespace(client_ip="192.168.1.1"),  # From middleware
+            headers={},
+            client=SimpleNamespace(host="192.168.1.1"),
+        )
+
+        assert validate_ip_whitelist(request, self.cfg) is True
+
+    def test_blocks_when_not_in_config(self):
+        """Should block when IP is outside a prebuilt WhitelistConfig."""
+        request = SimpleNamespace(
+            state=SimpleNamespace(client_ip="10.0.0.1"),  # From middleware
+            headers={},
+            client=SimpleNamespace(host="10.0.0.1"),
+        )
+
+        assert validate_ip_whitelist(request, self.cfg) is False
@@ -1,13 +1,9 @@
-
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
 class TestLandingPage:
     
-    def test_rendering_landing_page(self):
+    def test_rendering_landing_page(self, client):
         """Test suitable HTML rendering of the landing page."""
         response = client.get("/")
         
@@ -16,7 +12,7 @@ class TestLandingPage:
         assert "AI Legal Ops" in response.text
         assert "Secure AI Orchestration" in response.text
         
-    def test_cookie_banner_present(self):
+    def test_cookie_banner_present(self, client):
         """Test that the cookie banner HTML is present in the response."""
         response = client.get("/")
         
@@ -30,7 +26,7 @@ class TestLandingPage:
 
 class TestLegalPages:
     
-    def test_privacy_policy_page(self):
+    def test_privacy_policy_page(self, client):
         """Test that /privacy returns the privacy policy."""
         response = client.get("/privacy")
         
@@ -39,7 +35,7 @@ class TestLegalPages:
         assert "Datenschutzerklärung" in response.text
         assert "DSGVO" in response.text
         
-    def test_terms_of_service_page(self):
+    def test_terms_of_service_page(self, client):
         """Test that /terms returns the terms of service."""
         response = client.get("/terms")
         
@@ -1,8 +1,21 @@
+import copy
 import logging
 import pytest
 from app.core.logging import PrivacyLogFilter
 
 
+# Basic record built once; log_record hands each test its own copy
+_TEMPLATE_RECORD = logging.LogRecord(
+    name="test_logger",
+    level=logging.INFO,
+    pathname=__file__,
+    lineno=10,
+    msg="Test message",
+    args=(),
+    exc_info=None
+)
+
+
 class TestPrivacyLogFilter:
     """Tests for PrivacyLogFilter."""
 
@@ -13,16 +26,8 @@ class TestPrivacyLogFilter:
 
     @pytest.fixture
     def log_record(self):
-        """Create a basic LogRecord for testing."""
-        return logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname=__file__,
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None
-        )
+        """Shallow copy of the template; tests only reassign msg/args."""
+        return copy.copy(_TEMPLATE_RECORD)
 
     def test_filter_sanitizes_email(self, filter, log_record):
         """Test that emails in log messages are redacted."""
@@ -86,3 +91,16 @@ class TestPrivacyLogFilter:
         filter.filter(log_record)
         
         assert log_record.args[0] == 42
+
+    def test_filter_redacts_all_pii_types(self, filter, log_record):
+        """Test that email, phone and IBAN are redacted together."""
+        log_record.msg = (
+            "Refund for user@example.com, IBAN DE12345678901234567890, "
+            "call +49 123 456789"
+        )
+        filter.filter(log_record)
+
+        assert log_record.msg == (
+            "Refund for <EMAIL_REMOVED>, IBAN <IBAN_REMOVED>, "
+            "call <PHONE_REMOVED>"
+        )
@@ -1,11 +1,4 @@
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-client = TestClient(app)
-
-
-def test_read_main():
+def test_read_main(client):
     """Test landing page returns HTML."""
     response = client.get("/")
     assert response.status_code == 200
@@ -13,7 +6,7 @@ def test_read_main():
     assert "text/html" in response.headers["content-type"]
 
 
-def test_health_check():
+def test_health_check(client):
     """Test health endpoint returns JSON with expected structure."""
     response = client.get("/health")
     assert response.status_code == 200
@@ -24,14 +17,14 @@ def test_health_check():
     assert "uptime_seconds" in data
 
 
-def test_privacy_page():
+def test_privacy_page(client):
     """Test privacy page returns HTML."""
     response = client.get("/privacy")
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
 
 
-def test_terms_page():
+def test_terms_page(client):
     """Test terms page returns HTML."""
     response = client.get("/terms")
     assert response.status_code == 200
@@ -1,13 +1,10 @@
 import pytest
 import uuid
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
 class TestMiddleware:
     
-    def test_request_id_header_present(self):
+    def test_request_id_header_present(self, client):
         """Test that X-Request-ID header is added to responses."""
         response = client.get("/health")
         assert response.status_code == 200
@@ -22,7 +19,7 @@ class TestMiddleware:
         except ValueError:
             pytest.fail(f"X-Request-ID is not a valid UUID: {request_id}")
 
-    def test_request_id_unique(self):
+    def test_request_id_unique(self, client):
         """Test that request IDs are unique per request."""
         res1 = client.get("/health")
         res2 = client.get("/health")
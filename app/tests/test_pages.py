@@ -11,19 +11,106 @@ Tests:
 - Blog endpoint
 """
 
+import asyncio
+
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.v1.pages import (
+    get_blog_posts,
+    get_changelog,
+    get_contact_info,
+    get_developer_portal,
+    get_documentation,
+    get_help_center,
+    get_system_status,
+    router,
+)
+
+ENDPOINTS = (
+    "/documentation",
+    "/developers",
+    "/changelog",
+    "/contact",
+    "/help",
+    "/status",
+    "/blog",
+)
+
+
+def _json(response):
+    """Parse a response body with orjson, skipping the bytes-to-str decode."""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="module")
+def pages_app():
+    """App with only the pages router mounted, built once per module."""
+    app = FastAPI()
+    app.include_router(router)
+    return app
 
-from app.api.v1.pages import router
 
+@pytest.fixture(scope="module")
+def client(pages_app):
+    """Create test client once per module, entered as a context manager."""
+    with TestClient(pages_app) as c:
+        yield c
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    app = FastAPI()
-    app.include_router(router)
-    return TestClient(app)
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def aclient(pages_app):
+    """Async in-process client for the pages app (session event loop)."""
+    async with AsyncClient(
+        transport=ASGITransport(app=pages_app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+@pytest.fixture(scope="class")
+def docs_data():
+    """Documentation payload from the handler, built once per test class."""
+    return asyncio.run(get_documentation(lang="en"))
+
+
+@pytest.fixture(scope="class")
+def developers_data():
+    """Developer portal payload from the handler, built once per test class."""
+    return asyncio.run(get_developer_portal(lang="en"))
+
+
+@pytest.fixture(scope="class")
+def changelog_data():
+    """Changelog payload from the handler, built once per test class."""
+    return asyncio.run(get_changelog(limit=10, offset=0))
+
+
+@pytest.fixture(scope="class")
+def contact_data():
+    """Contact payload from the handler, built once per test class."""
+    return asyncio.run(get_contact_info())
+
+
+@pytest.fixture(scope="class")
+def help_data():
+    """Help center payload from the handler, built once per test class."""
+    return asyncio.run(get_help_center(category=None, search=None))
+
+
+@pytest.fixture(scope="class")
+def status_data():
+    """System status payload from the handler, built once per test class."""
+    return asyncio.run(get_system_status())
+
+
+@pytest.fixture(scope="class")
+def blog_data():
+    """Blog payload from the handler, built once per test class."""
+    return asyncio.run(get_blog_posts(search=None, tag=None, limit=10, offset=0))
 
 
 class TestDocumentation:
@@ -34,48 +121,36 @@ class TestDocumentation:
         response = client.get("/documentation")
         assert response.status_code == 200
 
-        data = response.json()
+        data = _json(response)
         assert "categories" in data
         assert "last_updated" in data
         assert "version" in data
 
-    def test_docs_has_categories(self, client):
+    def test_docs_has_categories(self, docs_data):
         """Should have multiple documentation categories."""
-        response = client.get("/documentation")
-        data = response.json()
-
-        assert len(data["categories"]) > 0
+        assert len(docs_data["categories"]) > 0
 
-    def test_docs_category_structure(self, client):
+    def test_docs_category_structure(self, docs_data):
         """Each category should have proper structure."""
-        response = client.get("/documentation")
-        data = response.json()
-
-        for category in data["categories"]:
+        for category in docs_data["categories"]:
             assert "id" in category
             assert "title" in category
             assert "description" in category
             assert "icon" in category
             assert "sections" in category
 
-    def test_docs_section_structure(self, client):
+    def test_docs_section_structure(self, docs_data):
         """Each section should have proper structure."""
-        response = client.get("/documentation")
-        data = response.json()
-
-        for category in data["categories"]:
+        for category in docs_data["categories"]:
             for section in category["sections"]:
                 assert "id" in section
                 assert "title" in section
                 assert "content" in section
 
-    def test_docs_has_code_examples(self, client):
+    def test_docs_has_code_examples(self, docs_data):
         """Some sections should have code examples."""
-        response = client.get("/documentation")
-        data = response.json()
-
         has_code = False
-        for category in data["categories"]:
+        for category in docs_data["categories"]:
             for section in category["sections"]:
                 if section.get("code_example"):
                     has_code = True
@@ -97,40 +172,31 @@ class TestDeveloperPortal:
         response = client.get("/developers")
         assert response.status_code == 200
 
-        data = response.json()
+        data = _json(response)
         assert "sdks" in data
         assert "code_examples" in data
         assert "api_reference" in data
         assert "resources" in data
 
-    def test_sdks_structure(self, client):
+    def test_sdks_structure(self, developers_data):
         """SDKs should have proper structure."""
-        response = client.get("/developers")
-        data = response.json()
-
-        for sdk in data["sdks"]:
+        for sdk in developers_data["sdks"]:
             assert "name" in sdk
             assert "language" in sdk
             assert "version" in sdk
             assert "install" in sdk
 
-    def test_code_examples_structure(self, client):
+    def test_code_examples_structure(self, developers_data):
         """Code examples should have proper structure."""
-        response = client.get("/developers")
-        data = response.json()
-
-        for example in data["code_examples"]:
+        for example in developers_data["code_examples"]:
             assert "title" in example
             assert "description" in example
             assert "language" in example
             assert "code" in example
 
-    def test_api_reference_has_openapi(self, client):
+    def test_api_reference_has_openapi(self, developers_data):
         """API reference should include OpenAPI URL."""
-        response = client.get("/developers")
-        data = response.json()
-
-        assert "openapi_url" in data["api_reference"]
+        assert "openapi_url" in developers_data["api_reference"]
 
 
 class TestChangelog:
@@ -141,47 +207,37 @@ class TestChangelog:
         response = client.get("/changelog")
         assert response.status_code == 200
 
-        data = response.json()
+        data = _json(response)
         assert "entries" in data
         assert "total" in data
         assert "has_more" in data
 
-    def test_changelog_entry_structure(self, client):
+    def test_changelog_entry_structure(self, changelog_data):
         """Entries should have proper structure."""
-        response = client.get("/changelog")
-        data = response.json()
-
-        for entry in data["entries"]:
+        for entry in changelog_data["entries"]:
             assert "version" in entry
             assert "date" in entry
             assert "title" in entry
             assert "description" in entry
             assert "changes" in entry
 
-    def test_changelog_change_structure(self, client):
+    def test_changelog_change_structure(self, changelog_data):
         """Changes should have type and text."""
-        response = client.get("/changelog")
-        data = response.json()
-
-        for entry in data["entries"]:
+        for entry in changelog_data["entries"]:
             for change in entry["changes"]:
                 assert "type" in change
                 assert "text" in change
 
-    def test_changelog_pagination_limit(self, client):
+    def test_changelog_pagination_limit(self):
         """Should respect limit parameter."""
-        response = client.get("/changelog?limit=2")
-        data = response.json()
+        data = asyncio.run(get_changelog(limit=2, offset=0))
 
         assert len(data["entries"]) <= 2
 
-    def test_changelog_pagination_offset(self, client):
+    def test_changelog_pagination_offset(self):
         """Should respect offset parameter."""
-        response1 = client.get("/changelog?limit=2&offset=0")
-        response2 = client.get("/changelog?limit=2&offset=2")
-
-        data1 = response1.json()
-        data2 = response2.json()
+        data1 = asyncio.run(get_changelog(limit=2, offset=0))
+        data2 = asyncio.run(get_changelog(limit=2, offset=2))
 
         # Should be different entries (if enough exist)
         if data1["total"] > 2:
@@ -196,40 +252,31 @@ class TestContact:
         response = client.get("/contact")
         assert response.status_code == 200
 
-        data = response.json()
+        data = _json(response)
         assert "email" in data
         assert "support_email" in data
         assert "address" in data
         assert "social" in data
         assert "form_fields" in data
 
-    def test_address_structure(self, client):
+    def test_address_structure(self, contact_data):
         """Address should have proper structure."""
-        response = client.get("/contact")
-        data = response.json()
-
-        address = data["address"]
+        address = contact_data["address"]
         assert "company" in address
         assert "city" in address
         assert "country" in address
 
-    def test_form_fields_structure(self, client):
+    def test_form_fields_structure(self, contact_data):
         """Form fields should have proper structure."""
-        response = client.get("/contact")
-        data = response.json()
-
-        for field in data["form_fields"]:
+        for field in contact_data["form_fields"]:
             assert "name" in field
             assert "label" in field
             assert "type" in field
             assert "required" in field
 
-    def test_social_links(self, client):
+    def test_social_links(self, contact_data):
         """Should have social media links."""
-        response = client.get("/contact")
-        data = response.json()
-
-        social = data["social"]
+        social = contact_data["social"]
         assert len(social) > 0
 
 
@@ -241,45 +288,37 @@ class TestHelpCenter:
         response = client.get("/help")
         assert response.status_code == 200
 
-        data = response.json()
+        data = _json(response)
         assert "faqs" in data
         assert "categories" in data
         assert "total" in data
 
-    def test_faq_structure(self, client):
+    def test_faq_structure(self, help_data):
         """FAQs should have proper structure."""
-        response = client.get("/help")
-        data = response.json()
-
-        for faq in data["faqs"]:
+        for faq in help_data["faqs"]:
             assert "id" in faq
             assert "question" in faq
             assert "answer" in faq
             assert "category" in faq
 
-    def test_category_filter(self, client):
+    def test_category_filter(self):
         """Should filter by category."""
-        response = client.get("/help?category=billing")
-        data = response.json()
+        data = asyncio.run(get_help_center(category="billing", search=None))
 
         for faq in data["faqs"]:
             assert faq["category"] == "billing"
 
-    def test_search_filter(self, client):
+    def test_search_filter(self):
         """Should filter by search term."""
-        response = client.get("/help?search=privacy")
-        data = response.json()
+        data = asyncio.run(get_help_center(category=None, search="privacy"))
 
         # All results should contain "privacy"
         for faq in data["faqs"]:
             assert "privacy" in faq["question"].lower() or "privacy" in faq["answer"].lower()
 
-    def test_categories_structure(self, client):
+    def test_categories_structure(self, help_data):
         """Categories should have proper structure."""
-        response = client.get("/help")
-        data = response.json()
-
-        for category in data["categories"]:
+        for category in help_data["categories"]:
             assert "id" in category
             assert "name" in category
             assert "icon" in category
@@ -293,45 +332,33 @@ class TestSystemStatus:
         response = client.get("/status")
         assert response.status_code == 200
 
-        data = response.json()
+        data = _json(response)
         assert "status" in data
         assert "components" in data
         assert "incidents" in data
         assert "last_updated" in data
 
-    def test_component_structure(self, client):
+    def test_component_structure(self, status_data):
         """Components should have proper structure."""
-        response = client.get("/status")
-        data = response.json()
-
-        for component in data["components"]:
+        for component in status_data["components"]:
             assert "name" in component
             assert "status" in component
             assert "uptime_percent" in component
 
-    def test_overall_status_values(self, client):
+    def test_overall_status_values(self, status_data):
         """Overall status should be valid value."""
-        response = client.get("/status")
-        data = response.json()
-
         valid_statuses = ["operational", "degraded", "outage", "maintenance"]
-        assert data["status"] in valid_statuses
+        assert status_data["status"] in valid_statuses
 
-    def test_component_status_values(self, client):
+    def test_component_status_values(self, status_data):
         """Component status should be valid value."""
-        response = client.get("/status")
-        data = response.json()
-
         valid_statuses = ["operational", "degraded", "outage", "maintenance"]
-        for component in data["components"]:
+        for component in status_data["components"]:
             assert component["status"] in valid_statuses
 
-    def test_incidents_structure(self, client):
+    def test_incidents_structure(self, status_data):
         """Incidents should have proper structure."""
-        response = client.get("/status")
-        data = response.json()
-
-        for incident in data["incidents"]:
+        for incident in status_data["incidents"]:
             assert "id" in incident
             assert "title" in incident
             assert "status" in incident
@@ -345,18 +372,15 @@ class TestBlog:
         response = client.get("/blog")
         assert response.status_code == 200
 
-        data = response.json()
+        data = _json(response)
         assert "posts" in data
         assert "total" in data
         assert "has_more" in data
         assert "tags" in data
 
-    def test_blog_post_structure(self, client):
+    def test_blog_post_structure(self, blog_data):
         """Blog posts should have proper structure."""
-        response = client.get("/blog")
-        data = response.json()
-
-        for post in data["posts"]:
+        for post in blog_data["posts"]:
             assert "id" in post
             assert "slug" in post
             assert "title" in post
@@ -366,26 +390,27 @@ class TestBlog:
             assert "tags" in post
             assert "read_time_minutes" in post
 
-    def test_blog_tag_filter(self, client):
+    def test_blog_tag_filter(self):
         """Should filter by tag."""
-        response = client.get("/blog?tag=privacy")
-        data = response.json()
+        data = asyncio.run(
+            get_blog_posts(search=None, tag="privacy", limit=10, offset=0)
+        )
 
         for post in data["posts"]:
             assert "privacy" in post["tags"]
 
-    def test_blog_search(self, client):
+    def test_blog_search(self):
         """Should search blog posts."""
-        response = client.get("/blog?search=gateway")
-        data = response.json()
+        data = asyncio.run(
+            get_blog_posts(search="gateway", tag=None, limit=10, offset=0)
+        )
 
         for post in data["posts"]:
             assert "gateway" in post["title"].lower() or "gateway" in post["excerpt"].lower()
 
-    def test_blog_pagination(self, client):
+    def test_blog_pagination(self):
         """Should paginate blog posts."""
-        response = client.get("/blog?limit=2")
-        data = response.json()
+        data = asyncio.run(get_blog_posts(search=None, tag=None, limit=2, offset=0))
 
         assert len(data["posts"]) <= 2
 
@@ -394,7 +419,7 @@ class TestBlog:
         response = client.get("/blog/introducing-ai-orchestra-gateway")
         assert response.status_code == 200
 
-        data = response.json()
+        data = _json(response)
         assert "title" in data
         assert "content" in data
         assert "author" in data
@@ -408,20 +433,14 @@ class TestBlog:
 class TestAllEndpoints:
     """General tests for all endpoints."""
 
-    @pytest.mark.parametrize("endpoint", [
-        "/documentation",
-        "/developers",
-        "/changelog",
-        "/contact",
-        "/help",
-        "/status",
-        "/blog",
-    ])
-    def test_endpoint_returns_json(self, client, endpoint):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_all_endpoints_return_json(self, aclient):
         """All endpoints should return valid JSON."""
-        response = client.get(endpoint)
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/json"
-        # Should not raise
-        data = response.json()
-        assert isinstance(data, dict)
+        responses = await asyncio.gather(*(aclient.get(e) for e in ENDPOINTS))
+
+        for endpoint, response in zip(ENDPOINTS, responses, strict=True):
+            assert response.status_code == 200, endpoint
+            assert response.headers["content-type"] == "application/json"
+            # Should not raise
+            data = _json(response)
+            assert isinstance(data, dict)
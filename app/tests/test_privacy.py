@@ -2,6 +2,7 @@
 Unit tests for DataPrivacyShield.
 """
 
+import pytest
 
 from app.services.privacy import DataPrivacyShield
 
@@ -244,6 +245,21 @@ class TestMixedPII:
         assert "<PHONE_REMOVED>" in sanitized
         assert "<IBAN_REMOVED>" in sanitized
 
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Contact user@example.com or call +49 123 456789",
+            "Send invoice to user@test.com, IBAN DE12345678901234567890",
+            "IBAN: DE89 3704 0044 0532 0130 00",
+            "Email:  user@test.com  Phone: +49 123 456789",
+            "This is a normal text without PII",
+            "DEBUG: 42 requests, 0 errors",
+        ],
+    )
+    def test_redact_matches_sanitize(self, text):
+        """redact() should produce the same text as sanitize()."""
+        assert DataPrivacyShield.redact(text) == DataPrivacyShield.sanitize(text)[0]
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
@@ -272,6 +288,17 @@ class TestEdgeCases:
         assert found is False
         assert sanitized is None
 
+    def test_redact_fails_open(self, monkeypatch):
+        """Test redact returns the original text if a pattern raises."""
+        class BrokenPattern:
+            def sub(self, repl, text):
+                raise RuntimeError("boom")
+
+        monkeypatch.setattr(DataPrivacyShield, "EMAIL_PATTERN", BrokenPattern())
+        text = "Contact user@example.com"
+
+        assert DataPrivacyShield.redact(text) == text
+
     def test_only_pii(self):
         """Test text containing only PII."""
         text = "user@example.com"